@@ -24,12 +24,21 @@ SOFTWARE.
 from typing import NamedTuple, Literal, Optional
 
 from .authorization import AccessToken
+from .cache import ResponseCache, CacheStatistics
 from .category import Category
 from .channel import Channel
 from .client import Client, UserClient
+from .dispatcher import EventDispatcher, QueueDispatcher, DispatcherStatistics
+from .enums import MessagePriority
 from .error import *
 from .flags import UserPermission
+from .http import RateLimiter
+from .lite import LiteMessage, LiteDonation, LiteSubscription
 from .message import Donation, Profile, Message
+from .pool import ConnectionPool, PoolStatistics
+from .send_queue import SendQueue
+from .sharding import ShardManager, ShardInfo
+from .token_refresh import TokenStore, TokenRefreshScheduler
 
 
 __title__ = "chzzkpy"
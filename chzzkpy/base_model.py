@@ -23,16 +23,25 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+from collections import deque
 from typing import Generic, Optional, TypeVar, TYPE_CHECKING
 from pydantic import BaseModel, ConfigDict, Extra, PrivateAttr
 from pydantic.alias_generators import to_camel
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Coroutine, Optional
+    from typing import Any, AsyncIterator, Callable, Coroutine, Optional
 
 T = TypeVar("T")
 
 
+def _check_prefetch(prefetch: int) -> None:
+    # A queue without the bound fetches all pages ahead.
+    if prefetch < 1:
+        raise ValueError("prefetch must be greater than 0.")
+
+
 class ChzzkModel(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel, frozen=True, extra=Extra.allow  # prevent exception.
@@ -70,9 +79,8 @@ class SearchResult(ChzzkModel, Generic[T]):
         if self._next_method is None:
             return None
 
-        next_method_arguments = self._next_method_arguments or tuple()
-        next_method_key_argument = self._next_method_key_argument or dict()
-        next_method_arguments += args
+        next_method_arguments = (self._next_method_arguments or tuple()) + args
+        next_method_key_argument = dict(self._next_method_key_argument or dict())
         next_method_key_argument.update(kwargs)
 
         result = await self._next_method(
@@ -84,6 +92,13 @@ class SearchResult(ChzzkModel, Generic[T]):
         data._next_method_key_argument = self._next_method_key_argument
         return data
 
+    @property
+    def has_next(self) -> bool:
+        """Indicates if the next page exists."""
+        if self._page is None or self._next_method is None:
+            return False
+        return self._page.get("next") is not None
+
     async def next(self) -> Optional[SearchResult]:
         if self._page is None or self._next_method is None:
             raise RuntimeError(f"This search result has only one result.")
@@ -91,6 +106,98 @@ class SearchResult(ChzzkModel, Generic[T]):
         result = await self._next(next=next_id)
         return result
 
+    async def pages(
+        self, prefetch: int = 1, max_pages: Optional[int] = None
+    ) -> AsyncIterator[SearchResult[T]]:
+        """Iterate pages from this page.
+        The next pages are fetched in background while the current page is consumed.
+
+        Parameters
+        ----------
+        prefetch : int
+            The maximum number of pages fetched ahead (at least 1), by default 1
+        max_pages : Optional[int]
+            The maximum number of pages to iterate. By default, iterate to the last page.
+
+        Example
+        -------
+        >>> followers = await user_client.get_followers()
+        >>> async for page in followers.pages(prefetch=2):
+        ...     print(len(page))
+        """
+        _check_prefetch(prefetch)
+
+        # The next page can be fetched after the previous page received. (cursor-based page)
+        # A slot is taken before fetching a page, and released when the page is consumed.
+        queue: asyncio.Queue[SearchResult[T] | BaseException | None] = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch)
+
+        async def producer():
+            page, count = self, 1
+            try:
+                while page.has_next and (max_pages is None or count < max_pages):
+                    await slots.acquire()
+                    page = await page.next()
+                    queue.put_nowait(page)
+                    count += 1
+            except Exception as exc:
+                queue.put_nowait(exc)
+            queue.put_nowait(None)
+
+        task = asyncio.get_running_loop().create_task(producer())
+        try:
+            yield self
+            while (page := await queue.get()) is not None:
+                if isinstance(page, BaseException):
+                    raise page
+                slots.release()
+                yield page
+        finally:
+            task.cancel()
+
+    async def items(
+        self,
+        prefetch: int = 1,
+        limit: Optional[int] = None,
+        stop: Optional[Callable[[T], bool]] = None,
+    ) -> AsyncIterator[T]:
+        """Iterate items from this page to the last page.
+        The next pages are fetched in background while the current page is consumed.
+
+        Parameters
+        ----------
+        prefetch : int
+            The maximum number of pages fetched ahead (at least 1), by default 1
+        limit : Optional[int]
+            The maximum number of items to iterate.
+        stop : Optional[Callable[[T], bool]]
+            A predicate to stop iterating. The item satisfying the predicate isn't yielded.
+
+        Example
+        -------
+        >>> followers = await user_client.get_followers()
+        >>> async for follower in followers.items(limit=1000):
+        ...     print(follower.name)
+        """
+        _check_prefetch(prefetch)
+
+        count = 0
+        pages = self.pages(prefetch=prefetch)
+        try:
+            async for page in pages:
+                for item in page.data:
+                    if (limit is not None and count >= limit) or (
+                        stop is not None and stop(item)
+                    ):
+                        return
+                    yield item
+                    count += 1
+        finally:
+            await pages.aclose()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.items()
+
     def __getitem__(self, index):
         if isinstance(index, (slice, int)):
             return self.data[index]
@@ -104,9 +211,10 @@ class ChannelSearchResult(SearchResult, Generic[T]):
     total_count: int
     total_pages: int
 
-    def __init__(self, *args, **kwargs):
-        print(kwargs)
-        super().__init__(*args, **kwargs)
+    @property
+    def has_next(self) -> bool:
+        """Indicates if the next page exists."""
+        return self._next_method is not None and self._page + 1 < self.total_pages
 
     async def next(self) -> Optional[ChannelSearchResult]:
         if self._page + 1 >= self.total_pages:
@@ -121,3 +229,41 @@ class ChannelSearchResult(SearchResult, Generic[T]):
         page_id = self._page - 1
         result = await self._next(page=page_id)
         return result
+
+    async def pages(
+        self, prefetch: int = 1, max_pages: Optional[int] = None
+    ) -> AsyncIterator[ChannelSearchResult[T]]:
+        """Iterate pages from this page.
+        The next pages are fetched concurrently by page number while the current page is consumed.
+
+        Parameters
+        ----------
+        prefetch : int
+            The maximum number of pages fetched ahead (at least 1), by default 1
+        max_pages : Optional[int]
+            The maximum number of pages to iterate. By default, iterate to the last page.
+        """
+        _check_prefetch(prefetch)
+
+        last_page = (
+            self.total_pages if self._next_method is not None else self._page + 1
+        )
+        if max_pages is not None:
+            last_page = min(last_page, self._page + max_pages)
+        page_ids = iter(range(self._page + 1, last_page))
+
+        loop = asyncio.get_running_loop()
+        tasks: deque[asyncio.Task] = deque()
+        try:
+            for page_id in itertools.islice(page_ids, prefetch):
+                tasks.append(loop.create_task(self._next(page=page_id)))
+
+            yield self
+            while len(tasks) > 0:
+                page = await tasks.popleft()
+                for page_id in itertools.islice(page_ids, 1):
+                    tasks.append(loop.create_task(self._next(page=page_id)))
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
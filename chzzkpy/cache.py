@@ -0,0 +1,253 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import aiohttp
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, Optional
+
+from ahttp_client import Session
+from ahttp_client.request import RequestCore
+
+_log = logging.getLogger(__name__)
+
+
+def cache_ttl(seconds: float):
+    """A decorator that sets the default time-to-live of cached responses for the endpoint.
+    Only responses of GET requests are cached, when the session has a :class:`ResponseCache`.
+
+    Parameters
+    ----------
+    seconds : float
+        The seconds to keep a cached response.
+    """
+
+    def decorator(func):
+        func.__cache_ttl__ = seconds
+        return func
+
+    return decorator
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Retrieve the exception to prevent warning when no request is waiting for the task.
+    if not task.cancelled():
+        task.exception()
+
+
+class CacheStatistics(NamedTuple):
+    """Represents a snapshot of the response cache."""
+
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
+    max_size: int
+
+
+class ResponseCache:
+    """Represents a LRU cache of HTTP responses with time-to-live per endpoint.
+
+    Concurrent identical requests are coalesced into one request. (single-flight)
+    The cache can be shared by :class:`Client<chzzkpy.client.Client>` and
+    :class:`Client<chzzkpy.unofficial.client.Client>`.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached responses, by default 1024
+    ttl : Optional[dict[str, float]]
+        The time-to-live overriding the default of endpoints.
+        The key is the method name of endpoint. (ex. `get_channel`, `live_status`)
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[dict[str, float]] = None):
+        self.max_size = max_size
+        self.ttl: dict[str, float] = ttl or dict()
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task] = dict()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_ttl(self, endpoint: str, seconds: float) -> None:
+        """Override the time-to-live of the endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            The method name of endpoint. (ex. `get_channel`, `live_status`)
+        seconds : float
+            The seconds to keep a cached response. If the value is 0, the endpoint isn't cached.
+        """
+        self.ttl[endpoint] = seconds
+
+    def get_ttl(
+        self, endpoint: str, default: Optional[float] = None
+    ) -> Optional[float]:
+        return self.ttl.get(endpoint, default)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Returns the cached value of the key, or fetches a new value.
+
+        Parameters
+        ----------
+        key : Hashable
+            A key of the value.
+        ttl : float
+            The seconds to keep the fetched value.
+        fetch : Callable[[], Awaitable[Any]]
+            A function to fetch a new value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        # The fetch runs in its own task, so cancelling the first caller
+        # doesn't cancel the coalesced callers waiting for the same response.
+        self.misses += 1
+        task = asyncio.get_running_loop().create_task(self._fetch(key, ttl, fetch))
+        task.add_done_callback(_retrieve_exception)
+        self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            value = await fetch()
+            self._store(key, ttl, value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: Hashable, ttl: float, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: Optional[str] = None) -> int:
+        """Remove the cached responses.
+
+        Parameters
+        ----------
+        endpoint : Optional[str]
+            The method name of endpoint. (ex. `get_channel`, `live_status`)
+            If the value is None, all cached responses are removed.
+
+        Returns
+        -------
+        int
+            The number of removed responses.
+        """
+        if endpoint is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+        keys = [key for key in self._entries.keys() if key[0] == endpoint]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> CacheStatistics:
+        """Returns a snapshot of the cache."""
+        return CacheStatistics(
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+
+class CachedSession(Session):
+    """Represents a session returning cached responses for the endpoints decorated with :func:`cache_ttl`."""
+
+    response_cache: Optional[ResponseCache] = None
+
+    @staticmethod
+    def _cache_key(request: RequestCore, path: str) -> Hashable:
+        return (
+            request.func.__name__,
+            request.method.upper(),
+            path,
+            tuple(sorted((key, str(value)) for key, value in request.params.items())),
+            tuple(sorted((key, str(value)) for key, value in request.headers.items())),
+        )
+
+    async def _make_request(self, request: RequestCore, path: str, **kwargs):
+        if self._has_overridden_method(self.before_request):
+            request, path = await self.before_request(request, path)
+
+        endpoint = request.func.__name__
+        ttl = getattr(request.func, "__cache_ttl__", None)
+        if self.response_cache is not None:
+            ttl = self.response_cache.get_ttl(endpoint, ttl)
+
+        if self.response_cache is None or not ttl or request.method.upper() != "GET":
+            return await self._send_request(request, path)
+
+        return await self.response_cache.get_or_fetch(
+            self._cache_key(request, path),
+            ttl,
+            lambda: self._send_request(request, path),
+        )
+
+    async def _send_request(self, request: RequestCore, path: str):
+        request_kwargs = request.get_request_kwargs()
+        _log.debug("Request Called: [%s] %s" % (request.method, path))
+        response = await self.session.request(request.method, path, **request_kwargs)
+
+        if self._has_overridden_method(self.after_request):
+            response = await self.after_request(response)
+
+        # The body is read to share the response between cached requests.
+        if isinstance(response, aiohttp.ClientResponse):
+            await response.read()
+        return response
@@ -23,8 +23,8 @@ SOFTWARE.
 
 from __future__ import annotations
 
-import asyncio
 import aiohttp
+import asyncio
 import datetime
 import logging
 
@@ -34,25 +34,40 @@ from yarl import URL
 
 from .authorization import AccessToken
 from .chat import ChatSetting
-from .error import ChatConnectFailed, ForbiddenException
-from .gateway import ChzzkGateway
-from .http import ChzzkOpenAPISession
+from .dispatcher import EventDispatcher
+from .enums import MessagePriority
+from .error import (
+    ChatConnectFailed,
+    ForbiddenException,
+    HTTPException,
+    TooManyRequestsException,
+)
+from .flags import UserPermission
+from .gateway import ChzzkGateway, GatewaySupervisor
+from .http import ChzzkOpenAPISession, RateLimiter
 from .live import BrodecastSetting, Live
 from .message import SentMessage
 from .oauth2 import ChzzkOAuth2Client
+from .pool import ConnectionPool
+from .send_queue import SendQueue
+from .serializer import get_json_backend
 from .state import ConnectionState
+from .token_refresh import TokenRefreshScheduler, TokenStore
+from .waiter import WaiterRegistry
 
 
 if TYPE_CHECKING:
     from aiohttp.web import Response as webResponse
-    from typing import Self, Literal, Optional, Callable, Coroutine
+    from types import TracebackType
+    from typing import Self, Literal, Optional, Awaitable, Callable, Coroutine, Hashable
 
     from .base_model import SearchResult, ChannelSearchResult
+    from .cache import ResponseCache
     from .channel import Channel, ChannelPermission, FollowerInfo, SubscriberInfo
     from .category import Category
     from .enums import FollowingPeriod
-    from .flags import UserPermission
     from .restriction import RestrictUser
+    from .serializer import JSONBackend
 
 
 class _LoopSentinel:
@@ -68,13 +83,36 @@ class _LoopSentinel:
 
 _log = logging.getLogger(__name__)
 
+# The maximum number of channel IDs in a request of get_channel.
+_MAX_CHANNEL_IDS_PER_REQUEST = 20
+
+# The exceptions to retry a request of event subscription.
+# HTTPException is retried only for the server errors. (read `_is_retryable_subscription_error`)
+_RETRYABLE_SUBSCRIPTION_EXCEPTIONS = (
+    TooManyRequestsException,
+    HTTPException,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+)
+
+
+def _is_retryable_subscription_error(exception: BaseException) -> bool:
+    # The client errors (4xx) such as an invalid session key are not recovered by retrying.
+    if isinstance(exception, HTTPException):
+        return exception.status >= 500
+    return isinstance(exception, _RETRYABLE_SUBSCRIPTION_EXCEPTIONS)
+
 
 class BaseEventManager:
-    def __init__(self, loop: asyncio.AbstractEventLoop):
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        dispatcher: Optional[EventDispatcher] = None,
+    ):
         self.loop = loop
-        self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = (
-            dict()
-        )
+        self.dispatcher = dispatcher or EventDispatcher()
+        self._waiters = WaiterRegistry()
+        self._waiter_added = asyncio.Event()
         self._extra_event: dict[str, list[Callable[..., Coroutine[Any, Any, Any]]]] = (
             dict()
         )
@@ -84,6 +122,7 @@ class BaseEventManager:
         event: str,
         check: Optional[Callable[..., bool]] = None,
         timeout: Optional[float] = None,
+        key: Optional[Hashable] = None,
     ):
         """Waits for a WebSocket event to be dispatched.
 
@@ -98,22 +137,69 @@ class BaseEventManager:
         timeout : Optional[float]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        key : Optional[Hashable]
+            A key to wait for, such as a channel id.
+            Only events with the same key (read :meth:`set_waiter_key`) are checked.
 
         """
         future = self.loop.create_future()
+        self._waiters.add(event, future, check, key=key)
+        self._waiter_added.set()
+        return asyncio.wait_for(future, timeout=timeout)
+
+    def set_waiter_key(self, event: str, key_function: Callable[..., Hashable]) -> None:
+        """Registers a function to get the key of the event for key-indexed :meth:`wait_for`.
 
-        if check is None:
+        Parameters
+        ----------
+        event : str
+            The event name.
+        key_function : Callable[..., Hashable]
+            A function that receives the arguments of the event and returns the key.
 
-            def _check(*_):
-                return True
+        Example
+        -------
+        >>> client.set_waiter_key("chat", lambda message: message.channel)
+        >>> message = await client.wait_for("chat", key="channel_id")
+        """
+        self._waiters.set_key(event, key_function)
 
-            check = _check
-        event_name = event.lower()
+    def waiter_count(self, event: Optional[str] = None) -> int:
+        """Returns the number of pending :meth:`wait_for` calls.
 
-        if event_name not in self._listeners.keys():
-            self._listeners[event_name] = list()
-        self._listeners[event_name].append((future, check))
-        return asyncio.wait_for(future, timeout=timeout)
+        Parameters
+        ----------
+        event : Optional[str]
+            The event name. If the value is None, returns the number of all pending calls.
+        """
+        return self._waiters.count(event)
+
+    @property
+    def _backpressure(self) -> Optional[Callable[[], Awaitable[None]]]:
+        # A function passed to the gateway to hold the received events until they can be dispatched.
+        # It is None when the dispatcher can't apply backpressure, so that the events are dispatched directly.
+        if not self.dispatcher.has_backpressure:
+            return None
+        return self.wait_until_dispatchable
+
+    async def wait_until_dispatchable(self) -> None:
+        """Waits until the received events can be dispatched.
+
+        It returns when the dispatcher is writable, or when :meth:`wait_for` is pending.
+        The events are not held for pending :meth:`wait_for` calls,
+        because they may be awaited by the saturated event handlers.
+        """
+        while not self.dispatcher.is_writable and self._waiters.count() == 0:
+            self._waiter_added.clear()
+            tasks = [
+                self.loop.create_task(self.dispatcher.wait_until_writable()),
+                self.loop.create_task(self._waiter_added.wait()),
+            ]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in tasks:
+                    task.cancel()
 
     def event(
         self, coro: Callable[..., Coroutine[Any, Any, Any]]
@@ -138,47 +224,44 @@ class BaseEventManager:
             raise TypeError("function must be a coroutine.")
 
         event_name = coro.__name__
-        if event_name not in self._listeners.keys():
+        if event_name not in self._extra_event.keys():
             self._extra_event[event_name] = list()
         self._extra_event[event_name].append(coro)
         return coro
 
+    def has_listener(self, event: str) -> bool:
+        """Returns whether the event has an event handler or a waiting :meth:`wait_for`.
+
+        Parameters
+        ----------
+        event : str
+            The event name without `on_` prefix.
+        """
+        if len(self._extra_event.get("on_" + event, [])) > 0:
+            return True
+        return self._waiters.count(event) > 0
+
     def dispatch(self, event: str, *args: Any, **kwargs) -> None:
         _log.debug("Dispatching event %s", event)
         method = "on_" + event
 
         # wait-for listeners
-        if event in self._listeners.keys():
-            listeners = self._listeners[event]
-            _new_listeners = []
-
-            for index, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    continue
-
-                try:
-                    result = condition(*args, **kwargs)
-                except Exception as e:
-                    future.set_exception(e)
-                    continue
-                if result:
-                    match len(args):
-                        case 0:
-                            future.set_result(None)
-                        case 1:
-                            future.set_result(args[0])
-                        case _:
-                            future.set_result(args)
-
-                _new_listeners.append((future, condition))
-            self._listeners[event] = _new_listeners
+        self._waiters.resolve(event, *args, **kwargs)
 
         # event-listener
         if method not in self._extra_event.keys():
             return
 
         for coroutine_function in self._extra_event[method]:
-            self._schedule_event(coroutine_function, method, *args, **kwargs)
+            self.dispatcher.schedule(
+                self.loop,
+                method,
+                self._run_event,
+                coroutine_function,
+                method,
+                *args,
+                **kwargs,
+            )
 
     async def _run_event(
         self,
@@ -198,17 +281,6 @@ class BaseEventManager:
             except asyncio.CancelledError:
                 pass
 
-    def _schedule_event(
-        self,
-        coro: Callable[..., Coroutine[Any, Any, Any]],
-        event_name: str,
-        *args: Any,
-        **kwargs: Any,
-    ) -> asyncio.Task:
-        wrapped = self._run_event(coro, event_name, *args, **kwargs)
-        # Schedules the task
-        return self.loop.create_task(wrapped, name=f"chzzk.py: {event_name}")
-
 
 class Client(BaseEventManager):
     """Represents a client to connect Chzzk (Naver Live Streaming)."""
@@ -218,25 +290,61 @@ class Client(BaseEventManager):
         client_id: str,
         client_secret: str,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        json_backend: Optional[str | JSONBackend] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_store: Optional[TokenStore] = None,
+        auto_refresh: bool = True,
+        lite_messages: bool = False,
     ):
-        super().__init__(loop)
+        super().__init__(loop, dispatcher=dispatcher)
         self.loop = loop or _LoopSentinel()
         self.client_id = client_id
         self.client_secret = client_secret
+        self._closed = False
 
+        self.connection_pool = connection_pool or ConnectionPool()
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.json_backend = get_json_backend(json_backend)
         self.http: Optional[ChzzkOpenAPISession] = None
         self.user_client: list[UserClient] = []
 
-        handler = {"connect": lambda _: self._gateway_ready.set()}
+        # The user clients are indexed by channel ID and access token.
+        self._user_client_by_channel_id: dict[str, UserClient] = dict()
+        self._user_client_by_token: dict[str, UserClient] = dict()
+
+        # The access tokens of user clients are refreshed before expiry.
+        self.token_store = token_store or TokenStore()
+        self.token_refresher = TokenRefreshScheduler(self)
+        self.auto_refresh = auto_refresh
+
+        # The messages are dispatched as LiteMessage, LiteDonation and LiteSubscription.
+        self.lite_messages = lite_messages
+
+        handler = {"connect": self.__on_connected}
         self._connection = ConnectionState(
             dispatch=self.dispatch,
             handler=handler,
             http=self.http,
             variable_access_token=self.__variable_access_token,
+            json_backend=self.json_backend,
+            has_listener=self.has_listener,
+            lite_messages=self.lite_messages,
         )
 
         self._gateway: dict[str, ChzzkGateway] = dict()
         self._gateway_ready = asyncio.Event()
+        self._session_key: Optional[str] = None
+
+        for event in ("chat", "donation", "subscription"):
+            self.set_waiter_key(event, lambda message: message.channel)
+
+    def __on_connected(self, session_key: str):
+        self._session_key = session_key
+        self._gateway_ready.set()
 
     def __variable_access_token(self, channel_id: str) -> Optional[AccessToken]:
         user_client = self.get_user_client_cached(channel_id)
@@ -248,6 +356,15 @@ class Client(BaseEventManager):
         await self._async_setup_hook()
         return self
 
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if not self.is_closed:
+            await self.close()
+
     async def _async_setup_hook(self) -> None:
         if isinstance(self.loop, _LoopSentinel):
             self.loop = asyncio.get_running_loop()
@@ -257,10 +374,19 @@ class Client(BaseEventManager):
                 "This loop should be defined in an asynchronous context."
             )
 
+        self._closed = False
         self.http = ChzzkOpenAPISession(
-            loop=self.loop, client_id=self.client_id, client_secret=self.client_secret
+            loop=self.loop,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            connection_pool=self.connection_pool,
+            response_cache=self.response_cache,
+            rate_limiter=self.rate_limiter,
         )
         self._connection.http = self.http
+        for user_client in self.user_client:
+            user_client.http = self.http
+            user_client._connection.http = self.http
 
     @staticmethod
     def initial_async_setup(func):
@@ -334,8 +460,7 @@ class Client(BaseEventManager):
             await user_cls.fetch_self()
         except ForbiddenException:
             pass
-        self.user_client.append(user_cls)
-        return user_cls
+        return self._add_user_client(user_cls)
 
     @initial_async_setup
     async def login(
@@ -418,8 +543,7 @@ class Client(BaseEventManager):
             await user_cls.fetch_self()
         except ForbiddenException:
             pass
-        self.user_client.append(user_cls)
-        return user_cls
+        return self._add_user_client(user_cls)
 
     @initial_async_setup
     async def get_user_client(self, access_token: AccessToken) -> UserClient:
@@ -429,14 +553,55 @@ class Client(BaseEventManager):
         ----------
         access_token : AccessToken
             A prepared instance of access token.
+            If the access token is already used by a :class:`UserClient`, the user client is returned.
         """
+        user_cls = self._user_client_by_token.get(access_token.access_token)
+        if user_cls is not None:
+            return user_cls
+
         user_cls = UserClient(self, access_token)
         try:
             await user_cls.fetch_self()
         except ForbiddenException:
             pass
-        self.user_client.append(user_cls)
-        return user_cls
+        return self._add_user_client(user_cls)
+
+    def _add_user_client(self, user_client: UserClient) -> UserClient:
+        # The channel already has a user client, so a new access token is swapped into it.
+        existing_user_client = self._user_client_by_channel_id.get(
+            user_client.channel_id
+        )
+        if existing_user_client is not None:
+            existing_user_client._set_access_token(user_client.access_token)
+            return existing_user_client
+
+        self.user_client.append(user_client)
+        self._user_client_by_token[user_client.access_token.access_token] = user_client
+        if user_client.channel_id is not None:
+            self._user_client_by_channel_id[user_client.channel_id] = user_client
+
+        if self.auto_refresh:
+            self.token_refresher.add(user_client)
+        return user_client
+
+    def _update_user_client_index(
+        self,
+        user_client: UserClient,
+        previous_channel_id: Optional[str],
+        previous_access_token: AccessToken,
+    ) -> None:
+        previous_token = previous_access_token.access_token
+        if self._user_client_by_token.get(previous_token) is not user_client:
+            # The user client isn't registered in the client.
+            return
+
+        self._user_client_by_token.pop(previous_token)
+        self._user_client_by_token[user_client.access_token.access_token] = user_client
+
+        if self._user_client_by_channel_id.get(previous_channel_id) is user_client:
+            self._user_client_by_channel_id.pop(previous_channel_id)
+        if user_client.channel_id is not None:
+            self._user_client_by_channel_id[user_client.channel_id] = user_client
 
     def get_user_client_cached(self, channel_id: str) -> Optional[UserClient]:
         """Get :class:`UserClient` as channel_id.
@@ -450,23 +615,46 @@ class Client(BaseEventManager):
         channel_id : str
             A channel ID to get :class:`UserClient`
         """
-        for user_client in self.user_client:
-            if user_client.channel_id != channel_id:
-                continue
-            return user_client
-        return
+        return self._user_client_by_channel_id.get(channel_id)
 
     @initial_async_setup
-    async def get_channel(self, channel_ids: list[str]) -> list[Channel]:
+    async def get_channel(
+        self, channel_ids: list[str], max_concurrency: int = 4
+    ) -> list[Channel]:
         """Get channel information.
+        Duplicated IDs are looked up once, and the IDs are split into requests of 20 IDs.
 
         Parameters
         ----------
         channel_ids : list[str]
             An unique ID of the channel to lookup.
+        max_concurrency : int
+            The maximum number of concurrent requests, by default 4
+
+        Returns
+        -------
+        list[Channel]
+            Returns the channels in order of `channel_ids`. Channels not found are omitted.
         """
-        result = await self.http.get_channel(channel_ids=",".join(channel_ids))
-        return result.content.data
+        unique_channel_ids = list(dict.fromkeys(channel_ids))
+        chunks = [
+            unique_channel_ids[index : index + _MAX_CHANNEL_IDS_PER_REQUEST]
+            for index in range(0, len(unique_channel_ids), _MAX_CHANNEL_IDS_PER_REQUEST)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_chunk(chunk: list[str]) -> list[Channel]:
+            async with semaphore:
+                result = await self.http.get_channel(channel_ids=",".join(chunk))
+            return result.content.data
+
+        results = await asyncio.gather(*[fetch_chunk(chunk) for chunk in chunks])
+        channels = {channel.id: channel for result in results for channel in result}
+        return [
+            channels[channel_id]
+            for channel_id in unique_channel_ids
+            if channel_id in channels.keys()
+        ]
 
     @initial_async_setup
     async def get_category(
@@ -505,7 +693,9 @@ class Client(BaseEventManager):
         return
 
     @initial_async_setup
-    async def connect(self, addition_connect: bool = False) -> str:
+    async def connect(
+        self, addition_connect: bool = False, reconnect: bool = False
+    ) -> str:
         """Connect to session to handle donation or chatting
         A Client session can have more than one connection. (Maximum Connection: 10)
 
@@ -515,6 +705,10 @@ class Client(BaseEventManager):
             This parameter used for multiple connections, by default False
             If addition_connect is False, the connection is completed and a main task is blocked to wait for a response.
             However addition_connect is True, a task waiting for a response is processed in the background.
+        reconnect : Optional[bool]
+            Whether to reconnect when the connection is lost, by default False
+            After reconnecting, the subscriptions of user clients on the session are restored,
+            and `on_resumed` event is called with the downtime in seconds.
 
         Returns
         -------
@@ -537,20 +731,61 @@ class Client(BaseEventManager):
         if len(self._gateway.keys()) > 10:
             raise ChatConnectFailed.max_connection()
 
+        gateway_cls = await self._connect_gateway()
+        self._gateway[gateway_cls.session_id] = gateway_cls
+
+        task = gateway_cls._read_background_loop
+        if reconnect:
+            supervisor = GatewaySupervisor(
+                loop=self.loop,
+                connect=self._connect_gateway,
+                resume=self._resume_gateway,
+            )
+            task = supervisor.start(gateway_cls)
+
+        if not addition_connect:
+            await task
+        return gateway_cls.session_id
+
+    async def _connect_gateway(self) -> ChzzkGateway:
+        self._gateway_ready.clear()
         session_key = await self.http.generate_client_session()
         gateway_cls = await ChzzkGateway.connect(
             url=session_key.content.url,
             state=self._connection,
             loop=self.loop,
-            session=aiohttp.ClientSession(loop=self.loop),
+            session=self.connection_pool.session,
         )
-        task = gateway_cls.read_in_background()
-        await self._gateway_ready.wait()
-        self._gateway[gateway_cls.session_id] = gateway_cls
+        gateway_cls.read_in_background(self._backpressure)
+        await gateway_cls.wait_until_ready(self._gateway_ready)
+        gateway_cls.session_key = self._session_key
         self._gateway_ready.clear()
-        if not addition_connect:
-            await task
-        return gateway_cls.session_id
+        return gateway_cls
+
+    async def _resume_gateway(
+        self, previous: ChzzkGateway, gateway: ChzzkGateway, downtime: float
+    ) -> None:
+        # Keep the session ID returned by connect(), so that the resumed session
+        # can be disconnected with it.
+        for session_id, connected_gateway in self._gateway.items():
+            if connected_gateway is previous:
+                self._gateway[session_id] = gateway
+                break
+
+        previous_session_ids = (previous.session_id, previous.session_key)
+        user_clients = [
+            user_client
+            for user_client in self.user_client
+            if user_client._subscription_session_id in previous_session_ids
+        ]
+        failed = await self.restore_subscriptions(gateway.session_key, user_clients)
+        for user_client, exception in failed.items():
+            _log.warning(
+                "Failed to restore subscriptions of %s: %s",
+                user_client.channel_id,
+                exception,
+            )
+        self.dispatch("resumed", downtime)
 
     async def disconnect(self, session_id: Optional[str] = None):
         """Disconnect from session.
@@ -573,6 +808,124 @@ class Client(BaseEventManager):
             await gateway.disconnect()
         self._gateway = dict()
 
+    async def bulk_subscribe(
+        self,
+        subscriptions: dict[UserClient, UserPermission],
+        session_id: Optional[str] = None,
+    ) -> dict[UserClient, BaseException]:
+        """Subscribe to events of several user clients at once.
+        The subscription requests are sent concurrently within the limits of :attr:`rate_limiter`.
+
+        Parameters
+        ----------
+        subscriptions : dict[UserClient, UserPermission]
+            The events to subscribe for each user client.
+        session_id : Optional[str]
+            ID of the session to receive event, by default None
+            If the session ID is None, the session of each user client is used.
+
+        Returns
+        -------
+        dict[UserClient, BaseException]
+            Returns the exceptions of user clients that failed to subscribe.
+        """
+        return await self._bulk_subscription(
+            UserClient.subscribe, subscriptions, session_id
+        )
+
+    async def bulk_unsubscribe(
+        self,
+        subscriptions: dict[UserClient, UserPermission],
+        session_id: Optional[str] = None,
+    ) -> dict[UserClient, BaseException]:
+        """Unsubscribe to events of several user clients at once.
+        The unsubscription requests are sent concurrently within the limits of :attr:`rate_limiter`.
+
+        Parameters
+        ----------
+        subscriptions : dict[UserClient, UserPermission]
+            The events to unsubscribe for each user client.
+        session_id : Optional[str]
+            ID of the session to block event, by default None
+            If the session ID is None, the session of each user client is used.
+
+        Returns
+        -------
+        dict[UserClient, BaseException]
+            Returns the exceptions of user clients that failed to unsubscribe.
+        """
+        return await self._bulk_subscription(
+            UserClient.unsubscribe, subscriptions, session_id
+        )
+
+    async def restore_subscriptions(
+        self, session_id: str, user_clients: Optional[list[UserClient]] = None
+    ) -> dict[UserClient, BaseException]:
+        """Subscribe the events previously subscribed by user clients to the session again.
+        It is used to restore subscriptions after the session is reconnected.
+
+        Parameters
+        ----------
+        session_id : str
+            ID of the session to receive event.
+        user_clients : Optional[list[UserClient]]
+            The user clients to restore subscriptions, by default all user clients of the client.
+
+        Returns
+        -------
+        dict[UserClient, BaseException]
+            Returns the exceptions of user clients that failed to subscribe.
+        """
+        if user_clients is None:
+            user_clients = self.user_client
+
+        subscriptions = {
+            user_client: user_client.subscribed_permission
+            for user_client in user_clients
+            if user_client.subscribed_permission.value != 0
+        }
+        return await self.bulk_subscribe(subscriptions, session_id)
+
+    @staticmethod
+    async def _bulk_subscription(
+        method: Callable[..., Coroutine[Any, Any, None]],
+        subscriptions: dict[UserClient, UserPermission],
+        session_id: Optional[str] = None,
+    ) -> dict[UserClient, BaseException]:
+        user_clients = list(subscriptions.keys())
+        results = await asyncio.gather(
+            *[
+                method(user_client, subscriptions[user_client], session_id)
+                for user_client in user_clients
+            ],
+            return_exceptions=True,
+        )
+        return {
+            user_client: result
+            for user_client, result in zip(user_clients, results)
+            if isinstance(result, BaseException)
+        }
+
+    @property
+    def is_closed(self) -> bool:
+        """Indicates if the client is closed."""
+        return self._closed
+
+    async def close(self):
+        """Closes all gateways and the connection pool shared by the client and user clients."""
+        self._closed = True
+        await self.disconnect()
+        for user_client in self.user_client:
+            await user_client.disconnect()
+            await user_client.send_queue.close()
+        await self.token_refresher.close()
+
+        if self.http is not None and not self.http.closed:
+            await self.http.close()
+        await self.connection_pool.close()
+        await self.dispatcher.close()
+        return
+
 
 class UserClient:
     """Represents a user client to provide feature that requires user authentication."""
@@ -585,6 +938,7 @@ class UserClient:
 
         self.access_token = access_token
         self._token_generated_at = datetime.datetime.now()
+        self._refresh_lock = asyncio.Lock()
 
         # Resolved issue in https://github.com/gunyu1019/chzzkpy/issues/66
         if not isinstance(self.access_token, AccessToken):
@@ -599,6 +953,11 @@ class UserClient:
 
         self.channel_id: Optional[str] = None
         self.channel_name: Optional[str] = None
+        self._subscribed_permission = UserPermission()
+        self._subscription_session_id: Optional[str] = None
+
+        # The rate of queued messages follows the slow mode of chat setting.
+        self.send_queue = SendQueue(self.send_message)
 
         handler = {
             "connect": self.__on_connected,
@@ -609,6 +968,9 @@ class UserClient:
             handler=handler,
             http=self.http,
             access_token=self.access_token,
+            json_backend=self.parent_client.json_backend,
+            has_listener=self.parent_client.has_listener,
+            lite_messages=self.parent_client.lite_messages,
         )
 
     def __on_connected(self, session_id: str):
@@ -617,37 +979,81 @@ class UserClient:
         return
 
     def __on_channel_id_invoked(self, channel_id: str):
+        self._set_channel_id(channel_id)
+
+    def _set_channel_id(self, channel_id: str) -> None:
+        previous_channel_id = self.channel_id
         self.channel_id = channel_id
+        self.parent_client._update_user_client_index(
+            self, previous_channel_id, self.access_token
+        )
+
+    def _set_access_token(self, access_token: AccessToken) -> None:
+        previous_access_token = self.access_token
+        # The access token of user client and connection state are swapped at once.
+        self._connection.access_token = self.access_token = access_token
+        self._token_generated_at = datetime.datetime.now()
+        self.parent_client._update_user_client_index(
+            self, self.channel_id, previous_access_token
+        )
+
+        token_refresher = self.parent_client.token_refresher
+        if self in token_refresher:
+            token_refresher.add(self)
+
+    @property
+    def token_age(self) -> float:
+        """The elapsed seconds since the access token was generated."""
+        return (datetime.datetime.now() - self._token_generated_at).total_seconds()
 
     @property
     def is_expired(self) -> bool:
         """An access token for user expires after a certain amount of time.
         Returns status that an access token had been expired."""
-        return (
-            datetime.datetime.now() - self._token_generated_at
-        ).hours > self.access_token.expires_in
+        return self.token_age >= self.access_token.expires_in
 
     @staticmethod
     def refreshable(func):
         @wraps(func)
         async def wrapper(self: Self, *args, **kwargs):
-            remaining_expired_time = datetime.datetime.now() - self._token_generated_at
-            if remaining_expired_time.days > 0:
+            if self.is_expired:
                 await self.refresh()
             return await func(self, *args, **kwargs)
 
         return wrapper
 
+    def _with_access_token(
+        self, method: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        # The next pages of search result are requested with the current access token,
+        # because the access token can be refreshed in background while iterating pages.
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self.is_expired:
+                await self.refresh()
+            return await method(*args, token=self.access_token, **kwargs)
+
+        return wrapper
+
     async def refresh(self):
-        """Refresh the access token."""
-        refresh_token = await self.http.generate_access_token(
-            grant_type="refresh_token",
-            client_id=self.parent_client.client_id,
-            client_secret=self.parent_client.client_secret,
-            refresh_token=self.access_token.refresh_token,
-        )
-        self._connection.access_token = self.access_token = refresh_token.content
-        self._token_generated_at = datetime.datetime.now()
+        """Refresh the access token.
+        When the access token is refreshed by several tasks at once, it is refreshed only once.
+        The refreshed access token is saved to :attr:`Client.token_store`."""
+        previous_access_token = self.access_token
+        async with self._refresh_lock:
+            # The access token has been refreshed by another task while waiting.
+            if self.access_token is not previous_access_token:
+                return
+
+            refresh_token = await self.http.generate_access_token(
+                grant_type="refresh_token",
+                client_id=self.parent_client.client_id,
+                client_secret=self.parent_client.client_secret,
+                refresh_token=self.access_token.refresh_token,
+            )
+            access_token = refresh_token.content
+            self._set_access_token(access_token)
+
+        await self.parent_client.token_store.save(self, access_token)
         return
 
     async def revoke(self):
@@ -671,7 +1077,7 @@ class UserClient:
         """
         raw_user_self = await self.http.get_user_self(token=self.access_token)
         user_self = raw_user_self.content
-        self.channel_id = user_self.id
+        self._set_channel_id(user_self.id)
         self.channel_name = user_self.name
         return user_self
 
@@ -694,6 +1100,26 @@ class UserClient:
         message._state = self._connection
         return message
 
+    def queue_message(
+        self, content: str, priority: MessagePriority = MessagePriority.NORMAL
+    ) -> asyncio.Future[SentMessage]:
+        """Queue the message to send to channel at the rate allowed by chat setting.
+        This method required "채팅 메시지 전송" API Scope on the access token.
+
+        Parameters
+        ----------
+        content : str
+            A content of message.
+        priority : MessagePriority
+            The priority of message, by default MessagePriority.NORMAL
+
+        Returns
+        -------
+        asyncio.Future[SentMessage]
+            A future resolved with the sent message, when the message is accepted.
+        """
+        return self.send_queue.send(content, priority)
+
     @refreshable
     async def send_announcement(self, content: str):
         """Send the announcement to channel
@@ -720,7 +1146,12 @@ class UserClient:
         return
 
     @refreshable
-    async def connect(self, permission: UserPermission, addition_connect: bool = False):
+    async def connect(
+        self,
+        permission: UserPermission,
+        addition_connect: bool = False,
+        reconnect: bool = False,
+    ):
         """Connect to user session to handle donation or chatting
 
         Parameters
@@ -732,6 +1163,10 @@ class UserClient:
             This parameter used for multiple connections, by default False
             If addition_connect is False, the connection is completed and a main task is blocked to wait for a response.
             However addition_connect is True, a task waiting for a response is processed in the background.
+        reconnect : Optional[bool]
+            Whether to reconnect when the connection is lost, by default False
+            After reconnecting, the subscribed events are subscribed again,
+            and `on_resumed` event is called with the downtime in seconds.
 
         Returns
         -------
@@ -745,20 +1180,50 @@ class UserClient:
         as if addition_connect parameter used for all connections is true,
         all connections are aborted.
         """
+        self._gateway = await self._connect_gateway()
+        await self.subscribe(permission, self._session_id)
+        await self._load_slow_mode()
+
+        task = self._gateway._read_background_loop
+        if reconnect:
+            supervisor = GatewaySupervisor(
+                loop=self.loop,
+                connect=self._connect_gateway,
+                resume=self._resume_gateway,
+            )
+            task = supervisor.start(self._gateway)
+
+        if not addition_connect:
+            await task
+        return self._session_id
+
+    @refreshable
+    async def _connect_gateway(self) -> ChzzkGateway:
+        self._gateway_ready.clear()
         session_key = await self.http.generate_user_session(token=self.access_token)
-        self._gateway = await ChzzkGateway.connect(
+        gateway = await ChzzkGateway.connect(
             url=session_key.content.url,
             state=self._connection,
             loop=self.loop,
-            session=aiohttp.ClientSession(loop=self.loop),
+            session=self.parent_client.connection_pool.session,
         )
-        task = self._gateway.read_in_background()
-        await self._gateway_ready.wait()
-        self._gateway_id = self._gateway.session_id
-        await self.subscribe(permission, self._session_id)
-        if not addition_connect:
-            await task
-        return self._session_id
+        gateway.read_in_background(self.parent_client._backpressure)
+        await gateway.wait_until_ready(self._gateway_ready)
+        gateway.session_key = self._session_id
+        self._gateway_id = gateway.session_id
+        return gateway
+
+    async def _resume_gateway(
+        self, _: ChzzkGateway, gateway: ChzzkGateway, downtime: float
+    ) -> None:
+        self._gateway = gateway
+        try:
+            await self.subscribe(self.subscribed_permission, self._session_id)
+        except Exception as exc:
+            _log.warning(
+                "Failed to restore subscriptions of %s: %s", self.channel_id, exc
+            )
+        self.dispatch("resumed", downtime)
 
     async def disconnect(self):
         """Disconnect from session."""
@@ -792,13 +1257,7 @@ class UserClient:
                 "A session_id is not filled. Connect to session using UserClient.connect() method or Client.connect()."
             )
 
-        for permission_name, condition in permission:
-            if not condition:
-                continue
-            await self.http.subcribe_event(
-                event=permission_name, session_key=session_id, token=self.access_token
-            )
-            _log.debug(f"Subscribe {permission_name.upper()} Event")
+        await self._subscription(permission, session_id, subscribe=True)
         return
 
     @refreshable
@@ -821,20 +1280,92 @@ class UserClient:
                 "A session_id is not filled. Connect to session using UserClient.connect() method or Client.connect()."
             )
 
-        for permission_name, condition in permission:
-            if not condition:
-                continue
+        await self._subscription(permission, session_id, subscribe=False)
+        return
+
+    async def _subscription(
+        self, permission: UserPermission, session_id: str, subscribe: bool
+    ) -> None:
+        method = self.http.subcribe_event if subscribe else self.http.unsubcribe_event
+        permission_names = [name for name, condition in permission if condition]
+
+        # The events are subscribed concurrently, and failed requests are retried individually.
+        results = await asyncio.gather(
+            *[
+                self._subscription_request(method, permission_name, session_id)
+                for permission_name in permission_names
+            ],
+            return_exceptions=True,
+        )
 
-            await self.http.unsubcribe_event(
-                event=permission_name, session_key=session_id, token=self.access_token
+        exception = None
+        for permission_name, result in zip(permission_names, results):
+            if isinstance(result, BaseException):
+                exception = exception or result
+                continue
+            setattr(self._subscribed_permission, permission_name, subscribe)
+            if subscribe:
+                self._subscription_session_id = session_id
+            _log.debug(
+                f"{'Subscribe' if subscribe else 'Unsubscribe'} {permission_name.upper()} Event"
             )
-            _log.debug(f"Unsubscribe {permission_name.upper()} Event")
+
+        if exception is not None:
+            raise exception
         return
 
+    async def _subscription_request(
+        self,
+        method: Callable[..., Coroutine[Any, Any, Any]],
+        permission_name: str,
+        session_id: str,
+    ) -> None:
+        rate_limiter = self.parent_client.rate_limiter
+        for attempt in range(rate_limiter.max_retries + 1):
+            try:
+                await method(
+                    event=permission_name,
+                    session_key=session_id,
+                    token=self.access_token,
+                )
+                return
+            except _RETRYABLE_SUBSCRIPTION_EXCEPTIONS as exc:
+                if (
+                    not _is_retryable_subscription_error(exc)
+                    or attempt >= rate_limiter.max_retries
+                ):
+                    raise
+
+            delay = min(rate_limiter.backoff * 2**attempt, rate_limiter.max_backoff)
+            _log.debug(
+                "Failed to request %s event subscription, retrying in %.2f seconds",
+                permission_name.upper(),
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    @property
+    def subscribed_permission(self) -> UserPermission:
+        """The events subscribed by the user client.
+        It is used by :meth:`Client.restore_subscriptions` after reconnecting."""
+        return UserPermission(self._subscribed_permission.value)
+
+    async def _load_slow_mode(self) -> None:
+        # The send queue follows the slow mode of the chat settings.
+        try:
+            await self.get_chat_setting()
+        except (ForbiddenException, HTTPException) as exc:
+            _log.debug(
+                "Failed to load the slow mode of %s: %s. Keep the current slow mode.",
+                self.channel_id,
+                exc,
+            )
+
     @refreshable
     async def get_chat_setting(self) -> ChatSetting:
         """Get the chat settings."""
         raw_chat_setting = await self.http.get_chat_setting(token=self.access_token)
+        self.send_queue.slow_mode = raw_chat_setting.content.chat_slow_mode_sec
         return raw_chat_setting.content
 
     @overload
@@ -897,7 +1428,10 @@ class UserClient:
                 chat_available_group=instance.chat_available_group,
                 min_follower_minute=instance.min_follower_minute,
                 allow_subscriber_in_follower_mode=instance.allow_subscriber_in_follower_mode,
+                chat_slow_mode_sec=instance.chat_slow_mode_sec,
+                chat_emoji_mode=instance.chat_emoji_mode,
             )
+            self.send_queue.slow_mode = instance.chat_slow_mode_sec
             return
         await self.http.set_chat_setting(
             token=self.access_token,
@@ -908,6 +1442,7 @@ class UserClient:
             chat_slow_mode_sec=slow_mode,
             chat_emoji_mode=emoji_mode,
         )
+        self.send_queue.slow_mode = slow_mode
         return
 
     @refreshable
@@ -1018,7 +1553,7 @@ class UserClient:
         """
         result = await self.http.get_restrcit_users(token=self.access_token, size=size)
         data = result.content
-        data._next_method = self.http.get_restrcit_users
+        data._next_method = self._with_access_token(self.http.get_restrcit_users)
         data._next_method_key_argument = {"size": size}
         return data
 
@@ -1045,8 +1580,8 @@ class UserClient:
             token=self.access_token, size=size, page=page
         )
         data = result.content
-        data._next_method = self.http.get_channel_followers
-        data._next_method_key_argument = {"size": size, "token": self.access_token}
+        data._next_method = self._with_access_token(self.http.get_channel_followers)
+        data._next_method_key_argument = {"size": size}
         return result.content
 
     @refreshable
@@ -1071,10 +1606,6 @@ class UserClient:
             token=self.access_token, size=size, sort=sort, page=page
         )
         data = result.content
-        data._next_method = self.http.get_channel_subscribers
-        data._next_method_key_argument = {
-            "size": size,
-            "sort": sort,
-            "token": self.access_token,
-        }
+        data._next_method = self._with_access_token(self.http.get_channel_subscribers)
+        data._next_method_key_argument = {"size": size, "sort": sort}
         return result.content
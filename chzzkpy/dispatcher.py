@@ -0,0 +1,349 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+
+from typing import Any, Awaitable, Callable, Coroutine, NamedTuple, Optional
+
+_log = logging.getLogger(__name__)
+
+
+class DispatcherStatistics(NamedTuple):
+    """Represents a snapshot of the queued events of :class:`QueueDispatcher`."""
+
+    event: str
+    queued: int
+    dropped: int
+    workers: int
+
+
+class EventDispatcher:
+    """Represents the default event dispatcher.
+    Every event handler is scheduled as a new task.
+    """
+
+    def schedule(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        event_name: str,
+        runner: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Schedules an event handler.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop running the client.
+        event_name : str
+            The name of event handler. (ex. `on_chat`)
+        runner : Callable[..., Coroutine[Any, Any, Any]]
+            A coroutine function running the event handler.
+        """
+        loop.create_task(runner(*args, **kwargs), name=f"chzzk.py: {event_name}")
+
+    @property
+    def is_writable(self) -> bool:
+        """Indicates if the dispatcher can accept more events without dropping."""
+        return True
+
+    @property
+    def has_backpressure(self) -> bool:
+        """Indicates if :meth:`wait_until_writable` can block.
+        The gateway holds the received events in :class:`EventBuffer` only when the value is True.
+        """
+        return False
+
+    async def wait_until_writable(self) -> None:
+        """Waits until the dispatcher can accept more events."""
+        return
+
+    async def close(self) -> None:
+        """Stops the dispatcher."""
+        return
+
+
+class QueueDispatcher(EventDispatcher):
+    """Represents an event dispatcher with bounded queues.
+
+    Events are queued for each event handler name,
+    and a fixed number of worker coroutines per event handler name drain the queue.
+    When a queue is full, new events for the queue are dropped and counted.
+
+    While any queue is above `high_watermark`, :meth:`wait_until_writable` blocks
+    to hold the received events in :class:`EventBuffer` until the queue drains below `low_watermark`.
+
+    Parameters
+    ----------
+    max_queue_size : int
+        The maximum number of queued events per event handler name, by default 1000
+    concurrency : int
+        The number of worker coroutines per event handler name, by default 1
+    high_watermark : Optional[int]
+        The queue size to apply backpressure, by default 80% of `max_queue_size`.
+    low_watermark : Optional[int]
+        The queue size to release backpressure, by default 50% of `max_queue_size`.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        concurrency: int = 1,
+        high_watermark: Optional[int] = None,
+        low_watermark: Optional[int] = None,
+    ):
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be greater than 0.")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than 0.")
+
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+        self.high_watermark = high_watermark or max(1, max_queue_size * 4 // 5)
+        self.low_watermark = (
+            low_watermark if low_watermark is not None else max_queue_size // 2
+        )
+        if self.low_watermark >= self.high_watermark:
+            raise ValueError("low_watermark must be less than high_watermark.")
+
+        self._queues: dict[str, asyncio.Queue] = dict()
+        self._workers: dict[str, list[asyncio.Task]] = dict()
+        self._dropped: dict[str, int] = dict()
+        self._saturated: set[str] = set()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._closed = False
+
+    def schedule(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        event_name: str,
+        runner: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if self._closed:
+            return
+
+        queue = self._queues.get(event_name)
+        if queue is None:
+            queue = self._queues[event_name] = asyncio.Queue(
+                maxsize=self.max_queue_size
+            )
+            self._dropped[event_name] = 0
+            self._workers[event_name] = [
+                loop.create_task(
+                    self._worker(event_name, queue),
+                    name=f"chzzk.py: {event_name} worker #{index}",
+                )
+                for index in range(self.concurrency)
+            ]
+
+        try:
+            queue.put_nowait((runner, args, kwargs))
+        except asyncio.QueueFull:
+            self._dropped[event_name] += 1
+            _log.debug("Queue of %s is full. Dropping the event.", event_name)
+            return
+
+        if queue.qsize() >= self.high_watermark and event_name not in self._saturated:
+            self._saturated.add(event_name)
+            self._writable.clear()
+
+    async def _worker(self, event_name: str, queue: asyncio.Queue) -> None:
+        while not self._closed:
+            runner, args, kwargs = await queue.get()
+            try:
+                await runner(*args, **kwargs)
+            finally:
+                queue.task_done()
+
+            if event_name in self._saturated and queue.qsize() <= self.low_watermark:
+                self._saturated.discard(event_name)
+                if len(self._saturated) == 0:
+                    self._writable.set()
+
+    @property
+    def is_writable(self) -> bool:
+        return self._writable.is_set()
+
+    @property
+    def has_backpressure(self) -> bool:
+        return True
+
+    async def wait_until_writable(self) -> None:
+        await self._writable.wait()
+
+    def dropped(self, event_name: Optional[str] = None) -> int:
+        """Returns the number of dropped events.
+
+        Parameters
+        ----------
+        event_name : Optional[str]
+            The name of event handler. (ex. `on_chat`)
+            If the value is None, returns the number of dropped events of all event handlers.
+        """
+        if event_name is None:
+            return sum(self._dropped.values())
+        return self._dropped.get(event_name, 0)
+
+    def stats(self) -> list[DispatcherStatistics]:
+        """Returns a snapshot of the queues."""
+        return [
+            DispatcherStatistics(
+                event=event_name,
+                queued=queue.qsize(),
+                dropped=self._dropped[event_name],
+                workers=len(self._workers[event_name]),
+            )
+            for event_name, queue in self._queues.items()
+        ]
+
+    async def join(self) -> None:
+        """Waits until all queued events are processed."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self) -> None:
+        self._closed = True
+        workers = [task for tasks in self._workers.values() for task in tasks]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        self._queues.clear()
+        self._workers.clear()
+        self._saturated.clear()
+        self._writable.set()
+        self._closed = False
+
+
+class EventBuffer:
+    """Represents a bounded buffer of received events waiting to be dispatched.
+
+    The gateway puts user events into the buffer without waiting,
+    so that it keeps reading control packets (such as PING and PONG) while the dispatcher is saturated.
+    A pump coroutine waits for `wait_until_writable` before handling each buffered event.
+    When the buffer is full, new events are dropped and counted.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop running the client.
+    wait_until_writable : Callable[[], Awaitable[None]]
+        A coroutine function that waits until the events can be dispatched.
+    max_size : int
+        The maximum number of buffered events, by default 1000
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        wait_until_writable: Callable[[], Awaitable[None]],
+        max_size: int = 1000,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0.")
+
+        self.loop = loop
+        self.wait_until_writable = wait_until_writable
+        self.max_size = max_size
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._pump_task: Optional[asyncio.Task] = None
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def dropped(self) -> int:
+        """The number of dropped events."""
+        return self._dropped
+
+    def put(self, handler: Callable[..., Any], *args: Any) -> bool:
+        """Buffers an event to be handled.
+
+        Parameters
+        ----------
+        handler : Callable[..., Any]
+            A function handling the event. If it returns an awaitable, the pump awaits it.
+
+        Returns
+        -------
+        bool
+            False if the buffer is full and the event is dropped.
+        """
+        try:
+            self._queue.put_nowait((handler, args))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            _log.warning(
+                "Event buffer is full. Dropping the event. (%d events dropped)",
+                self._dropped,
+            )
+            return False
+        return True
+
+    def start(self) -> asyncio.Task:
+        """Starts the pump coroutine handling the buffered events."""
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = self.loop.create_task(
+                self._pump(), name="chzzk.py: event buffer"
+            )
+        return self._pump_task
+
+    async def _pump(self) -> None:
+        while True:
+            handler, args = await self._queue.get()
+            try:
+                await self.wait_until_writable()
+                result = handler(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _log.exception("Failed to handle the buffered event.")
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Waits until all buffered events are handled."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stops the pump coroutine. The remaining buffered events are discarded."""
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            await asyncio.gather(self._pump_task, return_exceptions=True)
+            self._pump_task = None
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
@@ -47,6 +47,16 @@ class SocketPacketType(Enum):
     BINARY_ACK = 6
 
 
+class MessagePriority(IntEnum):
+    """The priority of message sent by :class:`SendQueue<chzzkpy.send_queue.SendQueue>`.
+    A lower value is sent first."""
+
+    MODERATION = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
 class FollowingPeriod(IntEnum):
     NONE = 0
     FIVE_MINUTE = 5
@@ -64,7 +74,13 @@ class FollowingPeriod(IntEnum):
 
 
 def get_enum(cls: type[E], val: Any) -> E:
-    enum_val = [i for i in cls if i.value == val]
-    if len(enum_val) == 0:
-        return val
-    return enum_val[0]
+    # The value-to-member table of enum class is looked up in constant time.
+    # An unknown value is returned as it is.
+    try:
+        return cls._value2member_map_.get(val, val)
+    except TypeError:
+        # An unhashable value can't be looked up in the table.
+        enum_val = [i for i in cls if i.value == val]
+        if len(enum_val) == 0:
+            return val
+        return enum_val[0]
@@ -85,7 +85,12 @@ class TooManyRequestsException(ChzzkpyException):
 class HTTPException(ChzzkpyException):
     """Exception that’s raised when an HTTP request operation fails."""
 
-    def __init__(self, code: int, message: Optional[str] = None):
+    def __init__(
+        self, code: int, message: Optional[str] = None, status: Optional[int] = None
+    ):
+        self.code = code
+        # The HTTP status code of the response. (The `code` can be the error code of the response body.)
+        self.status = status if status is not None else code
         if message is None:
             message = f"Reponsed error code ({code})"
         else:
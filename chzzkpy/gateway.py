@@ -26,19 +26,22 @@ from __future__ import annotations
 import asyncio
 import aiohttp
 import logging
+import random
 import time
 
 from typing import Literal, TYPE_CHECKING
 from yarl import URL
 
 from .base_model import ChzzkModel
+from .dispatcher import EventBuffer
 from .enums import EnginePacketType, SocketPacketType
 from .error import HTTPException, ChatConnectFailed, ReceiveErrorPacket
 from .packet import Packet
 from .payload import Payload
+from .serializer import JSONBackend, get_json_backend
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Optional
+    from typing import Any, Awaitable, Callable, Optional
     from .state import ConnectionState
 
 _log = logging.getLogger(__name__)
@@ -61,6 +64,7 @@ class ChzzkGateway:
         open_packet_info: OpenPacketInfo,
         session_id: Optional[str] = None,
         event_hook=None,
+        json_backend: Optional[JSONBackend] = None,
     ):
         self.current_transport = current_transport
         self.upgrades = open_packet_info.upgrades
@@ -69,12 +73,16 @@ class ChzzkGateway:
 
         self.base_url = base_url
         self.session_id = session_id or open_packet_info.sid
+        # A session key of Open API, received with the `connected` system message.
+        self.session_key: Optional[str] = None
 
         self.loop = loop
         self.session: aiohttp.ClientSession = session
         self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
+        self.json_backend = json_backend or get_json_backend()
 
         self.is_connected = True
+        self._connection_error: Optional[BaseException] = None
 
         self._heartbeat_receive_event = asyncio.Event()
         self._heartbeat_receive_event.clear()
@@ -87,6 +95,9 @@ class ChzzkGateway:
             self._read_loop = self._read_polling
 
         self._read_background_loop: Optional[asyncio.Task] = None
+        # User events are held in the buffer while the event dispatcher is saturated.
+        self._event_buffer: Optional[EventBuffer] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
 
         _log.debug(f"Success connected to {self.base_url.host} with socket.io gateway")
 
@@ -112,12 +123,16 @@ class ChzzkGateway:
         url: str | URL,
         engine_path: str,
         transport: Literal["polling", "websocket"],
-        ssl: bool = True,
+        ssl: Optional[bool] = None,
     ) -> URL:
         new_url = url
         if not isinstance(url, URL):
             new_url = URL(url)
 
+        # The scheme of session URL decides whether to use TLS, such as a local test server.
+        if ssl is None:
+            ssl = new_url.scheme not in ("http", "ws")
+
         query = new_url.query.copy()
 
         if transport == "polling":
@@ -150,7 +165,9 @@ class ChzzkGateway:
         engine_path: Optional[str] = None,
     ):
         engine_path = engine_path or "socket.io"
-        gateway = await cls._connect_polling(url, engine_path, loop, session)
+        gateway = await cls._connect_polling(
+            url, engine_path, loop, session, json_backend=state.json_backend
+        )
 
         for event, parsing_func in state.gateway_parsers.items():
             if parsing_func is None:
@@ -169,7 +186,9 @@ class ChzzkGateway:
         event_hook: Optional[
             dict[EnginePacketType | SocketPacketType, Callable[..., Any]]
         ] = None,
+        json_backend: Optional[JSONBackend] = None,
     ):
+        json_backend = json_backend or get_json_backend()
         base_url = cls._get_engineio_url(
             url=url, engine_path=engine_path, transport="polling"
         )
@@ -180,7 +199,7 @@ class ChzzkGateway:
             raise ChatConnectFailed.polling_connect_failed(connection_response.status)
 
         raw_payload = await connection_response.read()
-        payload = Payload.decode(raw_payload)
+        payload = Payload.decode(raw_payload, json_serialize=json_backend.loads)
 
         raw_open_packet = payload.packets[0]
         open_packet = OpenPacketInfo.model_validate(raw_open_packet.data)
@@ -194,6 +213,7 @@ class ChzzkGateway:
                     session=session,
                     open_packet=open_packet,
                     event_hook=event_hook,
+                    json_backend=json_backend,
                 )
             except (
                 aiohttp.client_exceptions.WSServerHandshakeError,
@@ -207,7 +227,7 @@ class ChzzkGateway:
                 pass
             else:
                 for packet in payload.packets[1:]:
-                    new_cls.received_message(packet)
+                    await new_cls.received_message(packet)
                 return new_cls
 
         query = base_url.query.copy()
@@ -222,9 +242,10 @@ class ChzzkGateway:
             open_packet_info=open_packet,
             session_id=open_packet.sid,
             event_hook=event_hook,
+            json_backend=json_backend,
         )
         for packet in payload.packets:
-            new_cls.received_message(packet)
+            await new_cls.received_message(packet)
         return new_cls
 
     @classmethod
@@ -238,7 +259,9 @@ class ChzzkGateway:
         event_hook: Optional[
             dict[EnginePacketType | SocketPacketType, Callable[..., Any]]
         ] = None,
+        json_backend: Optional[JSONBackend] = None,
     ):
+        json_backend = json_backend or get_json_backend()
         base_url = cls._get_engineio_url(
             url=url, engine_path=engine_path, transport="websocket"
         )
@@ -257,9 +280,9 @@ class ChzzkGateway:
         if upgrade:
             ping_packet = Packet(EnginePacketType.PING, data="probe")
 
-            await websocket.send_str(ping_packet.encode())
+            await websocket.send_str(ping_packet.encode(json_backend.dumps))
             raw_pong_packet = (await websocket.receive()).data
-            pong_packet = Packet.decode(raw_pong_packet)
+            pong_packet = Packet.decode(raw_pong_packet, json_backend.loads)
 
             if (
                 pong_packet.engine_packet_type != EnginePacketType.PONG
@@ -268,10 +291,10 @@ class ChzzkGateway:
                 raise ChatConnectFailed.websocket_upgrade_failed()
 
             upgrade_packet = Packet(EnginePacketType.UPGRADE)
-            await websocket.send_str(upgrade_packet.encode())
+            await websocket.send_str(upgrade_packet.encode(json_backend.dumps))
         else:
             raw_open_packet = (await websocket.receive()).data
-            raw_open_packet = Packet.decode(raw_open_packet)
+            raw_open_packet = Packet.decode(raw_open_packet, json_backend.loads)
             open_packet = OpenPacketInfo.model_validate(raw_open_packet.data)
 
             query = base_url.query.copy()
@@ -288,6 +311,7 @@ class ChzzkGateway:
             open_packet_info=open_packet,
             session_id=session_id,
             event_hook=event_hook,
+            json_backend=json_backend,
         )
         await new_cls.received_message(
             Packet(
@@ -307,7 +331,7 @@ class ChzzkGateway:
             raise ReceiveErrorPacket(self.current_transport, self.status)
 
         raw_payload = await response.read()
-        payload = Payload.decode(raw_payload)
+        payload = Payload.decode(raw_payload, json_serialize=self.json_backend.loads)
 
         for packet in payload.packets:
             await self.received_message(packet)
@@ -318,45 +342,103 @@ class ChzzkGateway:
         )
         if message.type is aiohttp.WSMsgType.TEXT:
             data = message.data
-            packet = Packet.decode(data)
+            packet = Packet.decode(data, json_serialize=self.json_backend.loads)
             await self.received_message(packet)
         elif message.type == aiohttp.WSMsgType.ERROR:
             raise ReceiveErrorPacket(self.current_transport, self.data)
+        elif message.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+        ):
+            if self.is_connected:
+                self._connection_error = ConnectionError(
+                    "Websocket connection has been closed."
+                )
+            await self._close()
 
-    async def _write_polling(self, data: Packet):
+    async def _write_polling(self, data: Payload):
         write_response = await self.session.request(
-            "POST", self.base_url, data=data.encode()
+            "POST",
+            self.base_url,
+            data=data.encode(json_serialize=self.json_backend.dumps),
         )
         if write_response.status < 200 and write_response.status >= 300:
             raise HTTPException(write_response.status)
         return
 
-    async def _write_websocket(self, data: Packet):
-        await self.websocket.send_bytes(data.encode())
+    async def _write_websocket(self, data: Payload):
+        # Websocket transport sends one packet per frame.
+        for packet in data.packets:
+            await self.websocket.send_str(packet.encode(self.json_backend.dumps))
         return
 
     async def _ping_loop(self):
         while self.is_connected:
             _log.debug("Send Ping packet to server for heartbeat")
-            await self.send_ping()
+            self._heartbeat_receive_event.clear()
             try:
+                await self.send_ping()
                 await asyncio.wait_for(
                     self._heartbeat_receive_event.wait(), timeout=self.ping_timeout
                 )
-            except (asyncio.Timeout, asyncio.CancelledError):
-                raise ConnectionError("PONG response has not been received.")
+            except (asyncio.TimeoutError, aiohttp.ClientError, ConnectionError):
+                # The error is raised by read method instead of this background task.
+                _log.warning("PONG response has not been received, close connection.")
+                self._connection_error = ConnectionError(
+                    "PONG response has not been received."
+                )
+                await self._close()
+                return
             _log.debug("Received Pong packet from server.")
             await asyncio.sleep(self.ping_interval)
 
-    async def read(self):
-        while self.is_connected:
-            await self._read_loop()
-
-    def read_in_background(self) -> asyncio.Task:
-        task = self.loop.create_task(self.read())
+    async def read(
+        self, wait_until_writable: Optional[Callable[[], Awaitable[None]]] = None
+    ):
+        # Keep reading control packets (PING, PONG, CLOSE) while the event dispatcher is saturated.
+        # Only the user events are held in the bounded buffer until the dispatcher is writable.
+        # (`wait_until_writable` is None when the dispatcher can't apply backpressure.)
+        if wait_until_writable is not None:
+            self._event_buffer = EventBuffer(self.loop, wait_until_writable)
+            self._event_buffer.start()
+
+        try:
+            while self.is_connected:
+                await self._read_loop()
+        finally:
+            if self._event_buffer is not None:
+                await self._event_buffer.close()
+                self._event_buffer = None
+
+        if self._connection_error is not None:
+            raise self._connection_error
+
+    def read_in_background(
+        self, wait_until_writable: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> asyncio.Task:
+        task = self.loop.create_task(self.read(wait_until_writable))
         self._read_background_loop = task
         return task
 
+    async def wait_until_ready(self, ready_event: asyncio.Event) -> None:
+        """Waits until `ready_event` is set while reading in background.
+        If the connection is lost before ready, the exception of reading task is raised.
+        """
+        ready_task = self.loop.create_task(ready_event.wait())
+        try:
+            await asyncio.wait(
+                [ready_task, self._read_background_loop],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_task.cancel()
+
+        if not ready_event.is_set():
+            if not self._read_background_loop.cancelled():
+                self._read_background_loop.result()
+            raise ConnectionError("The connection has been closed before ready.")
+
     async def received_message(self, data: Packet):
         _log.debug(
             f"Received Packet (Engine Packet Type: {data.engine_packet_type}, "
@@ -370,27 +452,50 @@ class ChzzkGateway:
                 await self.send_ack(data.id)
 
             func = self._event_hook.get(data.socket_packet_type)
-            if func is not None:
-                await func(data.data)
+            if func is None:
+                return
+
+            if self._event_buffer is not None and self._is_user_event(data):
+                self._event_buffer.put(func, data.data)
+                return
+            await func(data.data)
             return
 
         if data.engine_packet_type == EnginePacketType.PONG:
             self._heartbeat_receive_event.set()
         elif data.engine_packet_type == EnginePacketType.CLOSE:
             _log.warning("Received close packet, close connection.")
-            await self.disconnect()
+            self._connection_error = ConnectionError("Received close packet.")
+            await self._close()
 
         func = self._event_hook.get(data.engine_packet_type)
         if func is not None:
             await func(data.data)
         return
 
+    @staticmethod
+    def _is_user_event(data: Packet) -> bool:
+        # The system messages (such as `connected`) are handled without buffering.
+        return (
+            data.socket_packet_type == SocketPacketType.EVENT
+            and isinstance(data.data, list)
+            and len(data.data) > 0
+            and data.data[0] != "SYSTEM"
+        )
+
     async def send(self, packet: Payload | Packet):
         if isinstance(packet, Packet):
             packet = Payload(packets=[packet])
         await self._write(packet)
 
     async def disconnect(self):
+        # A reconnecting supervisor is stopped, even if the connection is already lost.
+        if (
+            self._supervisor_task is not None
+            and self._supervisor_task is not asyncio.current_task()
+        ):
+            self._supervisor_task.cancel()
+
         if not self.is_connected:
             return
 
@@ -403,7 +508,18 @@ class ChzzkGateway:
             and not self._read_background_loop.cancelled()
         ):
             self._read_background_loop.cancel()
-        await self.websocket.close()
+
+        if self.websocket is not None:
+            await self.websocket.close()
+
+    async def _close(self):
+        # Close the connection without cancelling the reading task.
+        self.is_connected = False
+        if self._ping_loop_task is not asyncio.current_task():
+            self._ping_loop_task.cancel()
+
+        if self.websocket is not None and not self.websocket.closed:
+            await self.websocket.close()
 
     async def send_ping(self, message: Optional[str] = None):
         await self.send(Packet(EnginePacketType.PING, data=message))
@@ -416,3 +532,95 @@ class ChzzkGateway:
         await self.send(
             Packet(EnginePacketType.MESSAGE, SocketPacketType.ACK, packet_id=pakcet_id)
         )
+
+
+class GatewaySupervisor:
+    """Represents a supervisor reconnecting the gateway when the connection is lost.
+
+    The connection is reconnected with jittered exponential backoff.
+    After reconnecting, `resume` is called with the previous gateway, the new gateway
+    and the downtime in seconds.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        An event loop running the supervisor.
+    connect : Callable[[], Awaitable[ChzzkGateway]]
+        A function connecting a new gateway.
+        The returned gateway must be reading in background and ready.
+    resume : Callable[[ChzzkGateway, ChzzkGateway, float], Awaitable[None]]
+        A function called after reconnecting.
+    backoff : float
+        The base seconds to wait before reconnecting, by default 1.0
+    max_backoff : float
+        The maximum seconds to wait before reconnecting, by default 60.0
+    max_retries : Optional[int]
+        The maximum number of consecutive reconnect attempts, by default None (unlimited)
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        connect: Callable[[], Awaitable[ChzzkGateway]],
+        resume: Callable[[ChzzkGateway, ChzzkGateway, float], Awaitable[None]],
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_retries: Optional[int] = None,
+    ):
+        self.loop = loop
+        self.connect = connect
+        self.resume = resume
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+
+    def start(self, gateway: ChzzkGateway) -> asyncio.Task:
+        """Supervise the gateway in background.
+        The supervisor is stopped when the gateway is disconnected by :meth:`ChzzkGateway.disconnect`.
+        """
+        task = self.loop.create_task(self.run(gateway))
+        gateway._supervisor_task = task
+        return task
+
+    async def run(self, gateway: ChzzkGateway) -> None:
+        while True:
+            try:
+                await gateway._read_background_loop
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                ConnectionError,
+                ReceiveErrorPacket,
+            ) as exc:
+                _log.warning("The gateway connection has been lost: %s", exc)
+            else:
+                _log.warning("The gateway connection has been closed by server.")
+            await gateway._close()
+
+            disconnected_at = self.loop.time()
+            new_gateway = await self._reconnect()
+            new_gateway._supervisor_task = asyncio.current_task()
+
+            downtime = self.loop.time() - disconnected_at
+            _log.info("The gateway has been reconnected after %.2f seconds", downtime)
+            await self.resume(gateway, new_gateway, downtime)
+            gateway = new_gateway
+
+    async def _reconnect(self) -> ChzzkGateway:
+        attempt = 0
+        while True:
+            delay = min(self.backoff * 2**attempt, self.max_backoff)
+            await asyncio.sleep(random.uniform(delay / 2, delay))
+            try:
+                return await self.connect()
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                ConnectionError,
+                ChatConnectFailed,
+                HTTPException,
+            ) as exc:
+                attempt += 1
+                if self.max_retries is not None and attempt >= self.max_retries:
+                    raise
+                _log.warning("Failed to reconnect the gateway: %s", exc)
@@ -23,7 +23,11 @@ SOFTWARE.
 
 import asyncio
 import aiohttp
+import contextlib
 import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
 from typing import Annotated, Optional, Literal, overload
 
 from ahttp_client import (
@@ -43,6 +47,7 @@ from ahttp_client.request import RequestCore
 
 from .authorization import AccessToken
 from .base_model import Content, SearchResult, ChannelSearchResult
+from .cache import CachedSession, ResponseCache, cache_ttl
 from .category import CATEGORY_TYPE, Category
 from .channel import Channel, ChannelPermission, FollowerInfo, SubscriberInfo
 from .chat import ChatSetting
@@ -56,22 +61,243 @@ from .error import (
     HTTPException,
 )
 from .live import BrodecastSetting, Live
+from .pool import ConnectionPool
 from .restriction import RestrictUser
 from .session import SessionKey
 
 _log = logging.getLogger(__name__)
 
 
-class ChzzkOpenAPISession(Session):
+class _RateLimitBucket:
+    __slots__ = (
+        "semaphore",
+        "limit",
+        "remaining",
+        "reset_at",
+        "blocked_until",
+        "failures",
+        "users",
+        "last_used",
+    )
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.blocked_until: float = 0.0
+        self.failures = 0
+        # The number of requests holding or waiting for the bucket.
+        self.users = 0
+        self.last_used: float = 0.0
+
+    def delay(self, now: float) -> float:
+        delay = self.blocked_until - now
+        if self.remaining is not None and self.remaining <= 0:
+            delay = max(delay, self.reset_at - now)
+        return delay
+
+    def is_idle(self, now: float, idle_timeout: float) -> bool:
+        # A bucket still limited is kept to respect the learned limit.
+        return (
+            self.users == 0
+            and now - self.last_used >= idle_timeout
+            and self.delay(now) <= 0
+        )
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    # The `Retry-After` header is either delay seconds or an HTTP-date.
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # An HTTP-date is always GMT.
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """Represents a rate-limit governor of the Open API session.
+
+    Requests are grouped into buckets by the route and the token (or client ID),
+    so a burst of one user client doesn't exhaust the limit of the others.
+    The limits of bucket are learned from 429 responses and the rate-limit headers
+    (`Retry-After`, `X-RateLimit-Remaining`, `X-RateLimit-Reset`),
+    and the requests exceeding the limit wait in the queue instead of failing.
+
+    Parameters
+    ----------
+    concurrency : int
+        The maximum number of concurrent requests per bucket, by default 5
+    max_retries : int
+        The number of retries for GET requests responded with 429 status code, by default 3
+    backoff : float
+        The base seconds to wait after 429 response without `Retry-After` header, by default 1.0
+    max_backoff : float
+        The maximum seconds to wait after 429 response, by default 60.0
+    idle_timeout : float
+        The seconds after which an unused bucket is evicted, by default 300.0
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 5,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        idle_timeout: float = 300.0,
+    ):
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.idle_timeout = idle_timeout
+
+        self._buckets: dict[tuple[str, str, str], _RateLimitBucket] = dict()
+        self._last_evicted = 0.0
+        self._queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for the rate limit."""
+        return self._queue_depth
+
+    @property
+    def bucket_count(self) -> int:
+        """The number of buckets of the rate limiter."""
+        return len(self._buckets)
+
+    def get_bucket(self, method: str, route: str, token: str) -> _RateLimitBucket:
+        now = asyncio.get_running_loop().time()
+        if now - self._last_evicted >= self.idle_timeout:
+            self.evict_idle_buckets(now)
+
+        key = (method.upper(), route, token)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _RateLimitBucket(self.concurrency)
+        bucket.last_used = now
+        return bucket
+
+    def evict_idle_buckets(self, now: Optional[float] = None) -> int:
+        """Evict the buckets unused for `idle_timeout` seconds.
+        The buckets of expired tokens are evicted in this way.
+
+        Parameters
+        ----------
+        now : Optional[float]
+            The current time of the event loop. If the value is None, :meth:`loop.time` is used.
+
+        Returns
+        -------
+        int
+            The number of evicted buckets.
+        """
+        if now is None:
+            now = asyncio.get_running_loop().time()
+        self._last_evicted = now
+
+        idle_keys = [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.is_idle(now, self.idle_timeout)
+        ]
+        for key in idle_keys:
+            del self._buckets[key]
+        return len(idle_keys)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, bucket: _RateLimitBucket):
+        loop = asyncio.get_running_loop()
+        self._queue_depth += 1
+        bucket.users += 1
+        try:
+            try:
+                await bucket.semaphore.acquire()
+                try:
+                    while (delay := bucket.delay(loop.time())) > 0:
+                        await asyncio.sleep(delay)
+                except BaseException:
+                    bucket.semaphore.release()
+                    raise
+            finally:
+                self._queue_depth -= 1
+
+            if bucket.remaining is not None:
+                bucket.remaining -= 1
+            try:
+                yield bucket
+            finally:
+                bucket.semaphore.release()
+        finally:
+            bucket.users -= 1
+            bucket.last_used = loop.time()
+
+    def update(
+        self, bucket: _RateLimitBucket, response: aiohttp.ClientResponse
+    ) -> float:
+        """Learn the limit of bucket from the response.
+        Returns the seconds to wait before retrying, when the response is 429 status code.
+        """
+        now = asyncio.get_running_loop().time()
+        headers = response.headers
+
+        if "X-RateLimit-Limit" in headers:
+            bucket.limit = int(headers["X-RateLimit-Limit"])
+        if "X-RateLimit-Remaining" in headers:
+            bucket.remaining = int(headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Reset" in headers:
+            reset = float(headers["X-RateLimit-Reset"])
+            # The header is either epoch seconds or seconds until reset.
+            if reset > 1e9:
+                reset -= time.time()
+            bucket.reset_at = now + max(reset, 0)
+
+        if response.status != 429:
+            bucket.failures = 0
+            return 0
+
+        bucket.failures += 1
+        retry_after = None
+        if "Retry-After" in headers:
+            retry_after = _parse_retry_after(headers["Retry-After"])
+        if retry_after is None:
+            retry_after = min(
+                self.backoff * (2 ** (bucket.failures - 1)), self.max_backoff
+            )
+            retry_after *= random.uniform(1.0, 1.5)
+        bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+        return retry_after
+
+
+class ChzzkOpenAPISession(CachedSession):
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
-        super().__init__(base_url="https://openapi.chzzk.naver.com", loop=loop)
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+        session_options = dict()
+        if connection_pool is not None:
+            session_options = connection_pool.session_options()
+        super().__init__(
+            base_url="https://openapi.chzzk.naver.com", loop=loop, **session_options
+        )
 
     async def before_request(
         self, request: RequestCore, path: str
@@ -102,6 +328,36 @@ class ChzzkOpenAPISession(Session):
         request.headers["Content-Type"] = "application/json"
         return request, path
 
+    async def _send_request(self, request: RequestCore, path: str):
+        token = request.headers.get("Authorization") or self.client_id
+        bucket = self.rate_limiter.get_bucket(request.method, request.path, token)
+
+        retries = 0
+        while True:
+            async with self.rate_limiter.acquire(bucket):
+                response = await self.session.request(
+                    request.method, path, **request.get_request_kwargs()
+                )
+                retry_after = self.rate_limiter.update(bucket, response)
+
+            # Only idempotent requests are retried.
+            if (
+                response.status != 429
+                or request.method.upper() != "GET"
+                or retries >= self.rate_limiter.max_retries
+            ):
+                break
+
+            retries += 1
+            response.release()
+            _log.debug(
+                f"Path({path}) was rate limited. Retry after {retry_after:.2f} seconds."
+            )
+
+        response = await self.after_request(response)
+        await response.read()
+        return response
+
     async def after_request(self, response: aiohttp.ClientResponse):
         if response.status == 400:
             raise BadRequestException(response.reason)
@@ -118,7 +374,9 @@ class ChzzkOpenAPISession(Session):
             raise TooManyRequestsException(response.reason)
         elif response.status >= 400:
             data = await response.json()
-            raise HTTPException(code=data["code"], message=data["message"])
+            raise HTTPException(
+                code=data["code"], message=data["message"], status=response.status
+            )
         return response
 
     @staticmethod
@@ -195,6 +453,7 @@ class ChzzkOpenAPISession(Session):
     @pydantic_response_model()
     @get("/open/v1/channels", directly_response=True)
     @authorization_configuration(is_client=True, is_user=False)
+    @cache_ttl(60)
     async def get_channel(
         self, channel_ids: Annotated[str, Query.to_camel()]
     ) -> Content[SearchResult[Channel]]:
@@ -234,6 +493,7 @@ class ChzzkOpenAPISession(Session):
     @pydantic_response_model()
     @get("/open/v1/categories/search", directly_response=True)
     @authorization_configuration(is_client=True, is_user=False)
+    @cache_ttl(300)
     async def get_category(
         self, query: Annotated[str, Query], size: Annotated[Optional[int], Query] = 20
     ) -> Content[SearchResult[Category]]:
@@ -362,6 +622,7 @@ class ChzzkOpenAPISession(Session):
     @pydantic_response_model()
     @get("/open/v1/lives", directly_response=True)
     @authorization_configuration(is_client=True, is_user=False)
+    @cache_ttl(30)
     async def get_lives(
         self,
         size: Annotated[Optional[int], Query] = 20,
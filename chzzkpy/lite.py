@@ -0,0 +1,197 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, ClassVar, Optional, TYPE_CHECKING
+
+from .message import Donation, Message, Messageable, Subscription
+
+if TYPE_CHECKING:
+    from .authorization import AccessToken
+    from .state import ConnectionState
+
+
+def _parse_time(value: Any) -> Optional[datetime.datetime]:
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, (int, float)):
+        # Same as pydantic, the timestamp is parsed in milliseconds over 2e10.
+        if abs(value) > 2e10:
+            value = value / 1000
+        return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+    # datetime.fromisoformat doesn't accept the "Z" suffix before Python 3.11.
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+class LiteMessageable:
+    """A base class of lightweight messages for high-volume ingestion.
+
+    A lightweight message keeps the raw dictionary of event in `__slots__`
+    and reads the attributes from it, without pydantic validation.
+    The full pydantic model is validated on demand with :meth:`to_model`.
+    """
+
+    __slots__ = ("_data", "_state", "_access_token", "_model")
+    model_type: ClassVar[type[Messageable]] = Messageable
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        state: Optional[ConnectionState] = None,
+        access_token: Optional[AccessToken] = None,
+    ):
+        self._data = data
+        self._state = state
+        self._access_token = access_token
+        self._model: Optional[Messageable] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} data={self._data!r}>"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The raw dictionary of event."""
+        return self._data
+
+    def to_model(self) -> Messageable:
+        """Validate the raw dictionary to the full pydantic model.
+        The validated model is cached in this instance.
+        """
+        if self._model is None:
+            model = self.model_type.model_validate(self._data)
+            model._state = self._state
+            model._access_token = self._access_token
+            self._model = model
+        return self._model
+
+    async def send(self, content: str):
+        """Send a message to the received channel
+
+        Parameters
+        ----------
+        content : str
+            A content of message to send.
+        """
+        return await self.to_model().send(content)
+
+
+class LiteMessage(LiteMessageable):
+    """A lightweight representation of :class:`Message`."""
+
+    __slots__ = ()
+    model_type = Message
+
+    @property
+    def channel(self) -> str:
+        return self._data["channelId"]
+
+    @property
+    def user_id(self) -> str:
+        return self._data["senderChannelId"]
+
+    @property
+    def nickname(self) -> str:
+        return self._data["profile"]["nickname"]
+
+    @property
+    def content(self) -> str:
+        return self._data["content"]
+
+    @property
+    def created_time(self) -> datetime.datetime:
+        return _parse_time(self._data["messageTime"])
+
+    def to_model(self) -> Message:
+        return super().to_model()
+
+
+class LiteDonation(LiteMessageable):
+    """A lightweight representation of :class:`Donation`."""
+
+    __slots__ = ()
+    model_type = Donation
+
+    @property
+    def type(self) -> str:
+        return self._data["donationType"]
+
+    @property
+    def channel(self) -> str:
+        return self._data["channelId"]
+
+    @property
+    def donator_id(self) -> str:
+        return self._data["donatorChannelId"]
+
+    @property
+    def donator_name(self) -> str:
+        return self._data["donatorNickname"]
+
+    @property
+    def pay_amount(self) -> int:
+        return self._data["payAmount"]
+
+    @property
+    def donation_text(self) -> str:
+        return self._data["donationText"]
+
+    def to_model(self) -> Donation:
+        return super().to_model()
+
+
+class LiteSubscription(LiteMessageable):
+    """A lightweight representation of :class:`Subscription`."""
+
+    __slots__ = ()
+    model_type = Subscription
+
+    @property
+    def channel(self) -> str:
+        return self._data["channelId"]
+
+    @property
+    def subscriber_id(self) -> str:
+        return self._data["subscriberChannelId"]
+
+    @property
+    def subscriber_name(self) -> str:
+        return self._data["subscriberNickname"]
+
+    @property
+    def tier_no(self) -> int:
+        return self._data["tierNo"]
+
+    @property
+    def tier_name(self) -> str:
+        return self._data["tierName"]
+
+    @property
+    def month(self) -> int:
+        return self._data["month"]
+
+    def to_model(self) -> Subscription:
+        return super().to_model()
@@ -45,12 +45,14 @@ class Messageable(ChzzkModel):
     _access_token: Optional[AccessToken] = PrivateAttr(default=None)
     _state: Optional[ConnectionState] = PrivateAttr(default=None)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        if "state" in kwargs.keys() and "access_token" in kwargs.keys():
-            self._access_token = kwargs.pop("access_token")
-            self._state = kwargs.pop("state")
+    def model_post_init(self, context: Any) -> None:
+        # The `state` and `access_token` keywords are moved from the extra fields.
+        # The `__init__` method isn't overridden, because a custom `__init__` makes pydantic-core
+        # validate through Python keyword arguments, even in `model_validate_json`.
+        extra = self.__pydantic_extra__
+        if extra is not None and "state" in extra and "access_token" in extra:
+            self._access_token = extra.pop("access_token")
+            self._state = extra.pop("state")
 
     async def send(self, content: str) -> SentMessage:
         """Send a message to the received channel
@@ -21,11 +21,12 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import json
-
 from typing import Any, Optional
 
 from .enums import EnginePacketType, SocketPacketType, get_enum
+from .serializer import JSONBackend
+
+_default_json_backend = JSONBackend()
 
 
 class Packet:
@@ -50,47 +51,45 @@ class Packet:
         self.namespace = namespace
 
     @classmethod
-    def _decode_socket(cls, engine_packet_type, payload, json_serialize=None):
-        packet_type = get_enum(SocketPacketType, int(payload[0:1]))
-        data = payload[1:]
+    def _decode_socket(cls, engine_packet_type, payload, json_serialize=None, index=0):
+        # The payload is walked with a cursor(index) instead of slicing per field.
+        length = len(payload)
+        packet_type = get_enum(SocketPacketType, int(payload[index]))
+        index += 1
 
         # Empty Data
-        if len(data) == 0:
+        if index >= length:
             return cls(engine_packet_type, packet_type)
 
         # Decode Attachment (Binaray)
-        attachment_separator = data.find("-")
-        if attachment_separator > 0 and data[0:attachment_separator].isdigit():
+        cursor = index
+        while cursor < length and payload[cursor].isdigit():
+            cursor += 1
+        if cursor > index and cursor < length and payload[cursor] == "-":
             # Unused attachment feature in chzzk Session API.
-            # attachment_count = data[0:attachment_separator]
-            data = data[attachment_separator + 1 :]
+            # attachment_count = int(payload[index:cursor])
+            index = cursor + 1
 
         # Decode Namespace
         namespace = None
-        if len(data) > 0 and data.startswith("/"):
-            namespace_separtor = data.find(",")
+        if index < length and payload[index] == "/":
+            namespace_separtor = payload.find(",", index)
             if namespace_separtor == -1:
-                namespace = data
-                data = str()
-            else:
-                namespace = data[0:namespace_separtor]
-                data = data[namespace_separtor + 1 :]
+                namespace_separtor = length
 
-            query = namespace.find("?")
-            if query >= 0:
-                namespace = namespace[0:query]
+            query = payload.find("?", index, namespace_separtor)
+            namespace = payload[index : query if query >= 0 else namespace_separtor]
+            index = namespace_separtor + 1
 
         # Decode Packet ID
         packet_id = None
-        if len(data) > 0 and data[0].isdigit():
-            packet_id = int(data[0])
-            while len(data) > 0 and data[0].isdigit():
-                packet_id *= 10
-                packet_id += int(data[0])
-                data = data[1:]
-
-        if len(data) > 0:
-            data = json_serialize(data)
+        while index < length and "0" <= payload[index] <= "9":
+            packet_id = (packet_id or 0) * 10 + ord(payload[index]) - 48
+            index += 1
+
+        data = None
+        if index < length:
+            data = json_serialize(payload[index:] if index > 0 else payload)
         return cls(
             engine_packet_type,
             packet_type,
@@ -101,20 +100,21 @@ class Packet:
 
     @classmethod
     def decode(cls, payload, json_serialize=None):
-        json_serialize = json_serialize or json.loads
-        packet_type = get_enum(EnginePacketType, int(payload[0]))
+        json_serialize = json_serialize or _default_json_backend.loads
+        packet_type = get_enum(EnginePacketType, ord(payload[0]) - 48)
 
         if packet_type == EnginePacketType.MESSAGE:
             return cls._decode_socket(
-                packet_type, payload[1:], json_serialize=json_serialize
+                packet_type, payload, json_serialize=json_serialize, index=1
             )
 
+        raw_data = payload[1:]
         try:
-            data = json_serialize(payload[1:])
+            data = json_serialize(raw_data)
             if isinstance(data, int):
                 raise ValueError
         except ValueError:
-            data = payload[1:]
+            data = raw_data
         return cls(packet_type, None, data)
 
     @property
@@ -125,32 +125,26 @@ class Packet:
         )
 
     def encode(self, json_serialize=None) -> str:
-        json_serialize = json_serialize or json.dumps
-        encoded_packet = str(self.engine_packet_type.value)
+        json_serialize = json_serialize or _default_json_backend.dumps
+        encoded_packet = [str(self.engine_packet_type.value)]
         if self.is_socket_packet:
-            encoded_packet += str(self.socket_packet_type)
-            encoded_data = []
-
-            data = (
-                json_serialize(self.data, separators=(",", ":"))
-                if self.data is not None
-                else None
-            )
+            encoded_packet.append(str(self.socket_packet_type.value))
 
             if self.namespace is not None:
-                encoded_data.append(self.namespace)
+                encoded_packet.append(self.namespace)
+                encoded_packet.append(",")
 
             if self.id is not None:
-                encoded_data.append(str(self.id) + data if data is not None else "")
-            elif data is not None:
-                encoded_data.append(data)
+                encoded_packet.append(str(self.id))
+
+            if self.data is not None:
+                encoded_packet.append(json_serialize(self.data))
+            return "".join(encoded_packet)
 
-            encoded_packet += ",".join(encoded_data)
-            return encoded_packet
         if isinstance(self.data, str):
-            encoded_packet += self.data
+            encoded_packet.append(self.data)
         elif isinstance(self.data, dict) or isinstance(self.data, list):
-            encoded_packet += json_serialize(self.data, separators=(",", ":"))
+            encoded_packet.append(json_serialize(self.data))
         elif self.data is not None:
-            encoded_packet += str(self.data)
-        return encoded_packet
+            encoded_packet.append(str(self.data))
+        return "".join(encoded_packet)
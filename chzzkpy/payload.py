@@ -21,8 +21,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import functools
-
 from urllib.parse import parse_qs
 from .packet import Packet
 
@@ -33,70 +31,84 @@ class Payload:
     def __init__(self, packets=None):
         self.packets: list[Packet] = packets or []
 
-    def encode(self, jsonp_index=None):
-        encoded_payload = b""
+    def encode(self, jsonp_index=None, json_serialize=None):
+        encoded_payload = bytearray()
         for packet in self.packets:
-            encoded_packet = packet.encode()
-            content_length = len(encoded_packet)
-            encoded_content_length = b""
-            while content_length > 0:
-                encoded_content_length = (content_length % 10).to_bytes(
-                    1, "big"
-                ) + encoded_content_length
-                content_length //= 10
-
-            encoded_payload += (
-                b"\x00"  # Binrary Key
-                + encoded_content_length
-                + b"\xff"
-                + encoded_packet.encode()
-            )
+            # The content length is counted in bytes, as the decoder reads it.
+            encoded_packet = packet.encode(json_serialize=json_serialize).encode()
+
+            # Binrary Key + Content length (as digits) + Separator
+            encoded_payload.append(0)
+            encoded_payload.extend(int(x) for x in str(len(encoded_packet)))
+            encoded_payload.append(0xFF)
+            encoded_payload.extend(encoded_packet)
+
         if jsonp_index is not None:
-            encoded_payload = (
-                b"___eio["
-                + jsonp_index.encode()
-                + b"]("
-                + encoded_payload.replace(b'"', b'\\"')
-                + b");"
+            return b"".join(
+                (
+                    b"___eio[",
+                    jsonp_index.encode(),
+                    b"](",
+                    encoded_payload.replace(b'"', b'\\"'),
+                    b");",
+                )
             )
-        return encoded_payload
+        return bytes(encoded_payload)
 
     @classmethod
-    def decode(cls, encoded_payload: bytes):
+    def decode(cls, encoded_payload: bytes, json_serialize=None):
         if len(encoded_payload) == 0:
             return
 
         # JSONP POST payload starts with 'd='
         if encoded_payload.startswith(b"d="):
-            encoded_payload = parse_qs(encoded_payload)[b"d"][0]
+            # The form is parsed as string, because `parse_qs` encodes the bytes result in ASCII.
+            encoded_payload = parse_qs(encoded_payload.decode())["d"][0].encode()
 
+        # The payload is walked with a cursor(index) instead of splitting the remaining payload.
         is_binrary = encoded_payload.find(b"\xff") > -1
         packets = []
         index = 0
+        length = len(encoded_payload)
 
         if not is_binrary:
             encoded_payload = encoded_payload.decode("utf-8")
-            while index < len(encoded_payload):
-                content_length, content = encoded_payload[index:].split(":", maxsplit=1)
-                packets.append(Packet.decode(content[: int(content_length)]))
-                index += int(content_length)
+            length = len(encoded_payload)
+            while index < length:
+                separator = encoded_payload.find(":", index)
+                if separator == -1:
+                    break
+
+                content_length = int(encoded_payload[index:separator])
+                index = separator + 1
+                packets.append(
+                    Packet.decode(
+                        encoded_payload[index : index + content_length],
+                        json_serialize=json_serialize,
+                    )
+                )
+                index += content_length
         else:
-            while index < len(encoded_payload):
-                is_binrary = int(encoded_payload[index])
+            view = memoryview(encoded_payload)
+            while index < length:
+                is_binrary = view[index]
                 index += 1
 
-                raw_content_length, content = encoded_payload[index:].split(
-                    b"\xff", maxsplit=1
-                )
+                separator = encoded_payload.find(b"\xff", index)
+                if separator == -1:
+                    break
 
-                index += len(raw_content_length) + 1
-                content_length = functools.reduce(
-                    lambda d, s: d * 10 + s, raw_content_length
-                )
+                content_length = 0
+                for digit in view[index:separator]:
+                    content_length = content_length * 10 + digit
+                index = separator + 1
 
                 # Binrary is not supported. (TODO)
                 if not is_binrary:
-                    content = content[: int(content_length)].decode("utf-8")
-                    packets.append(Packet.decode(content))
-                index += int(content_length)
+                    content = str(view[index : index + content_length], "utf-8")
+                    packets.append(
+                        Packet.decode(content, json_serialize=json_serialize)
+                    )
+                index += content_length
+            view.release()
         return cls(packets=packets)
@@ -0,0 +1,154 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import aiohttp
+import logging
+
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+_log = logging.getLogger(__name__)
+
+
+class PoolStatistics(NamedTuple):
+    """Represents a snapshot of the connection pool."""
+
+    limit: int
+    limit_per_host: int
+    acquired: int
+    idle: int
+    hosts: int
+    closed: bool
+
+
+class ConnectionPool:
+    """Represents a connection pool shared by the HTTP sessions and the gateways.
+
+    A single :class:`aiohttp.TCPConnector` is shared by every session created from this pool,
+    so all connections reuse one keep-alive pool, TLS context and DNS cache.
+
+    Parameters
+    ----------
+    limit : int
+        The total number of simultaneous connections, by default 100
+    limit_per_host : int
+        The number of simultaneous connections to the same endpoint, by default 0 (no limit)
+    keepalive_timeout : float
+        Seconds to keep an idle connection in the pool, by default 30.0
+    ttl_dns_cache : Optional[int]
+        Seconds to cache resolved DNS entries, by default 300.
+        If the value is None, resolved entries are cached forever.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """A connector shared by every session.
+        The connector is created at first access, so it should be accessed in an asynchronous context.
+        """
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+        return self._connector
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """A session without base url, used by the gateway (polling and websocket transport)."""
+        if self._session is None or self._session.closed:
+            self._session = self.create_session()
+        return self._session
+
+    def create_session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        """Create a new :class:`aiohttp.ClientSession` that borrows the shared connector.
+        Closing the returned session does not close the shared connector."""
+        return aiohttp.ClientSession(
+            connector=self.connector, connector_owner=False, **kwargs
+        )
+
+    def session_options(self) -> dict[str, Any]:
+        """Returns keyword arguments to create a session based on this pool.
+        Used with :class:`ahttp_client.Session` which creates the session by itself."""
+        return {"connector": self.connector, "connector_owner": False}
+
+    @property
+    def is_closed(self) -> bool:
+        """Indicates if the connection pool is closed."""
+        return self._connector is None or self._connector.closed
+
+    def stats(self) -> PoolStatistics:
+        """Returns the current state of the connection pool."""
+        connector = self._connector
+        if connector is None:
+            return PoolStatistics(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                acquired=0,
+                idle=0,
+                hosts=0,
+                closed=True,
+            )
+
+        # aiohttp does not provide public API to inspect the pool.
+        idle_connections = getattr(connector, "_conns", dict())
+        acquired_connections = getattr(connector, "_acquired", set())
+        return PoolStatistics(
+            limit=connector.limit,
+            limit_per_host=connector.limit_per_host,
+            acquired=len(acquired_connections),
+            idle=sum(len(x) for x in idle_connections.values()),
+            hosts=len(idle_connections),
+            closed=connector.closed,
+        )
+
+    async def close(self):
+        """Close the shared session and the shared connector."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        _log.debug("Connection pool closed.")
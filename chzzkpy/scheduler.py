@@ -0,0 +1,203 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from typing import Any, Callable, Coroutine, Generic, Hashable, Optional, TypeVar
+
+_log = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DelayScheduler(Generic[K]):
+    """Represents an internal scheduler running a callback for each key after a delay.
+    (used by :class:`LiveStatusPoller` and :class:`TokenRefreshScheduler`)
+
+    The scheduled keys are kept in a heap ordered by the due time,
+    and the number of concurrent callbacks is limited by `max_concurrency`.
+    Scheduling a key again replaces the previous entry by increasing the generation of the key.
+    The callback receives the key and the generation,
+    and the generation is used to reschedule the key with :meth:`reschedule`.
+
+    Parameters
+    ----------
+    callback : Callable[[K, int], Coroutine[Any, Any, Any]]
+        A coroutine function called with the key and its generation when the key is due.
+    max_concurrency : int
+        The maximum number of concurrent callbacks, by default 1
+    name : str
+        The name of the background task, by default "chzzk.py: scheduler"
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[K, int], Coroutine[Any, Any, Any]],
+        max_concurrency: int = 1,
+        name: str = "chzzk.py: scheduler",
+    ):
+        self.callback = callback
+        self.name = name
+
+        self._generations: dict[K, int] = dict()
+        self._schedule: list[tuple[float, int, K, int]] = []
+        self._sequence = 0
+        self._generation = 0
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running_tasks: set[asyncio.Task] = set()
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._generations
+
+    @property
+    def keys(self) -> list[K]:
+        """The scheduled keys."""
+        return list(self._generations.keys())
+
+    @property
+    def is_running(self) -> bool:
+        """Indicates if the scheduler is running."""
+        return self._task is not None and not self._task.done()
+
+    def _push(self, key: K, generation: int, delay: float) -> None:
+        self._sequence += 1
+        when = asyncio.get_running_loop().time() + max(delay, 0)
+        heapq.heappush(self._schedule, (when, self._sequence, key, generation))
+        if self._schedule[0][1] == self._sequence:
+            self._wakeup.set()
+
+    def schedule(self, key: K, delay: float) -> int:
+        """Schedule the key. The previous entry of the key is replaced.
+
+        Parameters
+        ----------
+        key : K
+            A key to schedule.
+        delay : float
+            The delay in seconds to call the callback.
+
+        Returns
+        -------
+        int
+            The generation of the key.
+        """
+        self._generation += 1
+        self._generations[key] = self._generation
+        self._push(key, self._generation, delay)
+        return self._generation
+
+    def reschedule(self, key: K, generation: int, delay: float) -> bool:
+        """Schedule the key again, only if the key is not removed or replaced.
+
+        Parameters
+        ----------
+        key : K
+            A key to schedule.
+        generation : int
+            The generation of the key received by the callback.
+        delay : float
+            The delay in seconds to call the callback.
+
+        Returns
+        -------
+        bool
+            False if the key has been removed or scheduled again.
+        """
+        if not self.is_current(key, generation):
+            return False
+        self._push(key, generation, delay)
+        return True
+
+    def is_current(self, key: K, generation: int) -> bool:
+        """Indicates if the generation is the latest generation of the key."""
+        return self._generations.get(key) == generation
+
+    def remove(self, key: K) -> None:
+        """Remove the key. The scheduled entries of the key are ignored.
+
+        Parameters
+        ----------
+        key : K
+            A key to remove.
+        """
+        self._generations.pop(key, None)
+
+    def start(self) -> asyncio.Task:
+        """Start the scheduler in background."""
+        if not self.is_running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name=self.name
+            )
+        return self._task
+
+    async def close(self) -> None:
+        """Stop the scheduler and cancel the running callbacks."""
+        tasks = list(self._running_tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            while len(self._schedule) > 0 and self._schedule[0][0] <= loop.time():
+                _, _, key, generation = heapq.heappop(self._schedule)
+                if not self.is_current(key, generation):
+                    continue
+
+                await self._semaphore.acquire()
+                # The key may have been removed while waiting for a free slot.
+                if not self.is_current(key, generation):
+                    self._semaphore.release()
+                    continue
+
+                task = loop.create_task(self._call(key, generation))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._running_tasks.discard)
+
+            delay = None
+            if len(self._schedule) > 0:
+                delay = self._schedule[0][0] - loop.time()
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _call(self, key: K, generation: int) -> None:
+        try:
+            await self.callback(key, generation)
+        except Exception:
+            _log.exception("Failed to run the scheduled callback of %s", key)
+        finally:
+            self._semaphore.release()
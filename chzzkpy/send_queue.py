@@ -0,0 +1,239 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from .enums import MessagePriority
+from .error import TooManyRequestsException
+
+_log = logging.getLogger(__name__)
+
+
+class _QueuedItem:
+    __slots__ = ("func", "key", "future", "attempt")
+
+    def __init__(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        key: Optional[Hashable],
+        future: asyncio.Future,
+    ):
+        self.func = func
+        self.key = key
+        self.future = future
+        self.attempt = 0
+
+
+class SendQueue:
+    """Represents an outbound queue sending messages at the rate allowed by the server.
+
+    Messages are sent by the order of :class:`MessagePriority`,
+    and the sending rate is limited by a token bucket refilled every `interval` seconds.
+    (The interval follows the slow mode of chat, but it is not less than `min_interval`.)
+    Duplicated messages waiting in the queue are coalesced into one request.
+
+    Parameters
+    ----------
+    send : Callable[[str], Awaitable[Any]]
+        A coroutine function to send a message.
+    slow_mode : float
+        The slow mode of chat in seconds, by default 0
+    min_interval : float
+        The minimum interval between messages in seconds, by default 0.5
+    burst : int
+        The number of messages that can be sent without waiting, by default 1
+    max_retries : int
+        The number of retries when the server responds with 429 status code, by default 3
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        slow_mode: float = 0,
+        min_interval: float = 0.5,
+        burst: int = 1,
+        max_retries: int = 3,
+    ):
+        self._send = send
+        self.slow_mode = slow_mode
+        self.min_interval = min_interval
+        self.burst = burst
+        self.max_retries = max_retries
+
+        self._tokens = float(burst)
+        self._last_refill: Optional[float] = None
+
+        self._queue: list[tuple[int, int, _QueuedItem]] = []
+        self._pending: dict[Hashable, _QueuedItem] = dict()
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def interval(self) -> float:
+        """The interval between messages in seconds."""
+        return max(self.slow_mode, self.min_interval)
+
+    @property
+    def pending(self) -> int:
+        """The number of messages waiting in the queue."""
+        return len(self._queue)
+
+    def send(
+        self, content: str, priority: MessagePriority = MessagePriority.NORMAL
+    ) -> asyncio.Future:
+        """Queue a message.
+
+        Parameters
+        ----------
+        content : str
+            A content of message.
+        priority : MessagePriority
+            The priority of message, by default MessagePriority.NORMAL
+
+        Returns
+        -------
+        asyncio.Future
+            A future resolved with the result of `send` function, when the message is accepted.
+            When the same content is waiting in the queue, returns the future of the queued message.
+        """
+        return self.schedule(lambda: self._send(content), priority, key=content)
+
+    def schedule(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        priority: MessagePriority = MessagePriority.NORMAL,
+        key: Optional[Hashable] = None,
+    ) -> asyncio.Future:
+        """Queue a request sharing the rate limit of messages. (ex. moderation)
+
+        Parameters
+        ----------
+        func : Callable[[], Awaitable[Any]]
+            A function to make a request.
+        priority : MessagePriority
+            The priority of request, by default MessagePriority.NORMAL
+        key : Optional[Hashable]
+            A key to coalesce the requests waiting in the queue.
+
+        Returns
+        -------
+        asyncio.Future
+            A future resolved with the result of `func`, when the request is accepted.
+        """
+        if key is not None and key in self._pending.keys():
+            return self._pending[key].future
+
+        loop = asyncio.get_running_loop()
+        item = _QueuedItem(func, key, loop.create_future())
+        if key is not None:
+            self._pending[key] = item
+        self._push(int(priority), item)
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(), name="chzzk.py: send queue")
+        return item.future
+
+    def _push(self, priority: int, item: _QueuedItem) -> None:
+        self._sequence += 1
+        heapq.heappush(self._queue, (priority, self._sequence, item))
+        self._wakeup.set()
+
+    def _acquire_delay(self, now: float) -> float:
+        if self._last_refill is None:
+            self._last_refill = now
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._last_refill) / self.interval,
+        )
+        self._last_refill = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) * self.interval
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if len(self._queue) == 0:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            delay = self._acquire_delay(loop.time())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            priority, sequence, item = heapq.heappop(self._queue)
+            if item.future.cancelled():
+                self._remove_pending(item)
+                continue
+
+            try:
+                result = await item.func()
+            except TooManyRequestsException as exc:
+                item.attempt += 1
+                if item.attempt > self.max_retries:
+                    self._remove_pending(item)
+                    if not item.future.done():
+                        item.future.set_exception(exc)
+                    continue
+
+                # Back off, and send the message again before the other messages.
+                _log.debug("Too many requests. Retry after %s seconds.", self.interval)
+                self._tokens = 0
+                await asyncio.sleep(self.interval * (2 ** (item.attempt - 1)))
+                heapq.heappush(self._queue, (priority, sequence, item))
+                continue
+            except Exception as exc:
+                self._remove_pending(item)
+                if not item.future.done():
+                    item.future.set_exception(exc)
+                continue
+
+            self._remove_pending(item)
+            if not item.future.done():
+                item.future.set_result(result)
+
+    def _remove_pending(self, item: _QueuedItem) -> None:
+        if item.key is not None and self._pending.get(item.key) is item:
+            self._pending.pop(item.key)
+
+    async def close(self) -> None:
+        """Cancel the queued messages and stop the queue."""
+        for _, _, item in self._queue:
+            item.future.cancel()
+        self._queue.clear()
+        self._pending.clear()
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
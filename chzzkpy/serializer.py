@@ -0,0 +1,83 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+
+from typing import Any, Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+class JSONBackend:
+    """Represents a JSON backend used to decode and encode the gateway packets.
+    The default backend uses the standard :mod:`json` module."""
+
+    name: str = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+class OrjsonBackend(JSONBackend):
+    """Represents a JSON backend based on `orjson` package."""
+
+    name: str = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ModuleNotFoundError("orjson is not installed.")
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+
+def get_json_backend(backend: Optional[str | JSONBackend] = None) -> JSONBackend:
+    """Get JSON backend.
+
+    Parameters
+    ----------
+    backend : Optional[str | JSONBackend]
+        A name of JSON backend ("json", "orjson") or an instance of :class:`JSONBackend`.
+        If the backend is empty, `orjson` is used when installed, otherwise the standard :mod:`json` module.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+
+    if backend is None:
+        return JSONBackend() if orjson is None else OrjsonBackend()
+    elif backend == JSONBackend.name:
+        return JSONBackend()
+    elif backend == OrjsonBackend.name:
+        return OrjsonBackend()
+    raise ValueError(f"Unknown JSON backend: {backend}")
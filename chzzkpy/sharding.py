@@ -0,0 +1,475 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, NamedTuple, Optional, TYPE_CHECKING
+
+from .authorization import AccessToken
+from .client import BaseEventManager, Client
+from .flags import UserPermission
+from .message import Donation, Message, Subscription
+from .token_refresh import TokenStore
+
+if TYPE_CHECKING:
+    from multiprocessing.context import SpawnProcess
+
+    from .client import UserClient
+    from .dispatcher import EventDispatcher
+
+_log = logging.getLogger(__name__)
+
+# The events forwarded from shards, with the model to validate in the parent process.
+_FORWARDABLE_EVENTS = {
+    "chat": Message,
+    "donation": Donation,
+    "subscription": Subscription,
+}
+
+# An event sent by shards when an access token is refreshed.
+_TOKEN_REFRESH_EVENT = "token_refresh"
+
+
+class ShardInfo(NamedTuple):
+    """Represents a snapshot of the shard run by :class:`ShardManager`."""
+
+    shard_id: int
+    pid: Optional[int]
+    is_alive: bool
+    user_clients: int
+
+
+class _ShardTokenStore(TokenStore):
+    """Represents a token store sending refreshed access tokens to the parent process."""
+
+    def __init__(self, shard: _Shard):
+        self.shard = shard
+
+    async def save(self, user_client: UserClient, access_token: AccessToken) -> None:
+        key = self.shard.keys.get(user_client)
+        if key is None:
+            return
+        self.shard.events.put(
+            (
+                self.shard.shard_id,
+                _TOKEN_REFRESH_EVENT,
+                (key, access_token.model_dump(by_alias=True)),
+            )
+        )
+
+
+class _Shard:
+    """Represents a shard running in the worker process.
+    The shard connects a client session, and subscribes the events of user clients assigned by the parent process.
+    """
+
+    def __init__(
+        self,
+        shard_id: int,
+        client_id: str,
+        client_secret: str,
+        permission: UserPermission,
+        commands: multiprocessing.Queue,
+        events: multiprocessing.Queue,
+        setup: Optional[Callable[[Client], Any]],
+        forward_events: tuple[str, ...],
+    ):
+        self.shard_id = shard_id
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.permission = permission
+        self.commands = commands
+        self.events = events
+        self.setup = setup
+        self.forward_events = forward_events
+
+        self.client: Optional[Client] = None
+        self.keys: dict[UserClient, int] = dict()
+
+    def _forward(self, event: str) -> None:
+        # The decoded payload (`raw_` event) is forwarded without model validation.
+        async def handler(data: dict[str, Any]):
+            self.events.put((self.shard_id, event, data))
+
+        handler.__name__ = "on_raw_" + event
+        self.client.event(handler)
+
+    @property
+    def session_key(self) -> Optional[str]:
+        # The session key is changed when the gateway is reconnected.
+        for gateway in self.client._gateway.values():
+            return gateway.session_key
+        return None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.client = Client(
+            self.client_id, self.client_secret, token_store=_ShardTokenStore(self)
+        )
+        async with self.client:
+            for event in self.forward_events:
+                self._forward(event)
+            await self._setup()
+
+            await self.client.connect(addition_connect=True, reconnect=True)
+            while True:
+                command = await loop.run_in_executor(None, self.commands.get)
+                if command is None:
+                    break
+                await self._add_user_clients(command)
+
+    async def _setup(self) -> None:
+        if self.setup is None:
+            return
+        result = self.setup(self.client)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _add_user_clients(self, raw_access_tokens: dict[int, dict[str, Any]]):
+        subscriptions = dict()
+        for key, raw_access_token in raw_access_tokens.items():
+            access_token = AccessToken.model_validate(raw_access_token)
+            try:
+                user_client = await self.client.get_user_client(access_token)
+            except Exception:
+                _log.exception(
+                    "Failed to get the user client in shard %s", self.shard_id
+                )
+                continue
+            self.keys[user_client] = key
+            subscriptions[user_client] = self.permission
+
+        failed = await self.client.bulk_subscribe(subscriptions, self.session_key)
+        for user_client, exception in failed.items():
+            _log.warning(
+                "Failed to subscribe events of %s in shard %s: %s",
+                user_client.channel_id,
+                self.shard_id,
+                exception,
+            )
+
+
+def _run_shard(*args: Any) -> None:
+    shard = _Shard(*args)
+    try:
+        asyncio.run(shard.run())
+    except KeyboardInterrupt:
+        return
+
+
+class ShardManager(BaseEventManager):
+    """Represents a supervisor running user clients across worker processes (shards).
+
+    Each shard runs its own event loop, :class:`Client` and gateway, and the user clients
+    are assigned to the shard with the fewest user clients.
+    The events received by shards are forwarded to the parent process and dispatched by this manager.
+    The forwarded messages are intended to store data only, so use `setup` to handle events
+    (such as replying to chat) in the worker process.
+
+    When a shard dies, a new shard is started if `respawn` is True,
+    and the user clients of the dead shard are assigned to the other shards again.
+    When no shard is alive, the user clients are kept pending until a shard becomes alive.
+
+    Parameters
+    ----------
+    client_id : str
+        A client ID of the Open API application.
+    client_secret : str
+        A client secret of the Open API application.
+    shard_count : Optional[int]
+        The number of shards, by default the number of CPUs.
+    permission : Optional[UserPermission]
+        The events to subscribe for each user client, by default all events.
+    setup : Optional[Callable[[Client], Any]]
+        A function or a coroutine function called with the :class:`Client` of the shard in the worker process,
+        before the client is connected.
+        It must be picklable (a module-level function), because shards are started with `spawn` method.
+    forward_events : tuple[str, ...]
+        The events forwarded to the parent process, by default ("chat", "donation", "subscription")
+    respawn : bool
+        Whether to start a new shard when a shard dies, by default True
+    monitor_interval : float
+        The interval in seconds to check whether shards are alive, by default 1.0
+    dispatcher : Optional[EventDispatcher]
+        A dispatcher to schedule the event handlers in the parent process.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        shard_count: Optional[int] = None,
+        permission: Optional[UserPermission] = None,
+        setup: Optional[Callable[[Client], Any]] = None,
+        forward_events: tuple[str, ...] = ("chat", "donation", "subscription"),
+        respawn: bool = True,
+        monitor_interval: float = 1.0,
+        dispatcher: Optional[EventDispatcher] = None,
+    ):
+        super().__init__(None, dispatcher=dispatcher)
+        for event in forward_events:
+            if event not in _FORWARDABLE_EVENTS:
+                raise ValueError(f"{event!r} event can't be forwarded.")
+
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.shard_count = shard_count or multiprocessing.cpu_count()
+        self.permission = permission or UserPermission.all()
+        self.setup = setup
+        self.forward_events = tuple(forward_events)
+        self.respawn = respawn
+        self.monitor_interval = monitor_interval
+
+        self._context = multiprocessing.get_context("spawn")
+        self._events: multiprocessing.Queue = self._context.Queue()
+        self._processes: dict[int, SpawnProcess] = dict()
+        self._commands: dict[int, multiprocessing.Queue] = dict()
+
+        # The access tokens are keyed to follow refreshed tokens of shards.
+        self._access_tokens: dict[int, AccessToken] = dict()
+        self._assignment: dict[int, set[int]] = dict()
+        # The user clients waiting for an alive shard.
+        self._pending: set[int] = set()
+        self._key = 0
+
+        self._closed = True
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._reader_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Indicates if the manager is closed."""
+        return self._closed
+
+    def shards(self) -> list[ShardInfo]:
+        """Returns the snapshots of shards."""
+        return [
+            ShardInfo(
+                shard_id=shard_id,
+                pid=process.pid,
+                is_alive=process.is_alive(),
+                user_clients=len(self._assignment.get(shard_id, ())),
+            )
+            for shard_id, process in self._processes.items()
+        ]
+
+    @property
+    def pending_user_clients(self) -> int:
+        """The number of user clients waiting for an alive shard."""
+        return len(self._pending)
+
+    def add_user(self, access_token: AccessToken) -> None:
+        """Add a user client to the shard with the fewest user clients.
+        If the manager isn't started, the user client is assigned when :meth:`start` is called.
+
+        Parameters
+        ----------
+        access_token : AccessToken
+            A prepared instance of access token.
+        """
+        self._key += 1
+        self._access_tokens[self._key] = access_token
+        if not self.is_closed:
+            self._assign([self._key])
+
+    def _assign(self, keys: list[int]) -> None:
+        alive_shard_ids = [
+            shard_id
+            for shard_id, process in self._processes.items()
+            if process.is_alive()
+        ]
+        if len(alive_shard_ids) == 0:
+            _log.warning(
+                "There are no alive shards to assign user clients. "
+                "They are assigned when a shard becomes alive."
+            )
+            self._pending.update(keys)
+            return
+
+        keys = list(self._pending) + [key for key in keys if key not in self._pending]
+        self._pending.clear()
+
+        commands: dict[int, dict[int, dict[str, Any]]] = dict()
+        for key in keys:
+            shard_id = min(
+                alive_shard_ids, key=lambda x: len(self._assignment.get(x, ()))
+            )
+            self._assignment.setdefault(shard_id, set()).add(key)
+            commands.setdefault(shard_id, dict())[key] = self._access_tokens[
+                key
+            ].model_dump(by_alias=True)
+
+        for shard_id, command in commands.items():
+            self._commands[shard_id].put(command)
+
+    def _start_shard(self, shard_id: int) -> None:
+        commands = self._context.Queue()
+        process = self._context.Process(
+            target=_run_shard,
+            args=(
+                shard_id,
+                self.client_id,
+                self.client_secret,
+                self.permission,
+                commands,
+                self._events,
+                self.setup,
+                self.forward_events,
+            ),
+            name=f"chzzk.py: shard {shard_id}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[shard_id] = process
+        self._commands[shard_id] = commands
+        self._assignment[shard_id] = set()
+
+    async def start(self) -> None:
+        """Start the shards, and assign the added user clients to them."""
+        if not self.is_closed:
+            return
+
+        self.loop = asyncio.get_running_loop()
+        self._closed = False
+        for shard_id in range(self.shard_count):
+            self._start_shard(shard_id)
+        self._assign(list(self._access_tokens.keys()))
+
+        self._reader_thread = threading.Thread(
+            target=self._read_events, name="chzzk.py: shard event reader", daemon=True
+        )
+        self._reader_thread.start()
+        self._monitor_task = self.loop.create_task(
+            self._monitor(), name="chzzk.py: shard monitor"
+        )
+
+    def run(self) -> None:
+        """Start the shards, and block until the manager is closed."""
+
+        async def runner():
+            await self.start()
+            try:
+                await self._monitor_task
+            finally:
+                await self.close()
+
+        try:
+            asyncio.run(runner())
+        except KeyboardInterrupt:
+            return
+
+    async def close(self) -> None:
+        """Stop the shards."""
+        if self.is_closed:
+            return
+        self._closed = True
+
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            await asyncio.gather(self._monitor_task, return_exceptions=True)
+            self._monitor_task = None
+
+        for commands in self._commands.values():
+            commands.put(None)
+        for process in self._processes.values():
+            await self.loop.run_in_executor(None, process.join, 5.0)
+            if process.is_alive():
+                process.terminate()
+
+        # Wake up the reader thread.
+        self._events.put(None)
+        await self.loop.run_in_executor(None, self._reader_thread.join)
+        self._reader_thread = None
+
+        self._processes = dict()
+        self._commands = dict()
+        self._assignment = dict()
+        # All user clients are assigned again by :meth:`start`.
+        self._pending = set()
+        await self.dispatcher.close()
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            for shard_id, process in list(self._processes.items()):
+                if process.is_alive() or self.is_closed:
+                    continue
+
+                _log.warning(
+                    "Shard %s exited with code %s.", shard_id, process.exitcode
+                )
+                keys = list(self._assignment.pop(shard_id, ()))
+                self._processes.pop(shard_id)
+                self._commands.pop(shard_id)
+                self.dispatch("shard_died", shard_id)
+
+                if self.respawn:
+                    self._start_shard(shard_id)
+                self._assign(keys)
+
+            # The pending user clients are assigned when a shard becomes alive.
+            if len(self._pending) > 0 and any(
+                process.is_alive() for process in self._processes.values()
+            ):
+                self._assign([])
+
+    def _read_events(self) -> None:
+        # The events are read in a thread, and handed to the event loop in batches.
+        while True:
+            item = self._events.get()
+            items = [item]
+            try:
+                while item is not None and len(items) < 256:
+                    item = self._events.get_nowait()
+                    items.append(item)
+            except queue.Empty:
+                pass
+
+            self.loop.call_soon_threadsafe(self._handle_events, items)
+            if item is None:
+                return
+
+    def _handle_events(self, items: list[Optional[tuple[int, str, Any]]]) -> None:
+        for item in items:
+            if item is None:
+                return
+
+            shard_id, event, data = item
+            if event == _TOKEN_REFRESH_EVENT:
+                key, raw_access_token = data
+                if key in self._access_tokens:
+                    self._access_tokens[key] = AccessToken.model_validate(
+                        raw_access_token
+                    )
+                continue
+
+            if self.has_listener("raw_" + event):
+                self.dispatch("raw_" + event, data)
+            if self.has_listener(event):
+                self.dispatch(event, _FORWARDABLE_EVENTS[event].model_validate(data))
@@ -25,11 +25,12 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import json
 from typing import Callable, Any, TYPE_CHECKING, Optional
 
 from .enums import EnginePacketType, SocketPacketType
-from .message import Donation, Subscription, Message
+from .lite import LiteDonation, LiteMessage, LiteMessageable, LiteSubscription
+from .message import Donation, Subscription, Message, Messageable
+from .serializer import JSONBackend, get_json_backend
 from .session import EventSubscribeMessage
 
 if TYPE_CHECKING:
@@ -47,8 +48,12 @@ class ConnectionState:
         variable_access_token: Optional[Callable[..., AccessToken]] = None,
         json_serializer: Optional[Callable[..., dict[str, Any]]] = None,
         debug_mode: bool = False,
+        json_backend: Optional[JSONBackend] = None,
+        has_listener: Optional[Callable[[str], bool]] = None,
+        lite_messages: bool = False,
     ):
         self.dispatch = dispatch
+        self.has_listener = has_listener or self.__always_listen
         self.handler = handler
         self.http = http
 
@@ -63,7 +68,12 @@ class ConnectionState:
         self.access_token = access_token
 
         self.variable_access_token = variable_access_token or self.__dummy_method
-        self.json_serializer = json_serializer or json.loads
+        self.json_backend = json_backend or get_json_backend()
+        self.json_serializer = json_serializer or self.json_backend.loads
+        self.lite_messages = lite_messages
+
+        # The payloads are validated from JSON by pydantic-core, unless a custom serializer is given.
+        self.validate_json = json_serializer is None
 
         for _, func in inspect.getmembers(self):
             if hasattr(func, "__gateway_parsing__") and func.__gateway_parsing__:
@@ -79,6 +89,10 @@ class ConnectionState:
     def __dummy_method(payload):
         return payload
 
+    @staticmethod
+    def __always_listen(_: str) -> bool:
+        return True
+
     @staticmethod
     def gateway_parsable(
         engine_packet_type: EnginePacketType,
@@ -171,35 +185,66 @@ class ConnectionState:
             await self.call_handler("channel_id_invoked", event_message.channel_id)
         return
 
-    @event_parsable("chat")
-    async def _handle_chat(self, raw_data):
+    def _handle_message(
+        self,
+        event: str,
+        raw_data: Any,
+        model: type[Messageable],
+        lite_model: type[LiteMessageable],
+    ) -> None:
+        # Messages are decoded only when someone listens to the event.
+        # The `raw_` event receives the decoded dictionary without model validation.
+        has_listener = self.has_listener(event)
+        has_raw_listener = self.has_listener("raw_" + event)
+        if not has_listener and not has_raw_listener:
+            return
+
+        # Without the `raw_` listener, the payload string is validated to the model
+        # directly, skipping the intermediate dictionary.
+        if (
+            self.validate_json
+            and not has_raw_listener
+            and not self.lite_messages
+            and isinstance(raw_data, (str, bytes))
+        ):
+            message = model.model_validate_json(raw_data)
+            message._state = self
+            message._access_token = self.access_token or self.variable_access_token(
+                message.channel
+            )
+            self.dispatch(event, message)
+            return
+
         data = self.json_serializer(raw_data)
-        message = Message.model_validate(data)
-        message._state = self
-        message._access_token = self.access_token or self.variable_access_token(
-            message.channel
+        if has_raw_listener:
+            self.dispatch("raw_" + event, data)
+
+        if not has_listener:
+            return
+
+        access_token = self.access_token or self.variable_access_token(
+            data.get("channelId")
         )
-        self.dispatch("chat", message)
+        if self.lite_messages:
+            message = lite_model(data, state=self, access_token=access_token)
+        else:
+            message = model.model_validate(data)
+            message._state = self
+            message._access_token = access_token
+        self.dispatch(event, message)
+        return
+
+    @event_parsable("chat")
+    async def _handle_chat(self, raw_data):
+        self._handle_message("chat", raw_data, Message, LiteMessage)
         return
 
     @event_parsable("donation")
     async def _handle_donation(self, raw_data):
-        data = self.json_serializer(raw_data)
-        message = Donation.model_validate(data)
-        message._state = self
-        message._access_token = self.access_token or self.variable_access_token(
-            message.channel
-        )
-        self.dispatch("donation", message)
+        self._handle_message("donation", raw_data, Donation, LiteDonation)
         return
 
     @event_parsable("subscription")
     async def _handle_subscription(self, raw_data):
-        data = self.json_serializer(raw_data)
-        message = Subscription.model_validate(data)
-        message._state = self
-        message._access_token = self.access_token or self.variable_access_token(
-            message.channel
-        )
-        self.dispatch("subscription", message)
+        self._handle_message("subscription", raw_data, Subscription, LiteSubscription)
         return
@@ -0,0 +1,763 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import operator
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple, Optional
+
+from ..client import Client
+from ..enums import EnginePacketType, SocketPacketType, get_enum
+from ..gateway import ChzzkGateway
+from ..lite import LiteDonation, LiteMessage, LiteMessageable
+from ..message import Donation, Message
+from ..packet import Packet
+from ..payload import Payload
+from ..serializer import JSONBackend, OrjsonBackend, get_json_backend, orjson
+from ..unofficial.chat import ChatClient
+from ..unofficial.chat.access_token import AccessToken
+from ..unofficial.chat.enums import ChatCmd, ChatType
+from ..unofficial.chat.enums import get_enum as get_chat_enum
+from ..unofficial.chat.lite import (
+    LiteChatMessage,
+    LiteDonationMessage,
+    LiteMessageDetail,
+)
+from ..unofficial.chat.message import ChatMessage, DonationMessage
+from ..unofficial.chat.profile import ProfileCache
+from .chat_server import FakeChatServer
+from .session_server import FakeSessionServer
+
+try:
+    import resource
+except ModuleNotFoundError:
+    # The resource module is not available on Windows.
+    resource = None
+
+
+class BenchmarkResult(NamedTuple):
+    """Represents the result of benchmark."""
+
+    name: str
+    events: int
+    elapsed: float
+    p50_latency: float
+    p99_latency: float
+    max_rss: Optional[int]
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        max_rss = (
+            "unknown" if self.max_rss is None else f"{self.max_rss / 1024:.1f} MiB"
+        )
+        return (
+            f"{self.name}: {self.events} events in {self.elapsed:.2f}s "
+            f"({self.events_per_second:.0f} events/s), "
+            f"p50 latency {self.p50_latency * 1000:.3f}ms, "
+            f"p99 latency {self.p99_latency * 1000:.3f}ms, "
+            f"max RSS {max_rss}"
+        )
+
+
+class ModelBenchmarkResult(NamedTuple):
+    """Represents the result of message model benchmark."""
+
+    name: str
+    messages: int
+    cpu_time: float
+    allocated: int
+
+    @property
+    def cpu_time_per_message(self) -> float:
+        return self.cpu_time / self.messages if self.messages > 0 else 0.0
+
+    @property
+    def allocated_per_message(self) -> float:
+        return self.allocated / self.messages if self.messages > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.cpu_time_per_message * 1e6:.2f}us/message, "
+            f"{self.allocated_per_message:.0f} bytes/message"
+        )
+
+
+class CodecBenchmarkResult(NamedTuple):
+    """Represents the result of packet codec benchmark."""
+
+    name: str
+    operations: int
+    cpu_time: float
+
+    @property
+    def cpu_time_per_operation(self) -> float:
+        return self.cpu_time / self.operations if self.operations > 0 else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.cpu_time_per_operation * 1e9:.0f}ns/packet"
+
+
+def max_rss() -> Optional[int]:
+    """Returns the peak resident set size of the process in KiB."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def summarize(name: str, latencies: list[float], elapsed: float) -> BenchmarkResult:
+    """Summarize the latencies in seconds to :class:`BenchmarkResult`."""
+    if len(latencies) >= 2:
+        quantiles = statistics.quantiles(latencies, n=100)
+        p50, p99 = quantiles[49], quantiles[98]
+    else:
+        p50 = p99 = latencies[0] if len(latencies) > 0 else 0.0
+    return BenchmarkResult(name, len(latencies), elapsed, p50, p99, max_rss())
+
+
+def _sent_at(message: Any) -> int:
+    if isinstance(message, (LiteMessageable, LiteMessageDetail)):
+        return message.raw["sentAt"]
+    return message.model_extra["sentAt"]
+
+
+async def benchmark_client(
+    events: int = 10000,
+    rate: float = 5000.0,
+    connections: int = 1,
+    websocket: bool = True,
+    json_backend: Optional[str] = None,
+    timeout: float = 60.0,
+    lite_messages: bool = False,
+) -> BenchmarkResult:
+    """Measure the throughput and dispatch latency of the official :class:`Client`
+    with :class:`FakeSessionServer`.
+
+    Parameters
+    ----------
+    events : int
+        The number of events sent to each connection, by default 10000
+    rate : float
+        The number of events per second sent to each connection, by default 5000.0
+    connections : int
+        The number of gateway connections, by default 1
+    websocket : bool
+        Whether to use the websocket transport, by default True
+    json_backend : Optional[str]
+        A JSON backend of the client.
+    timeout : float
+        The maximum seconds to wait for all events, by default 60.0
+    lite_messages : bool
+        Whether to dispatch the lightweight messages, by default False
+    """
+    expected = events * connections
+    latencies: list[float] = []
+    finished = asyncio.Event()
+
+    client = Client(
+        "benchmark",
+        "benchmark",
+        json_backend=json_backend,
+        lite_messages=lite_messages,
+    )
+
+    async def on_event(message: Any) -> None:
+        received_at = time.perf_counter_ns()
+        latencies.append((received_at - _sent_at(message)) / 1e9)
+        if len(latencies) >= expected:
+            finished.set()
+
+    for event in ("chat", "donation", "subscription"):
+        on_event.__name__ = "on_" + event
+        client.event(on_event)
+
+    async with FakeSessionServer(
+        rate=rate, total_events=events, websocket=websocket
+    ) as server:
+        await client._async_setup_hook()
+        started_at = time.perf_counter()
+        gateways = []
+        for _ in range(connections):
+            gateway = await ChzzkGateway.connect(
+                url=server.url,
+                state=client._connection,
+                loop=client.loop,
+                session=client.connection_pool.session,
+            )
+            gateway.read_in_background(client._backpressure)
+            gateways.append(gateway)
+
+        try:
+            await asyncio.wait_for(finished.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - started_at
+
+        for gateway in gateways:
+            await gateway.disconnect()
+        await client.close()
+    name = "official client" + (" (lite)" if lite_messages else "")
+    return summarize(name, latencies, elapsed)
+
+
+async def benchmark_chat_client(
+    events: int = 10000,
+    rate: float = 5000.0,
+    batch_size: int = 1,
+    json_backend: Optional[str] = None,
+    timeout: float = 60.0,
+    lite_messages: bool = False,
+) -> BenchmarkResult:
+    """Measure the throughput and dispatch latency of the unofficial :class:`ChatClient`
+    with :class:`FakeChatServer`.
+
+    Parameters
+    ----------
+    events : int
+        The number of messages sent to the client, by default 10000
+    rate : float
+        The number of messages per second sent to the client, by default 5000.0
+    batch_size : int
+        The maximum number of messages in a command, by default 1
+    json_backend : Optional[str]
+        A JSON backend of the client.
+    timeout : float
+        The maximum seconds to wait for all messages, by default 60.0
+    lite_messages : bool
+        Whether to dispatch the lightweight messages, by default False
+    """
+    latencies: list[float] = []
+    finished = asyncio.Event()
+
+    async with FakeChatServer(
+        rate=rate, total_messages=events, batch_size=batch_size
+    ) as server:
+        client = ChatClient(
+            "benchmark",
+            chat_channel_id="benchmark",
+            json_backend=json_backend,
+            chat_url=server.url,
+            lite_messages=lite_messages,
+        )
+
+        async def on_event(message: Any) -> None:
+            received_at = time.perf_counter_ns()
+            latencies.append((received_at - _sent_at(message)) / 1e9)
+            if len(latencies) >= events:
+                finished.set()
+
+        for event in ("chat", "donation", "subscription", "system_message"):
+            on_event.__name__ = "on_" + event
+            client.event(on_event)
+
+        # The access token and live status are not requested to the API server.
+        client.access_token = AccessToken.model_validate(
+            {
+                "accessToken": "benchmark",
+                "temporaryRestrict": {"temporaryRestrict": False, "times": 0},
+                "realNameAuth": False,
+                "extraToken": "benchmark",
+            }
+        )
+        await client._async_setup_hook()
+        started_at = time.perf_counter()
+        polling = client.loop.create_task(client.polling())
+
+        try:
+            await asyncio.wait_for(finished.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - started_at
+
+        polling.cancel()
+        await client.close()
+    name = "chat client" + (" (lite)" if lite_messages else "")
+    return summarize(name, latencies, elapsed)
+
+
+def _measure_model(
+    name: str,
+    construct: Callable[[dict[str, Any]], Any],
+    attribute: str,
+    data: list[dict[str, Any]],
+) -> ModelBenchmarkResult:
+    # Reading an attribute is included, as event handlers usually do.
+    # The CPU time and the allocation are measured in separate passes,
+    # because tracemalloc slows down the allocation.
+    getter = operator.attrgetter(attribute)
+    started_at = time.process_time()
+    for x in data:
+        getter(construct(x))
+    cpu_time = time.process_time() - started_at
+
+    messages = []
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for x in data:
+            message = construct(x)
+            getter(message)
+            messages.append(message)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ModelBenchmarkResult(name, len(data), cpu_time, after - before)
+
+
+def benchmark_models(messages: int = 10000) -> list[ModelBenchmarkResult]:
+    """Measure the CPU time and the retained allocation per message
+    of the pydantic message models and the lightweight messages.
+
+    Parameters
+    ----------
+    messages : int
+        The number of messages to construct for each model, by default 10000
+    """
+    session_server = FakeSessionServer()
+    session_server.event_weights = {"CHAT": 1.0}
+    official_chats = [session_server.generate_event()[1] for _ in range(messages)]
+    session_server.event_weights = {"DONATION": 1.0}
+    official_donations = [session_server.generate_event()[1] for _ in range(messages)]
+
+    # The official client receives the payload of event as JSON string.
+    json_backend = get_json_backend()
+    official_payloads = [json_backend.dumps(x) for x in official_chats]
+
+    chat_server = FakeChatServer()
+    chats = [
+        chat_server.generate_message("benchmark", ChatType.TEXT)
+        for _ in range(messages)
+    ]
+    donations = [
+        chat_server.generate_message("benchmark", ChatType.DONATION)
+        for _ in range(messages)
+    ]
+
+    profile_cache = ProfileCache()
+    return [
+        _measure_model("Message", Message.model_validate, "content", official_chats),
+        _measure_model("LiteMessage", LiteMessage, "content", official_chats),
+        _measure_model(
+            "Message (loads + validate)",
+            lambda x: Message.model_validate(json_backend.loads(x)),
+            "content",
+            official_payloads,
+        ),
+        _measure_model(
+            "Message (validate JSON)",
+            Message.model_validate_json,
+            "content",
+            official_payloads,
+        ),
+        _measure_model(
+            "Donation", Donation.model_validate, "pay_amount", official_donations
+        ),
+        _measure_model("LiteDonation", LiteDonation, "pay_amount", official_donations),
+        _measure_model("ChatMessage", ChatMessage.model_validate, "content", chats),
+        _measure_model(
+            "ChatMessage (profile cache)",
+            lambda x: ChatMessage.model_validate(
+                x, context={"profile_cache": profile_cache}
+            ),
+            "content",
+            chats,
+        ),
+        _measure_model("LiteChatMessage", LiteChatMessage, "content", chats),
+        _measure_model(
+            "DonationMessage",
+            DonationMessage.model_validate,
+            "extras.pay_amount",
+            donations,
+        ),
+        _measure_model(
+            "LiteDonationMessage", LiteDonationMessage, "pay_amount", donations
+        ),
+    ]
+
+
+def _linear_get_enum(cls: type[Any], val: Any) -> Any:
+    # The previous implementation of get_enum, as a baseline.
+    enum_val = [i for i in cls if i.value == val]
+    if len(enum_val) == 0:
+        return val
+    return enum_val[0]
+
+
+def _legacy_decode_packet(payload: str, json_serialize: Callable[[str], Any]) -> Any:
+    # The previous implementation of Packet.decode slicing the payload per field, as a baseline.
+    # The enum lookups are measured separately, so get_enum is shared with Packet.decode.
+    engine_packet_type = get_enum(EnginePacketType, int(payload[0]))
+    if engine_packet_type != EnginePacketType.MESSAGE:
+        try:
+            data = json_serialize(payload[1:])
+            if isinstance(data, int):
+                raise ValueError
+        except ValueError:
+            data = payload[1:]
+        return Packet(engine_packet_type, None, data)
+
+    payload = payload[1:]
+    socket_packet_type = get_enum(SocketPacketType, int(payload[0:1]))
+    data = payload[1:]
+    if len(data) == 0:
+        return Packet(engine_packet_type, socket_packet_type)
+
+    attachment_separator = data.find("-")
+    if attachment_separator > 0 and data[0:attachment_separator].isdigit():
+        data = data[attachment_separator + 1 :]
+
+    namespace = None
+    if len(data) > 0 and data.startswith("/"):
+        namespace_separtor = data.find(",")
+        if namespace_separtor == -1:
+            namespace = data
+            data = str()
+        else:
+            namespace = data[0:namespace_separtor]
+            data = data[namespace_separtor + 1 :]
+
+        query = namespace.find("?")
+        if query >= 0:
+            namespace = namespace[0:query]
+
+    packet_id = None
+    if len(data) > 0 and data[0].isdigit():
+        packet_id = 0
+        while len(data) > 0 and data[0].isdigit():
+            packet_id = packet_id * 10 + int(data[0])
+            data = data[1:]
+
+    if len(data) > 0:
+        data = json_serialize(data)
+    return Packet(
+        engine_packet_type,
+        socket_packet_type,
+        data,
+        packet_id=packet_id,
+        namespace=namespace,
+    )
+
+
+def _legacy_decode_payload(
+    encoded_payload: bytes, json_serialize: Callable[[str], Any]
+) -> list[Any]:
+    # The previous implementation of Payload.decode splitting the remaining payload, as a baseline.
+    packets = []
+    index = 0
+    while index < len(encoded_payload):
+        index += 1
+        raw_content_length, content = encoded_payload[index:].split(b"\xff", maxsplit=1)
+        index += len(raw_content_length) + 1
+        content_length = functools.reduce(lambda d, s: d * 10 + s, raw_content_length)
+        content = content[:content_length].decode("utf-8")
+        packets.append(_legacy_decode_packet(content, json_serialize))
+        index += content_length
+    return packets
+
+
+def _legacy_encode_payload(
+    packets: list[Packet], json_serialize: Callable[[Any], str]
+) -> bytes:
+    # The previous implementation of Payload.encode concatenating bytes, as a baseline.
+    encoded_payload = b""
+    for packet in packets:
+        encoded_packet = packet.encode(json_serialize=json_serialize).encode()
+        content_length = len(encoded_packet)
+        encoded_content_length = b""
+        while content_length > 0:
+            encoded_content_length = (content_length % 10).to_bytes(
+                1, "big"
+            ) + encoded_content_length
+            content_length //= 10
+        encoded_payload += b"\x00" + encoded_content_length + b"\xff" + encoded_packet
+    return encoded_payload
+
+
+def _measure_codec(
+    name: str,
+    operation: Callable[[Any], Any],
+    data: list[Any],
+    packets_per_operation: int = 1,
+) -> CodecBenchmarkResult:
+    started_at = time.process_time()
+    for x in data:
+        operation(x)
+    return CodecBenchmarkResult(
+        name, len(data) * packets_per_operation, time.process_time() - started_at
+    )
+
+
+def benchmark_codec(packets: int = 100000) -> list[CodecBenchmarkResult]:
+    """Measure the CPU time per packet of the packet codec
+    and the enum lookups of each packet.
+    The previous codec (slicing the payload per field) is measured as a baseline.
+
+    Parameters
+    ----------
+    packets : int
+        The number of packets to decode, by default 100000
+    """
+    session_server = FakeSessionServer()
+    payloads = [
+        Packet(
+            EnginePacketType.MESSAGE,
+            SocketPacketType.EVENT,
+            list(session_server.generate_event()),
+        ).encode()
+        for _ in range(packets)
+    ]
+    json_backend = get_json_backend()
+
+    # A polling response carries the packets in a payload.
+    packets_per_payload = 16
+    payload_packets = [
+        [Packet.decode(x) for x in payloads[i : i + packets_per_payload]]
+        for i in range(0, len(payloads), packets_per_payload)
+    ]
+    encoded_payloads = [
+        Payload(x).encode(json_serialize=json_backend.dumps) for x in payload_packets
+    ]
+
+    # A packet is decoded with an engine packet type and a socket packet type.
+    packet_types = [(ord(payload[0]) - 48, int(payload[1])) for payload in payloads]
+    # A chat message is received with a command and a message type.
+    chat_server = FakeChatServer()
+    message_types = [
+        chat_server.generate_message("benchmark")["msgTypeCode"] for _ in range(packets)
+    ]
+    commands = [
+        ChatCmd.CHAT.value if x == ChatType.TEXT else ChatCmd.SPECIAL_CHAT.value
+        for x in message_types
+    ]
+
+    def lookup_packet_types(get_enum_func: Callable[..., Any]):
+        def operation(packet_type: tuple[int, int]):
+            get_enum_func(EnginePacketType, packet_type[0])
+            get_enum_func(SocketPacketType, packet_type[1])
+
+        return operation
+
+    return [
+        _measure_codec(
+            "Packet.decode (legacy)",
+            lambda x: _legacy_decode_packet(x, json_backend.loads),
+            payloads,
+        ),
+        _measure_codec(
+            "Packet.decode",
+            lambda x: Packet.decode(x, json_serialize=json_backend.loads),
+            payloads,
+        ),
+        _measure_codec(
+            "Payload.decode (legacy)",
+            lambda x: _legacy_decode_payload(x, json_backend.loads),
+            encoded_payloads,
+            packets_per_payload,
+        ),
+        _measure_codec(
+            "Payload.decode",
+            lambda x: Payload.decode(x, json_serialize=json_backend.loads),
+            encoded_payloads,
+            packets_per_payload,
+        ),
+        _measure_codec(
+            "Payload.encode (legacy)",
+            lambda x: _legacy_encode_payload(x, json_backend.dumps),
+            payload_packets,
+            packets_per_payload,
+        ),
+        _measure_codec(
+            "Payload.encode",
+            lambda x: Payload(x).encode(json_serialize=json_backend.dumps),
+            payload_packets,
+            packets_per_payload,
+        ),
+        _measure_codec(
+            "packet type lookup (linear)",
+            lookup_packet_types(_linear_get_enum),
+            packet_types,
+        ),
+        _measure_codec(
+            "packet type lookup (table)", lookup_packet_types(get_enum), packet_types
+        ),
+        _measure_codec(
+            "chat command lookup (linear)",
+            lambda x: _linear_get_enum(ChatCmd, x),
+            commands,
+        ),
+        _measure_codec(
+            "chat command lookup (table)",
+            lambda x: get_chat_enum(ChatCmd, x),
+            commands,
+        ),
+        _measure_codec(
+            "chat type lookup (linear)",
+            lambda x: _linear_get_enum(ChatType, x),
+            message_types,
+        ),
+        _measure_codec(
+            "chat type lookup (table)",
+            lambda x: get_chat_enum(ChatType, x),
+            message_types,
+        ),
+    ]
+
+
+def benchmark_json(events: int = 100000) -> list[CodecBenchmarkResult]:
+    """Measure the CPU time per event to parse and encode a CHAT event
+    with each JSON backend. (the standard :mod:`json` module and `orjson`)
+
+    A CHAT event is parsed twice: the socket.io frame, and the message string in the frame.
+
+    Parameters
+    ----------
+    events : int
+        The number of events to parse, by default 100000
+    """
+    session_server = FakeSessionServer()
+    session_server.event_weights = {"CHAT": 1.0}
+    stdlib = get_json_backend(JSONBackend.name)
+    events_data = [session_server.generate_event() for _ in range(events)]
+    frames = [
+        Packet(
+            EnginePacketType.MESSAGE,
+            SocketPacketType.EVENT,
+            [event, stdlib.dumps(data)],
+        ).encode(json_serialize=stdlib.dumps)
+        for event, data in events_data
+    ]
+
+    backends = [stdlib]
+    if orjson is not None:
+        backends.append(get_json_backend(OrjsonBackend.name))
+
+    def parse_event(json_backend: JSONBackend):
+        def operation(frame: str):
+            packet = Packet.decode(frame, json_serialize=json_backend.loads)
+            json_backend.loads(packet.data[1])
+
+        return operation
+
+    def encode_event(json_backend: JSONBackend):
+        def operation(event: tuple[str, dict[str, Any]]):
+            Packet(
+                EnginePacketType.MESSAGE,
+                SocketPacketType.EVENT,
+                [event[0], json_backend.dumps(event[1])],
+            ).encode(json_serialize=json_backend.dumps)
+
+        return operation
+
+    results = []
+    for json_backend in backends:
+        results.append(
+            _measure_codec(
+                f"parse event ({json_backend.name})", parse_event(json_backend), frames
+            )
+        )
+    for json_backend in backends:
+        results.append(
+            _measure_codec(
+                f"encode event ({json_backend.name})",
+                encode_event(json_backend),
+                events_data,
+            )
+        )
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m chzzkpy.testing.benchmark",
+        description="Benchmark chzzk.py with the local stand-in servers.",
+    )
+    parser.add_argument(
+        "--target",
+        choices=("official", "chat", "models", "codec", "json"),
+        default="official",
+        help=(
+            "benchmark the official client, the unofficial chat client, "
+            "the message models, the packet codec or the JSON backends"
+        ),
+    )
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--rate", type=float, default=5000.0)
+    parser.add_argument("--connections", type=int, default=1)
+    parser.add_argument("--polling", action="store_true", help="use polling transport")
+    parser.add_argument(
+        "--batch-size", type=int, default=1, help="messages per chat command"
+    )
+    parser.add_argument("--json-backend", default=None)
+    parser.add_argument(
+        "--lite", action="store_true", help="dispatch the lightweight messages"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    if args.target == "codec":
+        for result in benchmark_codec(packets=args.events):
+            print(result)
+        return
+
+    if args.target == "json":
+        for result in benchmark_json(events=args.events):
+            print(result)
+        return
+
+    if args.target == "models":
+        for result in benchmark_models(messages=args.events):
+            print(result)
+        return
+
+    if args.target == "chat":
+        benchmark = benchmark_chat_client(
+            events=args.events,
+            rate=args.rate,
+            batch_size=args.batch_size,
+            json_backend=args.json_backend,
+            timeout=args.timeout,
+            lite_messages=args.lite,
+        )
+    else:
+        benchmark = benchmark_client(
+            events=args.events,
+            rate=args.rate,
+            connections=args.connections,
+            websocket=not args.polling,
+            json_backend=args.json_backend,
+            timeout=args.timeout,
+            lite_messages=args.lite,
+        )
+    print(asyncio.run(benchmark))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+import time
+import uuid
+from typing import Any, Optional
+
+from aiohttp import web
+
+from ..serializer import JSONBackend, get_json_backend
+from ..unofficial.chat.enums import ChatCmd, ChatType
+
+_log = logging.getLogger(__name__)
+
+
+class _FakeChatSession:
+    def __init__(self, websocket: web.WebSocketResponse):
+        self.sid = uuid.uuid4().hex
+        self.websocket = websocket
+        self.chat_channel_id: Optional[str] = None
+        self.tasks: list[asyncio.Task] = []
+
+
+class FakeChatServer:
+    """Represents a local stand-in server of the chat websocket (`kr-ss*.chat.naver.com`).
+
+    The server speaks the `ChatCmd` protocol: it replies `CONNECTED` to `CONNECT`,
+    `RECENT_CHAT` to `REQUEST_RECENT_CHAT`, echoes `SEND_CHAT` as `CHAT`, answers `PING` with `PONG`,
+    and sends `PING` periodically.
+    After connecting, it replays a realistic mix of messages at `rate` messages per second:
+    text chats in `CHAT` command, donations, subscriptions and system messages in `SPECIAL_CHAT` command,
+    and occasional `NOTICE`, `BLIND` and `EVENT` (mission donation) commands.
+    Each synthetic message has a `sentAt` field with :func:`time.perf_counter_ns` at the time it was sent.
+
+    Parameters
+    ----------
+    host : str
+        A host to bind, by default "127.0.0.1"
+    port : int
+        A port to bind, by default 0 (a random free port)
+    rate : float
+        The number of messages per second sent to each session, by default 100.0
+        If the value is 0, no messages are sent automatically.
+    total_messages : Optional[int]
+        The number of messages sent to each session, by default None (unlimited)
+    message_weights : Optional[dict[ChatType, float]]
+        The weights of message types,
+        by default 94% text, 3% donation, 1% subscription and 2% system message.
+    viewers : Optional[int]
+        The number of chatters sending messages, by default 1000
+        If the value is None, every message is sent by a new chatter.
+    batch_size : int
+        The maximum number of messages in a `CHAT` or `SPECIAL_CHAT` command, by default 1
+    extra_command_ratio : float
+        The ratio of `NOTICE`, `BLIND` and `EVENT` commands to messages, by default 0.01
+    ping_interval : float
+        The interval in seconds to send `PING` command, by default 20.0
+    json_backend : Optional[str | JSONBackend]
+        A JSON backend to encode messages.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate: float = 100.0,
+        total_messages: Optional[int] = None,
+        message_weights: Optional[dict[ChatType, float]] = None,
+        viewers: Optional[int] = 1000,
+        batch_size: int = 1,
+        extra_command_ratio: float = 0.01,
+        ping_interval: float = 20.0,
+        json_backend: Optional[str | JSONBackend] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.total_messages = total_messages
+        self.message_weights = message_weights or {
+            ChatType.TEXT: 0.94,
+            ChatType.DONATION: 0.03,
+            ChatType.SUBSCRIPTION: 0.01,
+            ChatType.SYSTEM_MESSAGE: 0.02,
+        }
+        self.viewers = viewers
+        self.batch_size = batch_size
+        self.extra_command_ratio = extra_command_ratio
+        self.ping_interval = ping_interval
+        self.json_backend = get_json_backend(json_backend)
+
+        self.sessions: dict[str, _FakeChatSession] = dict()
+        self._sequence = itertools.count()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """A websocket URL to pass to `chat_url` parameter of :class:`ChatClient`."""
+        return f"ws://{self.host}:{self.port}/chat"
+
+    async def __aenter__(self) -> FakeChatServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the server."""
+        app = web.Application()
+        app.router.add_route("GET", "/chat", self._handle_websocket)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # The bound port is used, when a random port is requested.
+        self.port = self._runner.addresses[0][1]
+        _log.debug("Fake chat server is listening on %s", self.url)
+
+    async def close(self) -> None:
+        """Close all sessions and stop the server."""
+        for session in list(self.sessions.values()):
+            await session.websocket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def send_command(
+        self, cmd: ChatCmd, body: Any, sid: Optional[str] = None
+    ) -> None:
+        """Send a command to the sessions.
+
+        Parameters
+        ----------
+        cmd : ChatCmd
+            The command to send.
+        body : Any
+            The body (`bdy`) of command.
+        sid : Optional[str]
+            The session ID to send. If the value is None, the command is sent to all sessions.
+        """
+        sessions = self.sessions.values() if sid is None else [self.sessions[sid]]
+        for session in list(sessions):
+            await self._send(session, cmd, body)
+
+    async def _send(
+        self, session: _FakeChatSession, cmd: ChatCmd, body: Any = None, **kwargs: Any
+    ) -> None:
+        data = {
+            "svcid": "game",
+            "ver": "2",
+            "cmd": cmd,
+            "cid": session.chat_channel_id,
+            "tid": None,
+            "bdy": body,
+        }
+        data.update(kwargs)
+        await session.websocket.send_str(self.json_backend.dumps(data))
+
+    @staticmethod
+    def _profile(user_id: str) -> dict[str, Any]:
+        return {
+            "userIdHash": user_id,
+            "nickname": f"viewer {user_id[-6:]}",
+            "profileImageUrl": None,
+            "userRoleCode": "common_user",
+            "badge": None,
+            "title": None,
+            "verifiedMark": False,
+            "activityBadges": [],
+            "streamingProperty": {},
+        }
+
+    def generate_message(
+        self, chat_channel_id: str, message_type: Optional[ChatType] = None
+    ) -> dict[str, Any]:
+        """Generate a synthetic message in the format of `CHAT` and `SPECIAL_CHAT` command.
+
+        Parameters
+        ----------
+        chat_channel_id : str
+            The chat channel ID of message.
+        message_type : Optional[ChatType]
+            The type of message. If the value is None, the type is chosen with the weights.
+        """
+        if message_type is None:
+            message_type = random.choices(
+                list(self.message_weights.keys()), list(self.message_weights.values())
+            )[0]
+
+        sequence = next(self._sequence)
+        if self.viewers is None:
+            user_id = uuid.uuid4().hex
+        else:
+            user_id = f"{random.randrange(self.viewers):032x}"
+        now = int(time.time() * 1000)
+        extras: dict[str, Any] = {
+            "chatType": "STREAMING",
+            "emojis": {},
+            "osType": random.choice(["PC", "AOS", "IOS"]),
+            "streamingChannelId": chat_channel_id,
+        }
+        content = f"synthetic message {sequence}"
+        profile: Optional[dict[str, Any]] = self._profile(user_id)
+
+        if message_type == ChatType.DONATION:
+            pay_amount = random.choice([1000, 5000, 10000, 50000])
+            extras = {
+                "isAnonymous": random.random() < 0.2,
+                "payType": "CURRENCY",
+                "payAmount": pay_amount,
+                "donationType": random.choice(["CHAT", "VIDEO"]),
+                "weeklyRankList": [],
+                "verifiedMark": False,
+            }
+            content = f"synthetic donation {sequence}"
+        elif message_type == ChatType.SUBSCRIPTION:
+            extras = {
+                "month": random.randint(1, 36),
+                "tierName": "tier",
+                "nickname": profile["nickname"],
+                "tierNo": random.choice([1, 2]),
+            }
+            content = f"synthetic subscription {sequence}"
+        elif message_type == ChatType.SYSTEM_MESSAGE:
+            extras = {
+                "description": "{registerNickname} restricted {targetNickname}.",
+                "styleType": 1,
+                "visibleRoles": ["common_user"],
+                "params": {
+                    "registerNickname": "manager",
+                    "targetNickname": profile["nickname"],
+                },
+            }
+            content = ""
+            profile = None
+            user_id = "SYSTEM_MESSAGE"
+
+        return {
+            "svcid": "game",
+            "cid": chat_channel_id,
+            "mbrCnt": random.randint(1, 100000),
+            "uid": user_id,
+            "profile": "{}" if profile is None else self.json_backend.dumps(profile),
+            "msg": content,
+            "msgTypeCode": message_type,
+            "msgStatusType": "NORMAL",
+            "extras": self.json_backend.dumps(extras),
+            "ctime": now,
+            "utime": now,
+            "msgTime": now,
+            "sentAt": time.perf_counter_ns(),
+        }
+
+    def _generate_extra_command(self, chat_channel_id: str) -> tuple[ChatCmd, Any]:
+        cmd = random.choice([ChatCmd.NOTICE, ChatCmd.BLIND, ChatCmd.EVENT])
+        now = int(time.time() * 1000)
+        user_id = uuid.uuid4().hex
+        if cmd == ChatCmd.NOTICE:
+            extras = {
+                "chatType": "STREAMING",
+                "emojis": {},
+                "osType": "PC",
+                "streamingChannelId": chat_channel_id,
+                "registerProfile": self._profile(uuid.uuid4().hex),
+            }
+            return cmd, {
+                "serviceId": "game",
+                "channelId": chat_channel_id,
+                "userId": user_id,
+                "profile": self.json_backend.dumps(self._profile(user_id)),
+                "content": "synthetic notice",
+                "messageTypeCode": ChatType.TEXT,
+                "extras": self.json_backend.dumps(extras),
+                "createTime": now,
+                "messageTime": now,
+            }
+        elif cmd == ChatCmd.BLIND:
+            return cmd, {
+                "serviceId": "game",
+                "messageTime": now,
+                "blindType": "CBOTBLIND",
+                "blindUserId": None,
+                "userId": user_id,
+                "message": None,
+            }
+        return cmd, {
+            "type": "DONATION_MISSION_IN_PROGRESS",
+            "payType": "CURRENCY",
+            "payAmount": 1000,
+            "donationType": "MISSION",
+            "missionDonationId": uuid.uuid4().hex,
+            "missionText": "synthetic mission",
+            "totalPayAmount": 1000,
+            "donationId": uuid.uuid4().hex,
+            "participationCount": 1,
+            "missionCreatedTime": "2025-01-01 00:00:00",
+            "durationTime": 60,
+            "status": "PENDING",
+        }
+
+    async def _traffic(self, session: _FakeChatSession) -> None:
+        # The messages due since started are sent at once, so high rates don't depend on sleep precision.
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        sent = 0
+        while self.total_messages is None or sent < self.total_messages:
+            due = int((loop.time() - started_at) * self.rate) + 1
+            if self.total_messages is not None:
+                due = min(due, self.total_messages)
+
+            while sent < due:
+                count = min(self.batch_size, due - sent)
+                messages = [
+                    self.generate_message(session.chat_channel_id) for _ in range(count)
+                ]
+                chats = [x for x in messages if x["msgTypeCode"] == ChatType.TEXT]
+                special_chats = [
+                    x for x in messages if x["msgTypeCode"] != ChatType.TEXT
+                ]
+                if len(chats) > 0:
+                    await self._send(session, ChatCmd.CHAT, chats)
+                if len(special_chats) > 0:
+                    await self._send(session, ChatCmd.SPECIAL_CHAT, special_chats)
+                if random.random() < self.extra_command_ratio * count:
+                    await self._send(
+                        session, *self._generate_extra_command(session.chat_channel_id)
+                    )
+                sent += count
+            await asyncio.sleep(max(1 / self.rate, 0.001))
+
+    async def _ping(self, session: _FakeChatSession) -> None:
+        while not session.websocket.closed:
+            await asyncio.sleep(self.ping_interval)
+            await self._send(session, ChatCmd.PING)
+
+    async def _handle_command(
+        self, session: _FakeChatSession, data: dict[str, Any]
+    ) -> None:
+        cmd = data.get("cmd")
+        body = data.get("bdy") or dict()
+        loop = asyncio.get_running_loop()
+
+        if cmd == ChatCmd.CONNECT:
+            session.chat_channel_id = data.get("cid")
+            await self._send(
+                session,
+                ChatCmd.CONNECTED,
+                {"sid": session.sid, "uuid": body.get("uid")},
+                retCode=0,
+                retMsg="SUCCESS",
+            )
+            session.tasks.append(loop.create_task(self._ping(session)))
+            if self.rate > 0:
+                session.tasks.append(loop.create_task(self._traffic(session)))
+        elif cmd == ChatCmd.PING:
+            await self._send(session, ChatCmd.PONG)
+        elif cmd == ChatCmd.REQUEST_RECENT_CHAT:
+            count = body.get("recentMessageCount", 50)
+            messages = [
+                self.generate_message(session.chat_channel_id, ChatType.TEXT)
+                for _ in range(count)
+            ]
+            await self._send(
+                session,
+                ChatCmd.RECENT_CHAT,
+                {
+                    "messageList": [
+                        {
+                            "serviceId": x["svcid"],
+                            "channelId": x["cid"],
+                            "userId": x["uid"],
+                            "profile": x["profile"],
+                            "content": x["msg"],
+                            "messageTypeCode": x["msgTypeCode"],
+                            "messageStatusType": x["msgStatusType"],
+                            "extras": x["extras"],
+                            "createTime": x["ctime"],
+                            "updateTime": x["utime"],
+                            "messageTime": x["msgTime"],
+                            "memberCount": x["mbrCnt"],
+                        }
+                        for x in messages
+                    ],
+                    "userCount": len(self.sessions),
+                    "notice": None,
+                },
+            )
+        elif cmd == ChatCmd.SEND_CHAT:
+            message = self.generate_message(session.chat_channel_id, ChatType.TEXT)
+            message.update(
+                msg=body.get("msg", ""),
+                extras=body.get("extras", message["extras"]),
+                msgTime=body.get("msgTime", message["msgTime"]),
+            )
+            await self._send(session, ChatCmd.CHAT, [message])
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+
+        session = _FakeChatSession(websocket)
+        self.sessions[session.sid] = session
+        try:
+            async for message in websocket:
+                await self._handle_command(
+                    session, self.json_backend.loads(message.data)
+                )
+        finally:
+            self.sessions.pop(session.sid, None)
+            for task in session.tasks:
+                task.cancel()
+        return websocket
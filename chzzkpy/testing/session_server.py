@@ -0,0 +1,365 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+import time
+import uuid
+from typing import Any, Optional
+
+from aiohttp import web
+
+from ..enums import EnginePacketType, SocketPacketType
+from ..packet import Packet
+from ..payload import Payload
+from ..serializer import JSONBackend, get_json_backend
+
+_log = logging.getLogger(__name__)
+
+
+class _FakeSession:
+    def __init__(self, sid: str, session_key: str):
+        self.sid = sid
+        self.session_key = session_key
+        self.queue: asyncio.Queue[Packet] = asyncio.Queue()
+        self.websocket: Optional[web.WebSocketResponse] = None
+        self.traffic_task: Optional[asyncio.Task] = None
+        self.closed = asyncio.Event()
+
+
+class FakeSessionServer:
+    """Represents a local stand-in server of the Open API session (socket.io over engine.io v3).
+
+    The server implements the polling to websocket upgrade handshake expected by :class:`ChzzkGateway`,
+    sends the `connected` system message, and replays synthetic `CHAT`, `DONATION` and `SUBSCRIPTION`
+    events at `rate` events per second to each session.
+    Each synthetic event has a `sentAt` field with :func:`time.perf_counter_ns` at the time it was queued.
+
+    Parameters
+    ----------
+    host : str
+        A host to bind, by default "127.0.0.1"
+    port : int
+        A port to bind, by default 0 (a random free port)
+    rate : float
+        The number of events per second sent to each session, by default 100.0
+        If the value is 0, no events are sent automatically.
+    total_events : Optional[int]
+        The number of events sent to each session, by default None (unlimited)
+    event_weights : Optional[dict[str, float]]
+        The weights of event types, by default 90% chat, 8% donation and 2% subscription.
+    websocket : bool
+        Whether to allow upgrading to the websocket transport, by default True
+    ping_interval : int
+        The ping interval in milliseconds advertised to the client, by default 25000
+    ping_timeout : int
+        The ping timeout in milliseconds advertised to the client, by default 20000
+    json_backend : Optional[str | JSONBackend]
+        A JSON backend to encode packets.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate: float = 100.0,
+        total_events: Optional[int] = None,
+        event_weights: Optional[dict[str, float]] = None,
+        websocket: bool = True,
+        ping_interval: int = 25000,
+        ping_timeout: int = 20000,
+        json_backend: Optional[str | JSONBackend] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.total_events = total_events
+        self.event_weights = event_weights or {
+            "CHAT": 0.9,
+            "DONATION": 0.08,
+            "SUBSCRIPTION": 0.02,
+        }
+        self.websocket = websocket
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.json_backend = get_json_backend(json_backend)
+
+        self.sessions: dict[str, _FakeSession] = dict()
+        self._sequence = itertools.count()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """A session URL to pass to :meth:`ChzzkGateway.connect`."""
+        return f"http://{self.host}:{self.port}/?auth=fake"
+
+    async def __aenter__(self) -> FakeSessionServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the server."""
+        app = web.Application()
+        app.router.add_route("GET", "/socket.io/", self._handle_get)
+        app.router.add_route("POST", "/socket.io/", self._handle_post)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # The bound port is used, when a random port is requested.
+        self.port = self._runner.addresses[0][1]
+        _log.debug("Fake session server is listening on %s", self.url)
+
+    async def close(self) -> None:
+        """Close all sessions and stop the server."""
+        for session in list(self.sessions.values()):
+            await self._close_session(session)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def send_event(
+        self, event: str, data: dict[str, Any], sid: Optional[str] = None
+    ) -> None:
+        """Send an event to the sessions.
+
+        Parameters
+        ----------
+        event : str
+            The event name, such as `CHAT` or `DONATION`.
+        data : dict[str, Any]
+            The event data.
+        sid : Optional[str]
+            The session ID to send. If the value is None, the event is sent to all sessions.
+        """
+        sessions = self.sessions.values() if sid is None else [self.sessions[sid]]
+        for session in sessions:
+            session.queue.put_nowait(self._event_packet(event, data))
+
+    def _event_packet(self, event: str, data: dict[str, Any]) -> Packet:
+        # The data of event is a JSON string in the Open API session.
+        return Packet(
+            EnginePacketType.MESSAGE,
+            SocketPacketType.EVENT,
+            [event, self.json_backend.dumps(data)],
+        )
+
+    def generate_event(self) -> tuple[str, dict[str, Any]]:
+        """Generate a synthetic event with the weights of event types."""
+        event = random.choices(
+            list(self.event_weights.keys()), list(self.event_weights.values())
+        )[0]
+        sequence = next(self._sequence)
+        channel_id = f"channel{sequence % 16:02d}"
+        user_id = f"user{random.randrange(10000):04d}"
+        data: dict[str, Any] = {"channelId": channel_id}
+
+        if event == "CHAT":
+            data.update(
+                senderChannelId=user_id,
+                profile={"nickname": user_id, "badges": [], "verifiedMark": False},
+                content=f"synthetic message {sequence}",
+                messageTime=int(time.time() * 1000),
+            )
+        elif event == "DONATION":
+            data.update(
+                donationType=random.choice(["CHAT", "VIDEO"]),
+                donatorChannelId=user_id,
+                donatorNickname=user_id,
+                payAmount=random.choice([1000, 5000, 10000]),
+                donationText=f"synthetic donation {sequence}",
+            )
+        elif event == "SUBSCRIPTION":
+            data.update(
+                subscriberChannelId=user_id,
+                subscriberNickname=user_id,
+                tierNo=random.choice([1, 2]),
+                tierName="tier",
+                month=random.randint(1, 24),
+            )
+        data["sentAt"] = time.perf_counter_ns()
+        return event, data
+
+    async def _traffic(self, session: _FakeSession) -> None:
+        # The events due since started are queued at once, so high rates don't depend on sleep precision.
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        sent = 0
+        while self.total_events is None or sent < self.total_events:
+            due = int((loop.time() - started_at) * self.rate) + 1
+            if self.total_events is not None:
+                due = min(due, self.total_events)
+            for _ in range(due - sent):
+                session.queue.put_nowait(self._event_packet(*self.generate_event()))
+            sent = due
+            await asyncio.sleep(max(1 / self.rate, 0.001))
+
+    def _connected(self, session: _FakeSession) -> None:
+        session.queue.put_nowait(
+            Packet(EnginePacketType.MESSAGE, SocketPacketType.CONNECT)
+        )
+        session.queue.put_nowait(
+            self._event_packet(
+                "SYSTEM",
+                {"type": "connected", "data": {"sessionKey": session.session_key}},
+            )
+        )
+        if self.rate > 0:
+            session.traffic_task = asyncio.get_running_loop().create_task(
+                self._traffic(session)
+            )
+
+    def _open_packet(self, session: _FakeSession) -> Packet:
+        return Packet(
+            EnginePacketType.OPEN,
+            data={
+                "sid": session.sid,
+                "upgrades": ["websocket"] if self.websocket else [],
+                "pingInterval": self.ping_interval,
+                "pingTimeout": self.ping_timeout,
+            },
+        )
+
+    def _new_session(self) -> _FakeSession:
+        session = _FakeSession(uuid.uuid4().hex, uuid.uuid4().hex)
+        self.sessions[session.sid] = session
+        return session
+
+    async def _close_session(self, session: _FakeSession) -> None:
+        self.sessions.pop(session.sid, None)
+        session.closed.set()
+        if session.traffic_task is not None:
+            session.traffic_task.cancel()
+        if session.websocket is not None:
+            await session.websocket.close()
+
+    async def _handle_packet(self, session: _FakeSession, packet: Packet) -> None:
+        if packet.engine_packet_type == EnginePacketType.PING:
+            session.queue.put_nowait(Packet(EnginePacketType.PONG, data=packet.data))
+        elif packet.engine_packet_type == EnginePacketType.CLOSE or (
+            packet.socket_packet_type == SocketPacketType.DISCONNECT
+        ):
+            await self._close_session(session)
+
+    def _payload_response(self, packets: list[Packet]) -> web.Response:
+        payload = Payload(packets=packets)
+        return web.Response(body=payload.encode(json_serialize=self.json_backend.dumps))
+
+    async def _handle_get(self, request: web.Request) -> web.StreamResponse:
+        sid = request.query.get("sid")
+        transport = request.query.get("transport")
+        if sid is not None and sid not in self.sessions:
+            return web.Response(status=400, text="Unknown sid")
+
+        if transport == "websocket":
+            return await self._handle_websocket(request, self.sessions.get(sid))
+
+        if sid is None:
+            session = self._new_session()
+            if not self.websocket:
+                self._connected(session)
+            return self._payload_response([self._open_packet(session)])
+
+        # Long polling: wait until a packet is queued.
+        session = self.sessions[sid]
+        waiter = asyncio.ensure_future(session.queue.get())
+        closed = asyncio.ensure_future(session.closed.wait())
+        await asyncio.wait(
+            [waiter, closed],
+            timeout=self.ping_interval / 1000,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        closed.cancel()
+        if not waiter.done():
+            waiter.cancel()
+            return self._payload_response([Packet(EnginePacketType.NOOP)])
+
+        packets = [waiter.result()]
+        while not session.queue.empty():
+            packets.append(session.queue.get_nowait())
+        return self._payload_response(packets)
+
+    async def _handle_post(self, request: web.Request) -> web.Response:
+        session = self.sessions.get(request.query.get("sid"))
+        if session is None:
+            return web.Response(status=400, text="Unknown sid")
+
+        payload = Payload.decode(
+            await request.read(), json_serialize=self.json_backend.loads
+        )
+        for packet in payload.packets if payload is not None else []:
+            await self._handle_packet(session, packet)
+        return web.Response(text="ok")
+
+    async def _handle_websocket(
+        self, request: web.Request, session: Optional[_FakeSession]
+    ) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+
+        if session is None:
+            # A direct websocket connection without polling handshake.
+            session = self._new_session()
+            await websocket.send_str(
+                self._open_packet(session).encode(self.json_backend.dumps)
+            )
+            self._connected(session)
+        session.websocket = websocket
+
+        writer = asyncio.get_running_loop().create_task(
+            self._write_websocket(session, websocket)
+        )
+        try:
+            async for message in websocket:
+                packet = Packet.decode(message.data, self.json_backend.loads)
+                if (
+                    packet.engine_packet_type == EnginePacketType.PING
+                    and packet.data == "probe"
+                ):
+                    await websocket.send_str(
+                        Packet(EnginePacketType.PONG, data="probe").encode()
+                    )
+                elif packet.engine_packet_type == EnginePacketType.UPGRADE:
+                    self._connected(session)
+                else:
+                    await self._handle_packet(session, packet)
+        finally:
+            writer.cancel()
+            await self._close_session(session)
+        return websocket
+
+    async def _write_websocket(
+        self, session: _FakeSession, websocket: web.WebSocketResponse
+    ) -> None:
+        while not websocket.closed:
+            packet = await session.queue.get()
+            await websocket.send_str(packet.encode(self.json_backend.dumps))
@@ -0,0 +1,154 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from .scheduler import DelayScheduler
+
+if TYPE_CHECKING:
+    from .authorization import AccessToken
+    from .client import Client, UserClient
+
+_log = logging.getLogger(__name__)
+
+
+class TokenStore:
+    """Represents a storage to persist refreshed access tokens.
+    The default implementation doesn't persist anything.
+    Override :meth:`save` to store access tokens in a database or a file.
+    """
+
+    async def save(self, user_client: UserClient, access_token: AccessToken) -> None:
+        """Called when the access token of user client is refreshed.
+
+        Parameters
+        ----------
+        user_client : UserClient
+            The user client that the access token is refreshed.
+            The :attr:`UserClient.channel_id` may be None when the channel ID isn't invoked yet.
+        access_token : AccessToken
+            The refreshed access token.
+        """
+        return
+
+
+class TokenRefreshScheduler:
+    """Represents a scheduler refreshing the access tokens of user clients before expiry.
+
+    Each access token is refreshed when `refresh_ratio` of its lifetime (`expires_in`) has passed.
+    The refresh time is spread by random `jitter` to avoid refreshing many tokens at once,
+    and the number of concurrent requests is limited by `max_concurrency`.
+
+    Parameters
+    ----------
+    client : Client
+        A client owning the user clients.
+    max_concurrency : int
+        The maximum number of concurrent refresh requests, by default 4
+    refresh_ratio : float
+        The ratio of token lifetime after which the token is refreshed, by default 0.8
+    jitter : float
+        The ratio of token lifetime to spread the refresh time, by default 0.1
+    retry_interval : float
+        The interval in seconds to retry a failed refresh, by default 60.0
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        max_concurrency: int = 4,
+        refresh_ratio: float = 0.8,
+        jitter: float = 0.1,
+        retry_interval: float = 60.0,
+    ):
+        self.client = client
+        self.refresh_ratio = refresh_ratio
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+
+        self._scheduler: DelayScheduler[UserClient] = DelayScheduler(
+            self._refresh,
+            max_concurrency=max_concurrency,
+            name="chzzk.py: token refresh scheduler",
+        )
+
+    def __contains__(self, user_client: UserClient) -> bool:
+        return user_client in self._scheduler
+
+    @property
+    def is_running(self) -> bool:
+        """Indicates if the scheduler is running."""
+        return self._scheduler.is_running
+
+    def _delay(self, user_client: UserClient) -> float:
+        lifetime = user_client.access_token.expires_in
+        ratio = self.refresh_ratio - random.uniform(0, self.jitter)
+        return lifetime * ratio - user_client.token_age
+
+    def add(self, user_client: UserClient) -> None:
+        """Schedule to refresh the access token of user client.
+        If the user client is already scheduled, it is rescheduled with its current access token.
+
+        Parameters
+        ----------
+        user_client : UserClient
+            A user client to refresh the access token.
+        """
+        self._scheduler.schedule(user_client, self._delay(user_client))
+        self.start()
+
+    def remove(self, user_client: UserClient) -> None:
+        """Stop refreshing the access token of user client.
+
+        Parameters
+        ----------
+        user_client : UserClient
+            A user client to stop refreshing.
+        """
+        self._scheduler.remove(user_client)
+
+    def start(self) -> asyncio.Task:
+        """Start the scheduler in background."""
+        return self._scheduler.start()
+
+    async def close(self) -> None:
+        """Stop the scheduler."""
+        await self._scheduler.close()
+
+    async def _refresh(self, user_client: UserClient, generation: int) -> None:
+        try:
+            # A refreshed user client is rescheduled by UserClient.refresh
+            await user_client.refresh()
+            return
+        except Exception:
+            _log.exception(
+                "Failed to refresh the access token of %s", user_client.channel_id
+            )
+
+        # The user client has been removed or added again while refreshing.
+        self._scheduler.reschedule(user_client, generation, self.retry_interval)
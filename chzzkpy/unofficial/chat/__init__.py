@@ -23,6 +23,8 @@ SOFTWARE.
 
 from .blind import Blind
 from .chat_client import ChatClient
+from .live_poller import LiveStatusPoller
+from .multi_client import MultiChatClient
 from .connected import ConnectedInfo
 from .donation import (
     DonationRank,
@@ -34,6 +36,7 @@ from .donation import (
 )
 from .enums import ChatType, ChatCmd
 from .error import *
+from .lite import LiteMessageDetail, LiteChatMessage, LiteDonationMessage
 from .message import (
     Message,
     MessageDetail,
@@ -53,5 +56,12 @@ from .message import (
     SystemExtra,
     SystemExtraParameter,
 )
-from .profile import Profile, ActivityBadge, StreamingProperty, Badge
+from .profile import (
+    Profile,
+    ActivityBadge,
+    StreamingProperty,
+    Badge,
+    ProfileCache,
+    ProfileCacheStatistics,
+)
 from .recent_chat import RecentChat
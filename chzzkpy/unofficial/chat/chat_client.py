@@ -25,14 +25,15 @@ from __future__ import annotations
 
 import aiohttp
 import asyncio
-import datetime
 import logging
 from typing import Any, Optional, Callable, Coroutine, Literal, TYPE_CHECKING
 
 from .enums import ChatCmd
-from .error import ChatConnectFailed
+from .error import ChatConnectFailed, ConnectionClosed
 from .gateway import ChzzkWebSocket, ReconnectWebsocket
 from .http import ChzzkAPIChatSession, NaverGameChatSession
+from .live_poller import LiveStatusPoller
+from .profile import ProfileCache
 from .state import ConnectionState
 from ..client import Client
 from ..error import LoginRequired
@@ -40,17 +41,24 @@ from ..manage.manage_client import ManageClient
 from ..user import PartialUser
 from ..live import LiveDetail, LiveStatus
 from ..http import ChzzkAPISession
+from ...client import BaseEventManager
+from ...enums import MessagePriority
+from ...send_queue import SendQueue
+from ...serializer import get_json_backend
 
 if TYPE_CHECKING:
     from .access_token import AccessToken
     from .message import ChatMessage
     from .profile import Profile
     from .recent_chat import RecentChat
+    from ...cache import ResponseCache
+    from ...dispatcher import EventDispatcher
+    from ...serializer import JSONBackend
 
 _log = logging.getLogger(__name__)
 
 
-class ChatClient(Client):
+class ChatClient(Client, BaseEventManager):
     """Represents a client to connect Chzzk (Naver Live Streaming).
     Addition, this class includes chat feature.
     """
@@ -62,10 +70,20 @@ class ChatClient(Client):
         session_key: Optional[str] = None,
         chat_channel_id: Optional[str] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        json_backend: Optional[str | JSONBackend] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        response_cache: Optional[ResponseCache] = None,
+        chat_url: Optional[str] = None,
+        lite_messages: bool = False,
+        profile_cache: Optional[ProfileCache] = None,
     ):
         super().__init__(
-            loop=loop, authorization_key=authorization_key, session_key=session_key
+            loop=loop,
+            authorization_key=authorization_key,
+            session_key=session_key,
+            response_cache=response_cache,
         )
+        BaseEventManager.__init__(self, self.loop, dispatcher=dispatcher)
 
         self.chat_channel_id: str = chat_channel_id
         self.channel_id: str = channel_id
@@ -73,28 +91,56 @@ class ChatClient(Client):
         self.user_id: Optional[str] = None
 
         self.ws_session = None
+        self.json_backend = get_json_backend(json_backend)
 
-        self.__authorization_key = authorization_key
-        self.__session_key = session_key
+        # A websocket URL of chat server, such as a local test server.
+        self.chat_url = chat_url
 
-        self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = (
-            dict()
-        )
-        self._extra_event: dict[str, list[Callable[..., Coroutine[Any, Any, Any]]]] = (
-            dict()
+        # The chat and donation messages are dispatched as LiteChatMessage and LiteDonationMessage.
+        self.lite_messages = lite_messages
+
+        # The profiles of repeat chatters are parsed once.
+        self.profile_cache = (
+            profile_cache if profile_cache is not None else ProfileCache()
         )
 
+        self.__authorization_key = authorization_key
+        self.__session_key = session_key
+
         self._ready = asyncio.Event()
 
         handler = {ChatCmd.CONNECTED: self._ready.set}
         self._connection = ConnectionState(
-            dispatch=self.dispatch, handler=handler, client=self
+            dispatch=self.dispatch,
+            handler=handler,
+            client=self,
+            json_backend=self.json_backend,
+            has_listener=self.has_listener,
+            lite_messages=self.lite_messages,
         )
         self._gateway: Optional[ChzzkWebSocket] = None
         self._status: Literal["OPEN", "CLOSE"] = None
+        self._slow_mode: Optional[int] = None
+
+        self.send_queue = SendQueue(self.send_chat)
+
+        # The live status is polled by LiveStatusPoller, instead of the websocket read loop.
+        self.live_status_poller: Optional[LiveStatusPoller] = None
+        self._chat_channel_updated = False
+
+        for event in (
+            "chat",
+            "donation",
+            "subscription",
+            "subscription_gift",
+            "system_message",
+        ):
+            self.set_waiter_key(event, lambda message: message.channel_id)
 
     def _session_initial_set(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        self._api_session = ChzzkAPIChatSession(loop=self.loop or loop)
+        self._api_session = ChzzkAPIChatSession(
+            loop=self.loop or loop, response_cache=self.response_cache
+        )
         self._game_session = NaverGameChatSession(loop=self.loop or loop)
 
         self.ws_session = aiohttp.ClientSession(loop=self.loop or loop)
@@ -177,57 +223,73 @@ class ChatClient(Client):
 
             self.chat_channel_id = status.chat_channel_id
             self._status = status.status
+            self._slow_mode = status.chat_slow_mode_sec
+            self.send_queue.slow_mode = status.chat_slow_mode_sec
 
-        if self._game_session.has_login:
+        if self._game_session.has_login and self.user_id is None:
             user = await self.user()
-            print(user)
             self.user_id = user.user_id_hash
 
         if self.access_token is None:
             await self._generate_access_token()
 
+        if self.live_status_poller is None:
+            self.live_status_poller = LiveStatusPoller(
+                self, dispatch=self._dispatch_live_status
+            )
+        self.live_status_poller.add_channel(
+            self.channel_id,
+            status=self._status,
+            chat_channel_id=self.chat_channel_id,
+            slow_mode=self._slow_mode,
+        )
+        self.live_status_poller.start()
+
         await self.polling()
 
     async def close(self):
         """Close the connection to chzzk."""
         self._ready.clear()
 
+        if self.live_status_poller is not None:
+            self.live_status_poller.remove_channel(self.channel_id)
+            if self._session_owner:
+                await self.live_status_poller.close()
+
+        await self.send_queue.close()
         if self._gateway is not None:
             await self._gateway.close()
 
-        if self.ws_session is not None:
+        if self._session_owner and self.ws_session is not None:
             await self.ws_session.close()
+        if self._session_owner:
+            # The dispatcher of a channel joined by MultiChatClient is owned by the parent client.
+            await self.dispatcher.close()
         await super().close()
 
-    async def _confirm_live_status(self):
-        live_status = await self.live_status(channel_id=self.channel_id)
-        if live_status is None:
-            raise ChatConnectFailed.channel_is_null(self.channel_id)
-
-        if self._status != live_status.status:
-            self._status = live_status.status
-            if self._status == "OPEN":
-                self.dispatch("broadcast_open")
-            elif self._status == "CLOSE":
-                self.dispatch("broadcast_close")
-
-        if live_status.chat_channel_id == self.chat_channel_id:
+    def _dispatch_live_status(self, event: str, _: str, *args: Any) -> None:
+        # Receives events from LiveStatusPoller.
+        # When a streamer starts a new broadcast, a chat-channel-id will regenrated.
+        #
+        # https://github.com/gunyu1019/chzzkpy/issues/31
+        self.dispatch(event, *args)
+        if event == "chat_slow_mode_update":
+            # The send queue follows the slow mode of chat.
+            _, self._slow_mode = args
+            self.send_queue.slow_mode = self._slow_mode
+            return
+        elif event != "chat_channel_update":
             return
 
-        if (
-            live_status.adult
-            and live_status.user_adult_status != "ADULT"
-            and live_status.chat_channel_id is None
-        ):
-            raise ChatConnectFailed.adult_channel(self.channel_id)
-        elif live_status.chat_channel_id is None:
-            raise ChatConnectFailed.chat_channel_is_null()
+        _, chat_channel_id = args
+        if chat_channel_id == self.chat_channel_id:
+            return
 
         _log.debug("A chat_channel_id has been updated. Reconnect websocket.")
-        await self._gateway.close()
-
-        self.chat_channel_id = live_status.chat_channel_id
-        raise ReconnectWebsocket()
+        self.chat_channel_id = chat_channel_id
+        self._chat_channel_updated = True
+        if self._gateway is not None:
+            self.loop.create_task(self._gateway.close())
 
     @Client.initial_async_setup
     async def polling(self) -> None:
@@ -243,20 +305,15 @@ class ChatClient(Client):
                     user_id=self.user_id,
                 )
 
-                last_check_time = datetime.datetime.now()
-
                 while True:
                     await self._gateway.poll_event()
-
-                    # Confirm chat-channel-id with live_status() method.
-                    # When a streamer starts a new broadcast, a chat-channel-id will regenrated.
-                    #
-                    # https://github.com/gunyu1019/chzzkpy/issues/31
-                    relative_time = datetime.datetime.now() - last_check_time
-                    if relative_time.total_seconds() >= 58:
-                        last_check_time = datetime.datetime.now()
-                        await self._confirm_live_status()
-            except ReconnectWebsocket:
+            except (ReconnectWebsocket, ConnectionClosed) as exc:
+                if self._chat_channel_updated:
+                    # A websocket closed by chat-channel-id update.
+                    self._chat_channel_updated = False
+                    await self._generate_access_token()
+                elif isinstance(exc, ConnectionClosed):
+                    raise
                 self.dispatch("disconnect")
                 continue
 
@@ -265,42 +322,6 @@ class ChatClient(Client):
         """Waits until the client's internal cache is all ready."""
         await self._ready.wait()
 
-    def wait_for(
-        self,
-        event: str,
-        check: Optional[Callable[..., bool]] = None,
-        timeout: Optional[float] = None,
-    ):
-        """Waits for a WebSocket event to be dispatched.
-
-        Parameters
-        ----------
-        event : str
-            The event name.
-            For a list of events, read :meth:`event`
-        check : Optional[Callable[..., bool]],
-            A predicate to check what to wait for. The arguments must meet the
-            parameters of the event being waited for.
-        timeout : Optional[float]
-            The number of seconds to wait before timing out and raising
-            :exc:`asyncio.TimeoutError`.
-
-        """
-        future = self.loop.create_future()
-
-        if check is None:
-
-            def _check(*_):
-                return True
-
-            check = _check
-        event_name = event.lower()
-
-        if event_name not in self._listeners.keys():
-            self._listeners[event_name] = list()
-        self._listeners[event_name].append((future, check))
-        return asyncio.wait_for(future, timeout=timeout)
-
     def event(
         self, coro: Callable[..., Coroutine[Any, Any, Any]]
     ) -> Callable[..., Coroutine[Any, Any, Any]]:
@@ -326,80 +347,7 @@ class ChatClient(Client):
         ... async def on_chat(message: ChatMessage):
         ...     print(message.content)
         """
-        if not asyncio.iscoroutinefunction(coro):
-            raise TypeError("function must be a coroutine.")
-
-        event_name = coro.__name__
-        if event_name not in self._listeners.keys():
-            self._extra_event[event_name] = list()
-        self._extra_event[event_name].append(coro)
-        return coro
-
-    def dispatch(self, event: str, *args: Any, **kwargs) -> None:
-        _log.debug("Dispatching event %s", event)
-        method = "on_" + event
-
-        # wait-for listeners
-        if event in self._listeners.keys():
-            listeners = self._listeners[event]
-            _new_listeners = []
-
-            for index, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    continue
-
-                try:
-                    result = condition(*args, **kwargs)
-                except Exception as e:
-                    future.set_exception(e)
-                    continue
-                if result:
-                    match len(args):
-                        case 0:
-                            future.set_result(None)
-                        case 1:
-                            future.set_result(args[0])
-                        case _:
-                            future.set_result(args)
-
-                _new_listeners.append((future, condition))
-            self._listeners[event] = _new_listeners
-
-        # event-listener
-        if method not in self._extra_event.keys():
-            return
-
-        for coroutine_function in self._extra_event[method]:
-            self._schedule_event(coroutine_function, method, *args, **kwargs)
-
-    async def _run_event(
-        self,
-        coro: Callable[..., Coroutine[Any, Any, Any]],
-        event_name: str,
-        *args: Any,
-        **kwargs: Any,
-    ) -> None:
-        try:
-            await coro(*args, **kwargs)
-        except asyncio.CancelledError:
-            pass
-        except Exception as exc:
-            try:
-                _log.exception("Ignoring exception in %s", event_name)
-                self.dispatch("error", exc, *args, **kwargs)
-            except asyncio.CancelledError:
-                pass
-
-    def _schedule_event(
-        self,
-        coro: Callable[..., Coroutine[Any, Any, Any]],
-        event_name: str,
-        *args: Any,
-        **kwargs: Any,
-    ) -> asyncio.Task:
-        wrapped = self._run_event(coro, event_name, *args, **kwargs)
-        # Schedules the task
-        return self.loop.create_task(wrapped, name=f"chzzk.py: {event_name}")
+        return super().event(coro)
 
     # API Method
     @Client.initial_async_setup
@@ -433,6 +381,27 @@ class ChatClient(Client):
 
         await self._gateway.send_chat(message, self.chat_channel_id)
 
+    def queue_chat(
+        self, message: str, priority: MessagePriority = MessagePriority.NORMAL
+    ) -> asyncio.Future[None]:
+        """Queue a message to send at the rate allowed by slow mode.
+        The slow mode of chat is loaded from the live status,
+        and it is updated when the live status poller finds the slow mode changed.
+
+        Parameters
+        ----------
+        message : str
+            Message to Broadcasters
+        priority : MessagePriority
+            The priority of message, by default MessagePriority.NORMAL
+
+        Returns
+        -------
+        asyncio.Future[None]
+            A future resolved when the message is sent.
+        """
+        return self.send_queue.send(message, priority)
+
     @Client.initial_async_setup
     async def request_recent_chat(self, count: int = 50):
         """Send a request recent chat to chzzk.
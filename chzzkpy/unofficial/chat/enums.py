@@ -59,7 +59,13 @@ class ChatType(IntEnum):
 
 
 def get_enum(cls: type[E], val: Any) -> E:
-    enum_val = [i for i in cls if i.value == val]
-    if len(enum_val) == 0:
-        return val
-    return enum_val[0]
+    # The value-to-member table of enum class is looked up in constant time.
+    # An unknown value is returned as it is.
+    try:
+        return cls._value2member_map_.get(val, val)
+    except TypeError:
+        # An unhashable value can't be looked up in the table.
+        enum_val = [i for i in cls if i.value == val]
+        if len(enum_val) == 0:
+            return val
+        return enum_val[0]
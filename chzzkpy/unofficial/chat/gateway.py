@@ -24,10 +24,9 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
-from typing import Any, Callable, Optional, Literal, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Optional, Literal, TYPE_CHECKING
 
 import aiohttp
 
@@ -38,6 +37,8 @@ from .error import (
     WebSocketClosure,
     ReconnectWebsocket,
 )
+from ...dispatcher import EventBuffer
+from ...serializer import JSONBackend, get_json_backend
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -47,19 +48,34 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# The chat server is chosen by the chat channel ID. (`{server_id}` is replaced to the server number.)
+DEFAULT_CHAT_URL = "wss://kr-ss{server_id}.chat.naver.com/chat"
+
+# The commands handled without buffering, even if the event dispatcher is saturated.
+CONTROL_COMMANDS = frozenset({ChatCmd.PING, ChatCmd.PONG, ChatCmd.CONNECTED})
+
 
 class ChzzkWebSocket:
     def __init__(
         self,
         socket: aiohttp.ClientWebSocketResponse,
         loop: asyncio.AbstractEventLoop,
+        json_backend: Optional[JSONBackend] = None,
+        wait_until_writable: Optional[Callable[[], Awaitable[None]]] = None,
     ):
         self.socket: aiohttp.ClientWebSocketResponse = socket
         self.loop: asyncio.AbstractEventLoop = loop
         self.session_id: Optional[str] = None
+        self.json_backend = json_backend or get_json_backend()
 
         self._max_timeout: float = 60.0
 
+        # User events are held in the buffer while the event dispatcher is saturated.
+        self._event_buffer: Optional[EventBuffer] = None
+        if wait_until_writable is not None:
+            self._event_buffer = EventBuffer(loop, wait_until_writable)
+            self._event_buffer.start()
+
         self._event_hook: dict[ChatCmd, Optional[Callable[..., Any]]] = {
             key: None for key in list(ChatCmd)
         }
@@ -72,8 +88,14 @@ class ChzzkWebSocket:
 
     async def close(self):
         self.session_id = None
+        await self._close_event_buffer()
         await self.socket.close()
 
+    async def _close_event_buffer(self):
+        if self._event_buffer is not None:
+            await self._event_buffer.close()
+            self._event_buffer = None
+
     @classmethod
     async def new_session(
         cls,
@@ -81,12 +103,20 @@ class ChzzkWebSocket:
         session: aiohttp.ClientSession,
         channel_id: str,
         session_id: Optional[str] = None,
+        json_backend: Optional[JSONBackend] = None,
+        url: Optional[str] = None,
+        wait_until_writable: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> Self:
         server_id = abs(sum([ord(x) for x in channel_id])) % 9 + 1
-        url = f"wss://kr-ss{server_id}.chat.naver.com/chat"
+        url = (url or DEFAULT_CHAT_URL).format(server_id=server_id)
         socket: aiohttp.ClientWebSocketResponse = await session.ws_connect(url)
 
-        websocket = cls(socket, loop)
+        websocket = cls(
+            socket,
+            loop,
+            json_backend=json_backend,
+            wait_until_writable=wait_until_writable,
+        )
         websocket.session_id = session_id
         return websocket
 
@@ -102,6 +132,9 @@ class ChzzkWebSocket:
             session=client.ws_session,
             channel_id=client.chat_channel_id,
             session_id=session_id,
+            json_backend=state.json_backend,
+            url=client.chat_url,
+            wait_until_writable=client._backpressure,
         )
         for cmd, parsing_func in state.parsers.items():
             if parsing_func is None:
@@ -122,7 +155,7 @@ class ChzzkWebSocket:
         try:
             msg = await self.socket.receive(timeout=58.0)
             if msg.type is aiohttp.WSMsgType.TEXT:
-                data = msg.json()
+                data = self.json_backend.loads(msg.data)
                 await self.received_message(data)
             elif msg.type is aiohttp.WSMsgType.ERROR:
                 _log.debug("Received error %s", msg)
@@ -138,6 +171,7 @@ class ChzzkWebSocket:
             await self.send_ping()
             _log.debug("Timeout receiving packet. Send to ping for keep-alive")
         except WebSocketClosure:
+            await self._close_event_buffer()
             code = self.socket.close_code
             if self._can_handle_close(code):
                 raise ReconnectWebsocket()
@@ -170,16 +204,22 @@ class ChzzkWebSocket:
             return
 
         func = self._event_hook.get(cmd_type)
-        if func is not None:
-            func(body)
+        if func is None:
+            return
+
+        if self._event_buffer is not None and cmd_type not in CONTROL_COMMANDS:
+            self._event_buffer.put(func, body)
+            return
+        func(body)
 
     async def send(self, data: str) -> None:
         _log.debug("Sending data: %s", data)
         await self.socket.send_str(data)
 
     async def send_json(self, data: dict[str, Any]) -> None:
-        _log.debug("Sending JSON: %s", json.dumps(data))
-        await self.socket.send_json(data)
+        raw_data = self.json_backend.dumps(data)
+        _log.debug("Sending JSON: %s", raw_data)
+        await self.socket.send_str(raw_data)
 
     async def send_pong(self):
         await self.send_json({"cmd": ChatCmd.PONG, "ver": 2})
@@ -218,7 +258,7 @@ class ChzzkWebSocket:
 
         data: dict[str, Any] = {
             "bdy": {
-                "extras": json.dumps(extra),
+                "extras": self.json_backend.dumps(extra),
                 "msg": message,
                 "msgTime": int(time.time() * 1000),
                 "msgTypeCode": ChatType.TEXT,
@@ -7,13 +7,18 @@ from typing import Annotated, Any, Optional
 from .access_token import AccessToken
 from .profile import Profile
 from ..base_model import Content
+from ...cache import ResponseCache
 from ..http import ChzzkSession, ChzzkAPISession, NaverGameAPISession
 from ..user import PartialUser
 
 
 class ChzzkAPIChatSession(ChzzkAPISession):
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(loop=loop)
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        super().__init__(loop=loop, response_cache=response_cache)
 
     @get_pydantic_response_model()
     @post(
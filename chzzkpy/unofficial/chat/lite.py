@@ -0,0 +1,186 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, ClassVar, Optional, TYPE_CHECKING
+
+from .enums import ChatType, get_enum
+from .message import ChatMessage, DonationMessage, MessageDetail
+from ...lite import _parse_time
+from ...serializer import get_json_backend
+
+if TYPE_CHECKING:
+    from .chat_client import ChatClient
+
+
+class LiteMessageDetail:
+    """A base class of lightweight chat messages for high-volume ingestion.
+
+    A lightweight message keeps the raw dictionary of message in `__slots__`
+    and reads the attributes from it, without pydantic validation.
+    The `profile` and `extras` JSON strings are decoded on first access,
+    and the full pydantic model is validated on demand with :meth:`to_model`.
+    """
+
+    __slots__ = ("_data", "_client", "_profile", "_extras", "_model")
+    model_type: ClassVar[type[MessageDetail]] = MessageDetail
+
+    def __init__(self, data: dict[str, Any], client: Optional[ChatClient] = None):
+        self._data = data
+        self._client = client
+        self._profile: Optional[dict[str, Any]] = None
+        self._extras: Optional[dict[str, Any]] = None
+        self._model: Optional[MessageDetail] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} data={self._data!r}>"
+
+    def _get(self, short_key: str, key: str, default: Any = None) -> Any:
+        # The chat server uses short keys, and the recent chat uses long keys.
+        value = self._data.get(short_key)
+        if value is None:
+            value = self._data.get(key, default)
+        return value
+
+    def _loads(self, value: Optional[str]) -> Optional[dict[str, Any]]:
+        if value is None or not isinstance(value, str):
+            return value
+        json_backend = (
+            self._client.json_backend
+            if self._client is not None
+            else get_json_backend()
+        )
+        return json_backend.loads(value)
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The raw dictionary of message."""
+        return self._data
+
+    @property
+    def service_id(self) -> str:
+        return self._get("svcid", "serviceId")
+
+    @property
+    def channel_id(self) -> str:
+        return self._get("cid", "channelId")
+
+    @property
+    def user_id(self) -> str:
+        return self._get("uid", "userId")
+
+    @property
+    def content(self) -> str:
+        return self._get("msg", "content")
+
+    @property
+    def type(self) -> ChatType:
+        return get_enum(ChatType, self._get("msgTypeCode", "messageTypeCode"))
+
+    @property
+    def time(self) -> datetime.datetime:
+        return _parse_time(self._get("msgTime", "messageTime"))
+
+    @property
+    def member_count(self) -> int:
+        return self._get("mbrCnt", "memberCount")
+
+    @property
+    def message_status(self) -> Optional[str]:
+        return self._get("msgStatusType", "messageStatusType")
+
+    @property
+    def is_blind(self) -> bool:
+        return self.message_status == "BLIND"
+
+    @property
+    def profile(self) -> Optional[dict[str, Any]]:
+        """The decoded profile dictionary of sender."""
+        if self._profile is None:
+            self._profile = self._loads(self._data.get("profile"))
+        return self._profile
+
+    @property
+    def nickname(self) -> Optional[str]:
+        profile = self.profile
+        if profile is None:
+            return
+        return profile.get("nickname")
+
+    @property
+    def extras(self) -> Optional[dict[str, Any]]:
+        """The decoded extras dictionary of message."""
+        if self._extras is None:
+            self._extras = self._loads(self._data.get("extras"))
+        return self._extras
+
+    def to_model(self) -> MessageDetail:
+        """Validate the raw dictionary to the full pydantic model.
+        The validated model is cached in this instance.
+        """
+        if self._model is None:
+            if self._client is None:
+                self._model = self.model_type.model_validate(self._data)
+            else:
+                self._model = self.model_type.model_validate_with_client(
+                    self._data, client=self._client
+                )
+        return self._model
+
+    async def send(self, message: str):
+        """Send message to broadcaster."""
+        await self.to_model().send(message)
+
+
+class LiteChatMessage(LiteMessageDetail):
+    """A lightweight representation of :class:`ChatMessage`."""
+
+    __slots__ = ()
+    model_type = ChatMessage
+
+    def to_model(self) -> ChatMessage:
+        return super().to_model()
+
+
+class LiteDonationMessage(LiteMessageDetail):
+    """A lightweight representation of :class:`DonationMessage`."""
+
+    __slots__ = ()
+    model_type = DonationMessage
+
+    @property
+    def donation_type(self) -> Optional[str]:
+        return (self.extras or dict()).get("donationType")
+
+    @property
+    def pay_amount(self) -> int:
+        return (self.extras or dict()).get("payAmount", 0)
+
+    @property
+    def is_anonymous(self) -> bool:
+        return (self.extras or dict()).get("isAnonymous", True)
+
+    def to_model(self) -> DonationMessage:
+        return super().to_model()
@@ -0,0 +1,216 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Optional, Literal, TYPE_CHECKING
+
+from ...scheduler import DelayScheduler
+
+if TYPE_CHECKING:
+    from ..client import Client
+    from ..live import LiveStatus
+
+_log = logging.getLogger(__name__)
+
+
+class _PollingChannel:
+    __slots__ = ("channel_id", "status", "chat_channel_id", "slow_mode")
+
+    def __init__(
+        self,
+        channel_id: str,
+        status: Optional[Literal["OPEN", "CLOSE"]],
+        chat_channel_id: Optional[str],
+        slow_mode: Optional[int],
+    ):
+        self.channel_id = channel_id
+        self.status = status
+        self.chat_channel_id = chat_channel_id
+        self.slow_mode = slow_mode
+
+
+class LiveStatusPoller:
+    """Represents a scheduler polling the live status of channels.
+
+    Each channel is polled with the interval advised by the server (`callPeriodMilliSecond`),
+    and the number of concurrent requests is limited by `max_concurrency`.
+    When the live status changes, the events below are dispatched with `dispatch` function.
+
+    * `broadcast_open`: `dispatch("broadcast_open", channel_id)`
+    * `broadcast_close`: `dispatch("broadcast_close", channel_id)`
+    * `chat_channel_update`: `dispatch("chat_channel_update", channel_id, before, after)`
+    * `chat_slow_mode_update`: `dispatch("chat_slow_mode_update", channel_id, before, after)`
+
+    Parameters
+    ----------
+    client : Client
+        A client to request the live status.
+    dispatch : Callable[..., Any]
+        A function to dispatch the events.
+    max_concurrency : int
+        The maximum number of concurrent requests, by default 10
+    default_interval : float
+        The interval in seconds when the server doesn't advise an interval, by default 58.0
+    min_interval : float
+        The minimum interval in seconds, by default 10.0
+    jitter : float
+        The ratio of random jitter applied to the interval, by default 0.1
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        dispatch: Callable[..., Any],
+        max_concurrency: int = 10,
+        default_interval: float = 58.0,
+        min_interval: float = 10.0,
+        jitter: float = 0.1,
+    ):
+        self.client = client
+        self.dispatch = dispatch
+        self.default_interval = default_interval
+        self.min_interval = min_interval
+        self.jitter = jitter
+
+        self._channels: dict[str, _PollingChannel] = dict()
+        self._scheduler: DelayScheduler[str] = DelayScheduler(
+            self._poll,
+            max_concurrency=max_concurrency,
+            name="chzzk.py: live status poller",
+        )
+
+    @property
+    def channels(self) -> list[str]:
+        """The channel IDs polled by the poller."""
+        return list(self._channels.keys())
+
+    @property
+    def is_running(self) -> bool:
+        """Indicates if the poller is running."""
+        return self._scheduler.is_running
+
+    def _interval(self, live_status: Optional[LiveStatus] = None) -> float:
+        interval = self.default_interval
+        if live_status is not None:
+            call_period = live_status.live_polling_status.call_period_millisecond
+            if call_period > 0:
+                interval = call_period / 1000
+        interval = max(interval, self.min_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def add_channel(
+        self,
+        channel_id: str,
+        status: Optional[Literal["OPEN", "CLOSE"]] = None,
+        chat_channel_id: Optional[str] = None,
+        slow_mode: Optional[int] = None,
+    ) -> None:
+        """Add a channel to poll.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster.
+        status : Optional[Literal["OPEN", "CLOSE"]]
+            The current live status. If the value is None, the channel is polled immediately.
+        chat_channel_id : Optional[str]
+            The current chat channel ID.
+        slow_mode : Optional[int]
+            The current slow mode of chat in seconds.
+        """
+        self._channels[channel_id] = _PollingChannel(
+            channel_id, status, chat_channel_id, slow_mode
+        )
+        self._scheduler.schedule(channel_id, 0 if status is None else self._interval())
+
+    def remove_channel(self, channel_id: str) -> None:
+        """Remove a channel to poll.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster.
+        """
+        self._channels.pop(channel_id, None)
+        self._scheduler.remove(channel_id)
+
+    def start(self) -> asyncio.Task:
+        """Start polling in background."""
+        return self._scheduler.start()
+
+    async def close(self) -> None:
+        """Stop polling."""
+        await self._scheduler.close()
+
+    async def _poll(self, channel_id: str, generation: int) -> None:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            return
+
+        live_status = None
+        try:
+            live_status = await self.client.live_status(channel_id=channel_id)
+        except Exception:
+            _log.exception("Failed to get the live status of %s", channel_id)
+
+        # The channel has been removed or added again while polling.
+        if not self._scheduler.reschedule(
+            channel_id, generation, self._interval(live_status)
+        ):
+            return
+        if live_status is None:
+            return
+
+        if channel.status != live_status.status:
+            channel.status = live_status.status
+            if channel.status == "OPEN":
+                self.dispatch("broadcast_open", channel.channel_id)
+            elif channel.status == "CLOSE":
+                self.dispatch("broadcast_close", channel.channel_id)
+
+        if (
+            live_status.chat_channel_id is not None
+            and live_status.chat_channel_id != channel.chat_channel_id
+        ):
+            before = channel.chat_channel_id
+            channel.chat_channel_id = live_status.chat_channel_id
+            self.dispatch(
+                "chat_channel_update",
+                channel.channel_id,
+                before,
+                live_status.chat_channel_id,
+            )
+
+        if live_status.chat_slow_mode_sec != channel.slow_mode:
+            before = channel.slow_mode
+            channel.slow_mode = live_status.chat_slow_mode_sec
+            self.dispatch(
+                "chat_slow_mode_update",
+                channel.channel_id,
+                before,
+                live_status.chat_slow_mode_sec,
+            )
@@ -26,7 +26,17 @@ from __future__ import annotations
 import datetime
 import functools
 from typing import Any, Optional, Literal, TypeVar, Generic, TYPE_CHECKING
-from pydantic import AliasChoices, Field, Json, ConfigDict, PrivateAttr, computed_field
+from pydantic import (
+    AliasChoices,
+    Field,
+    Json,
+    ConfigDict,
+    PrivateAttr,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    computed_field,
+    field_validator,
+)
 
 from .donation import (
     BaseDonation,
@@ -81,6 +91,18 @@ class Message(ChzzkModel, Generic[E]):
 
     _client: Optional[ChatClient] = PrivateAttr(default=None)
 
+    @field_validator("profile", mode="wrap")
+    @classmethod
+    def _validate_profile(
+        cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+    ) -> Optional[Profile]:
+        # The profile is parsed through the profile cache of client, when it is given in context.
+        profile_cache = (info.context or dict()).get("profile_cache")
+        user_id = info.data.get("user_id")
+        if profile_cache is None or user_id is None or not isinstance(value, str):
+            return handler(value)
+        return profile_cache.get_or_parse(user_id, value, handler)
+
     @staticmethod
     def _based_client(func):
         @functools.wraps(func)
@@ -97,10 +119,17 @@ class Message(ChzzkModel, Generic[E]):
     def model_validate_with_client(
         cls: type[Message], obj: Any, client: ChatClient
     ) -> Message:
-        model = super().model_validate(obj)
+        model = super().model_validate(
+            obj, context={"profile_cache": client.profile_cache}
+        )
         model._client = client
 
-        if model.profile is not None and client.has_login:
+        # A cached profile has already been set the manage client.
+        if (
+            model.profile is not None
+            and client.has_login
+            and not model.profile.is_interactable
+        ):
             model.profile._set_manage_client(client.manage_self)
         return model
 
@@ -0,0 +1,359 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+import logging
+from typing import Any, Optional, TYPE_CHECKING
+
+from .chat_client import ChatClient
+from .http import ChzzkAPIChatSession, NaverGameChatSession
+from .live_poller import LiveStatusPoller
+from .profile import ProfileCache
+from ..client import Client
+from ...client import BaseEventManager
+from ...serializer import get_json_backend
+
+if TYPE_CHECKING:
+    from ...cache import ResponseCache
+    from ...dispatcher import EventDispatcher
+    from ...serializer import JSONBackend
+
+_log = logging.getLogger(__name__)
+
+
+class _ChannelChatClient(ChatClient):
+    """Represents a chat client of the channel joined by :class:`MultiChatClient`.
+    The HTTP and websocket sessions are owned by the parent client,
+    and the events are dispatched to the parent client with this client.
+    """
+
+    def __init__(
+        self,
+        parent: MultiChatClient,
+        channel_id: str,
+        chat_channel_id: Optional[str] = None,
+    ):
+        super().__init__(
+            channel_id=channel_id,
+            chat_channel_id=chat_channel_id,
+            json_backend=parent.json_backend,
+            chat_url=parent.chat_url,
+            lite_messages=parent.lite_messages,
+            dispatcher=parent.dispatcher,
+            profile_cache=parent.profile_cache,
+        )
+        self.parent = parent
+        self.loop = parent.loop
+        self.user_id = parent.user_id
+        self.live_status_poller = parent.live_status_poller
+
+        self._session_owner = False
+        self._api_session = parent._api_session
+        self._game_session = parent._game_session
+        self.ws_session = parent.ws_session
+
+    def dispatch(self, event: str, *args: Any, **kwargs) -> None:
+        self.parent.dispatch(event, self, *args, **kwargs)
+
+    def has_listener(self, event: str) -> bool:
+        return self.parent.has_listener(event)
+
+    async def wait_until_dispatchable(self) -> None:
+        await self.parent.wait_until_dispatchable()
+
+
+class MultiChatClient(Client, BaseEventManager):
+    """Represents a client to connect chats of multiple channels.
+
+    All channels share the HTTP sessions and the websocket session of this client.
+    Events are dispatched with the :class:`ChatClient` of the channel as the first argument.
+
+    Example
+    -------
+    >>> client = MultiChatClient()
+    >>> @client.event
+    ... async def on_chat(channel: ChatClient, message: ChatMessage):
+    ...     print(channel.channel_id, message.content)
+    >>> client.run("channel_id_1", "channel_id_2")
+    """
+
+    def __init__(
+        self,
+        authorization_key: Optional[str] = None,
+        session_key: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        json_backend: Optional[str | JSONBackend] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        response_cache: Optional[ResponseCache] = None,
+        chat_url: Optional[str] = None,
+        lite_messages: bool = False,
+        profile_cache: Optional[ProfileCache] = None,
+    ):
+        self.ws_session: Optional[aiohttp.ClientSession] = None
+        self.__authorization_key = authorization_key
+        self.__session_key = session_key
+
+        super().__init__(
+            loop=loop,
+            authorization_key=authorization_key,
+            session_key=session_key,
+            response_cache=response_cache,
+        )
+        BaseEventManager.__init__(self, self.loop, dispatcher=dispatcher)
+
+        self.json_backend = get_json_backend(json_backend)
+        self.chat_url = chat_url
+        self.lite_messages = lite_messages
+        self.user_id: Optional[str] = None
+
+        # The profiles of chatters are shared by all channels.
+        self.profile_cache = (
+            profile_cache if profile_cache is not None else ProfileCache()
+        )
+
+        self._clients: dict[str, _ChannelChatClient] = dict()
+        self._tasks: dict[str, asyncio.Task] = dict()
+
+        # The live status of all channels is polled by one poller.
+        self.live_status_poller = LiveStatusPoller(
+            self, dispatch=self._dispatch_live_status
+        )
+        self._close_event = asyncio.Event()
+
+        for event in (
+            "chat",
+            "donation",
+            "subscription",
+            "subscription_gift",
+            "system_message",
+            "recent_chat",
+            "connect",
+            "disconnect",
+            "broadcast_open",
+            "broadcast_close",
+            "chat_channel_update",
+            "chat_slow_mode_update",
+        ):
+            self.set_waiter_key(event, lambda client, *_: client.channel_id)
+
+    def _session_initial_set(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._api_session = ChzzkAPIChatSession(
+            loop=self.loop or loop, response_cache=self.response_cache
+        )
+        self._game_session = NaverGameChatSession(loop=self.loop or loop)
+        self.ws_session = aiohttp.ClientSession(loop=self.loop or loop)
+
+        if self.__authorization_key is not None and self.__session_key is not None:
+            self.login(self.__authorization_key, self.__session_key)
+
+    def login(self, authorization_key: str, session_key: str):
+        """Login at Chzzk.
+        Used for features that require a login. (ex. sending chat)
+
+        Parameters
+        ----------
+        authorization_key : str
+            A `NID_AUT` value in the cookie.
+        session_key : str
+            A `NID_SES` value in the cookie.
+        """
+        if self._api_session is None or self._game_session is None:
+            self.__authorization_key = authorization_key
+            self.__session_key = session_key
+
+        super().login(authorization_key=authorization_key, session_key=session_key)
+
+    def _dispatch_live_status(self, event: str, channel_id: str, *args: Any) -> None:
+        client = self._clients.get(channel_id)
+        if client is None:
+            return
+        client._dispatch_live_status(event, channel_id, *args)
+
+    @property
+    def channels(self) -> list[str]:
+        """The channel IDs joined by the client."""
+        return list(self._clients.keys())
+
+    def get_client(self, channel_id: str) -> Optional[ChatClient]:
+        """Get a chat client of the joined channel.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster.
+
+        Returns
+        -------
+        Optional[ChatClient]
+            Returns the chat client of the channel. If the channel isn't joined, returns None.
+        """
+        return self._clients.get(channel_id)
+
+    def run(
+        self,
+        *channel_ids: str,
+        authorization_key: Optional[str] = None,
+        session_key: Optional[str] = None,
+    ) -> None:
+        async def runner():
+            await self._async_setup_hook()
+            await self.start(
+                *channel_ids,
+                authorization_key=authorization_key,
+                session_key=session_key,
+            )
+
+        try:
+            asyncio.run(runner())
+        except KeyboardInterrupt:
+            return
+
+    @Client.initial_async_setup
+    async def start(
+        self,
+        *channel_ids: str,
+        authorization_key: Optional[str] = None,
+        session_key: Optional[str] = None,
+    ) -> None:
+        """Join the channels and wait until the client is closed.
+
+        Parameters
+        ----------
+        *channel_ids : str
+            The channel IDs of broadcasters to join.
+        authorization_key : Optional[str]
+            A `NID_AUT` value in the cookie.
+        session_key : Optional[str]
+            A `NID_SES` value in the cookie.
+        """
+        try:
+            if authorization_key is not None and session_key is not None:
+                self.login(authorization_key=authorization_key, session_key=session_key)
+            if self.user_id is None and self._game_session.has_login:
+                user = await self.user()
+                self.user_id = user.user_id_hash
+
+            # A channel failed to join is logged and dispatched with `client_error`
+            # by _on_client_done, and the other channels keep running.
+            await asyncio.gather(
+                *[self.add_channel(channel_id) for channel_id in channel_ids],
+                return_exceptions=True,
+            )
+            await self._close_event.wait()
+        finally:
+            await self.close()
+
+    @Client.initial_async_setup
+    async def add_channel(
+        self,
+        channel_id: str,
+        chat_channel_id: Optional[str] = None,
+        wait: bool = True,
+    ) -> ChatClient:
+        """Join a chat of the channel.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster.
+        chat_channel_id : Optional[str]
+            The chat channel ID of broadcaster. By default, it is fetched with live status.
+        wait : bool
+            Whether to wait until the chat is connected, by default True
+
+        Returns
+        -------
+        ChatClient
+            Returns the chat client of the channel.
+        """
+        if channel_id in self._clients.keys():
+            return self._clients[channel_id]
+
+        if self.user_id is None and self._game_session.has_login:
+            user = await self.user()
+            self.user_id = user.user_id_hash
+
+        client = _ChannelChatClient(self, channel_id, chat_channel_id)
+        task = self.loop.create_task(
+            client.connect(), name=f"chzzk.py: chat of {channel_id}"
+        )
+        task.add_done_callback(lambda t: self._on_client_done(client, t))
+        self._clients[channel_id] = client
+        self._tasks[channel_id] = task
+
+        if wait:
+            ready_task = self.loop.create_task(client.wait_until_connected())
+            await asyncio.wait({task, ready_task}, return_when=asyncio.FIRST_COMPLETED)
+            ready_task.cancel()
+
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        return client
+
+    def _on_client_done(self, client: _ChannelChatClient, task: asyncio.Task):
+        if self._clients.get(client.channel_id) is client:
+            self._clients.pop(client.channel_id)
+            self._tasks.pop(client.channel_id)
+
+        if task.cancelled() or task.exception() is None:
+            return
+
+        _log.error(
+            "The chat of %s is disconnected.",
+            client.channel_id,
+            exc_info=task.exception(),
+        )
+        self.dispatch("client_error", client, task.exception())
+
+    async def remove_channel(self, channel_id: str) -> None:
+        """Leave a chat of the channel.
+
+        Parameters
+        ----------
+        channel_id : str
+            The channel ID of broadcaster.
+        """
+        client = self._clients.pop(channel_id, None)
+        task = self._tasks.pop(channel_id, None)
+        if client is None:
+            return
+
+        await client.close()
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def close(self):
+        """Close the connection of all channels."""
+        for channel_id in self.channels:
+            await self.remove_channel(channel_id)
+
+        await self.live_status_poller.close()
+        if self.ws_session is not None:
+            await self.ws_session.close()
+        await self.dispatcher.close()
+        await super().close()
+        self._close_event.set()
@@ -21,7 +21,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Any, Optional
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, NamedTuple, Optional
 from pydantic import computed_field, Field, PrivateAttr
 
 from ..base_model import ChzzkModel
@@ -44,10 +46,10 @@ class SubscriptionInfo(ChzzkModel):
         self._badge = badge
 
     @computed_field
-    @property
+    @cached_property
     def badge(self) -> Optional[Badge]:
         _badge = self._badge or dict()
-        if "imageUrl" not in self._badge.keys():
+        if "imageUrl" not in _badge.keys():
             return
         return Badge(image_url=_badge["imageUrl"])
 
@@ -77,7 +79,7 @@ class StreamingProperty(ChzzkModel):
         return self._following_dt["followDate"]
 
     @computed_field
-    @property
+    @cached_property
     def donation_ranking_badge(self) -> Optional[Badge]:
         if (
             self._real_time_donation_ranking_dt is None
@@ -97,7 +99,7 @@ class StreamingProperty(ChzzkModel):
         return self._nickname_color["colorCode"]
 
     @computed_field
-    @property
+    @cached_property
     def subscription(self) -> Optional[SubscriptionInfo]:
         if self._subscription is None:
             return
@@ -121,7 +123,7 @@ class ViewerBadge(ChzzkModel):
         self._badge_data = badge_data
 
     @computed_field
-    @property
+    @cached_property
     def image_url(self) -> Optional[str]:
         badge_data = self._badge_data
         if "imageUrl" not in badge_data.keys():
@@ -129,7 +131,7 @@ class ViewerBadge(ChzzkModel):
         return badge_data["imageUrl"]
 
     @computed_field
-    @property
+    @cached_property
     def scope(self) -> Optional[str]:
         badge_data = self._badge_data
         if "scope" not in badge_data.keys():
@@ -137,7 +139,7 @@ class ViewerBadge(ChzzkModel):
         return badge_data["scope"]
 
     @computed_field
-    @property
+    @cached_property
     def badge_id(self) -> Optional[str]:
         badge_data = self._badge_data
         if "badge_id" not in badge_data.keys():
@@ -168,7 +170,7 @@ class Profile(PartialUser):
         return self._title["color"]
 
     @computed_field
-    @property
+    @cached_property
     def badge(self) -> Optional[Badge]:
         if self._badge is None and self._title is None:
             return
@@ -177,3 +179,90 @@ class Profile(PartialUser):
         return Badge(
             name=_title.get("name", None), image_url=_badge.get("imageUrl", None)
         )
+
+
+class ProfileCacheStatistics(NamedTuple):
+    """Represents a snapshot of the profile cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ProfileCache:
+    """Represents a LRU cache of parsed profiles for repeat chatters.
+
+    The profile JSON of a chatter rarely changes between messages.
+    The profiles are keyed by user ID and the hash of profile JSON,
+    so an identical profile is parsed once and shared as a frozen object.
+
+    The cached profiles keep the manage client of the first message,
+    so a cache should not be shared by clients of different channels.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of cached profiles, by default 4096
+        If the value is 0, the profiles aren't cached.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, int], tuple[str, Profile]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_parse(
+        self, user_id: str, raw_profile: str, parse: Callable[[str], Profile]
+    ) -> Profile:
+        """Returns the cached profile, or parses the profile JSON.
+
+        Parameters
+        ----------
+        user_id : str
+            The user ID of chatter.
+        raw_profile : str
+            The profile JSON of chatter.
+        parse : Callable[[str], Profile]
+            A function to parse the profile JSON.
+        """
+        key = (user_id, hash(raw_profile))
+        entry = self._entries.get(key)
+
+        # The JSON is compared to prevent a hash collision returning other profile.
+        if entry is not None and entry[0] == raw_profile:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        profile = parse(raw_profile)
+        if self.max_size > 0:
+            self._entries[key] = (raw_profile, profile)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return profile
+
+    def clear(self) -> None:
+        """Remove all cached profiles."""
+        self._entries.clear()
+
+    def stats(self) -> ProfileCacheStatistics:
+        """Returns a snapshot of the cache."""
+        return ProfileCacheStatistics(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
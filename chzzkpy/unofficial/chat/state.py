@@ -31,7 +31,9 @@ from typing import Callable, Any, TYPE_CHECKING, Optional
 from .blind import Blind
 from .donation import MissionDonation, MissionParticipationDonation
 from .enums import ChatCmd, ChatType, get_enum
+from .lite import LiteChatMessage, LiteDonationMessage, LiteMessageDetail
 from .message import (
+    Message,
     ChatMessage,
     DonationMessage,
     NoticeMessage,
@@ -40,12 +42,26 @@ from .message import (
     SystemMessage,
 )
 from .recent_chat import RecentChat
+from ...serializer import JSONBackend, get_json_backend
 
 if TYPE_CHECKING:
     from .chat_client import ChatClient
 
 log = logging.getLogger()
 
+_message_models: dict[ChatType, tuple[str, type[Message]]] = {
+    ChatType.DONATION: ("donation", DonationMessage),
+    ChatType.SYSTEM_MESSAGE: ("system_message", SystemMessage),
+    ChatType.TEXT: ("chat", ChatMessage),
+    ChatType.SUBSCRIPTION: ("subscription", SubscriptionMessage),
+    ChatType.SUBSCRIPTION_GIFT: ("subscription_gift", SubscriptionGiftMessage),
+}
+
+_lite_message_models: dict[ChatType, type[LiteMessageDetail]] = {
+    ChatType.DONATION: LiteDonationMessage,
+    ChatType.TEXT: LiteChatMessage,
+}
+
 
 class ConnectionState:
     def __init__(
@@ -53,8 +69,12 @@ class ConnectionState:
         dispatch: Callable[..., Any],
         handler: dict[ChatCmd | int, Callable[..., Any]],
         client: Optional[ChatClient] = None,
+        json_backend: Optional[JSONBackend] = None,
+        has_listener: Optional[Callable[[str], bool]] = None,
+        lite_messages: bool = False,
     ):
         self.dispatch = dispatch
+        self.has_listener = has_listener or self.__always_listen
         self.handler: dict[ChatCmd | int, Callable[..., Any]] = handler
         self.parsers: dict[ChatCmd, Callable[..., Any]] = dict()
         for _, func in inspect.getmembers(self):
@@ -62,6 +82,12 @@ class ConnectionState:
                 self.parsers[func.__parsing_event__] = func
 
         self.client = client
+        self.json_backend = json_backend or get_json_backend()
+        self.lite_messages = lite_messages
+
+    @staticmethod
+    def __always_listen(_: str) -> bool:
+        return True
 
     @staticmethod
     def parsable(cmd: ChatCmd):
@@ -104,37 +130,32 @@ class ConnectionState:
             )
             message_type = get_enum(ChatType, message_raw_type)
 
+            if message_type not in _message_models:
+                continue
+            event, model = _message_models[message_type]
+
+            # Messages are validated only when someone listens to the event.
+            # The `raw_` event receives the dictionary without model validation.
+            if self.has_listener("raw_" + event):
+                self.dispatch("raw_" + event, message)
+
+            if not self.has_listener(event):
+                continue
+
             # Cause bug from insufficient information
             # ChatType: SYSTEM_MESSAGE
             if message.get("profile") == "{}":
                 message["profile"] = None
 
-            if message_type == ChatType.DONATION:
-                validated_data = DonationMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("donation", validated_data)
-            elif message_type == ChatType.SYSTEM_MESSAGE:
-
-                validated_data = SystemMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("system_message", validated_data)
-            elif message_type == ChatType.TEXT:
-                validated_data = ChatMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("chat", validated_data)
-            elif message_type == ChatType.SUBSCRIPTION:
-                validated_data = SubscriptionMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("subscription", validated_data)
-            elif message_type == ChatType.SUBSCRIPTION_GIFT:
-                validated_data = SubscriptionGiftMessage.model_validate_with_client(
-                    message, client=self.client
-                )
-                self.dispatch("subscription_gift", validated_data)
+            if self.lite_messages and message_type in _lite_message_models:
+                lite_model = _lite_message_models[message_type]
+                self.dispatch(event, lite_model(message, client=self.client))
+                continue
+
+            validated_data = model.model_validate_with_client(
+                message, client=self.client
+            )
+            self.dispatch(event, validated_data)
 
     @parsable(ChatCmd.CHAT)
     @catch_exception
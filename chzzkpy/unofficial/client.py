@@ -34,6 +34,7 @@ from .user import User
 from .video import Video
 from .manage.manage_client import ManageClient
 
+from ..cache import ResponseCache
 from ..client import _LoopSentinel
 
 
@@ -51,12 +52,17 @@ class Client:
         loop: Optional[asyncio.AbstractEventLoop] = None,
         authorization_key: Optional[str] = None,
         session_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         self.loop = loop or _LoopSentinel()
+        self.response_cache = response_cache
         self._closed = False
         self._api_session = None
         self._game_session = None
 
+        # False when the HTTP sessions are shared by another client. (ex. MultiChatClient)
+        self._session_owner = True
+
         self.__authorization_key = authorization_key
         self.__session_key = session_key
 
@@ -84,7 +90,9 @@ class Client:
     def _session_initial_set(
         self, loop: Optional[asyncio.AbstractEventLoop] = None
     ) -> None:
-        self._api_session = ChzzkAPISession(loop=self.loop or loop)
+        self._api_session = ChzzkAPISession(
+            loop=self.loop or loop, response_cache=self.response_cache
+        )
         self._game_session = NaverGameAPISession(loop=self.loop or loop)
 
         if self.__authorization_key is not None and self.__session_key is not None:
@@ -114,7 +122,11 @@ class Client:
     async def close(self):
         """Closes the connection to chzzk."""
         self._closed = True
-        if self._api_session is not None and self._game_session is not None:
+        if (
+            self._session_owner
+            and self._api_session is not None
+            and self._game_session is not None
+        ):
             await self._api_session.close()
             await self._game_session.close()
 
@@ -31,6 +31,7 @@ from ahttp_client.extension import get_pydantic_response_model
 from ahttp_client.request import RequestCore
 
 from .base_model import Content
+from ..cache import CachedSession, ResponseCache, cache_ttl
 from .error import LoginRequired, HTTPException, NotFoundException
 from .live import LiveStatus, LiveDetail
 from .search import TopSearchResult
@@ -43,9 +44,15 @@ _user_agent: Final[str] = (
 )
 
 
-class ChzzkSession(Session):
-    def __init__(self, base_url: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+class ChzzkSession(CachedSession):
+    def __init__(
+        self,
+        base_url: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         super().__init__(base_url=base_url, loop=loop)
+        self.response_cache = response_cache
 
         self._authorization_key = None
         self._session_key = None
@@ -112,12 +119,21 @@ class ChzzkSession(Session):
 
 
 class ChzzkAPISession(ChzzkSession):
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
-        super().__init__(base_url="https://api.chzzk.naver.com", loop=loop)
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        super().__init__(
+            base_url="https://api.chzzk.naver.com",
+            loop=loop,
+            response_cache=response_cache,
+        )
 
     @get_pydantic_response_model()
     @get("/polling/v2/channels/{channel_id}/live-status", directly_response=True)
     @ChzzkSession.configuration(login_able=True, login_required=False)
+    @cache_ttl(10)
     async def live_status(
         self, channel_id: Annotated[str, Path]
     ) -> Content[Optional[LiveStatus]]:
@@ -126,6 +142,7 @@ class ChzzkAPISession(ChzzkSession):
     @get_pydantic_response_model()
     @get("/service/v2/channels/{channel_id}/live-detail", directly_response=True)
     @ChzzkSession.configuration(login_able=True, login_required=True)
+    @cache_ttl(10)
     async def live_detail(
         self, channel_id: Annotated[str, Path]
     ) -> Content[LiveDetail]:
@@ -133,6 +150,7 @@ class ChzzkAPISession(ChzzkSession):
 
     @get_pydantic_response_model()
     @get("/service/v1/search/channels", directly_response=True)
+    @cache_ttl(60)
     async def search_channel(
         self,
         keyword: Annotated[str, Query],
@@ -143,6 +161,7 @@ class ChzzkAPISession(ChzzkSession):
 
     @get_pydantic_response_model()
     @get("/service/v1/search/lives", directly_response=True)
+    @cache_ttl(60)
     async def search_live(
         self,
         keyword: Annotated[str, Query],
@@ -153,6 +172,7 @@ class ChzzkAPISession(ChzzkSession):
 
     @get_pydantic_response_model()
     @get("/service/v1/search/videos", directly_response=True)
+    @cache_ttl(60)
     async def search_video(
         self,
         keyword: Annotated[str, Query],
@@ -163,6 +183,7 @@ class ChzzkAPISession(ChzzkSession):
 
     @get_pydantic_response_model()
     @get("/service/v1/search/channels/auto-complete", directly_response=True)
+    @cache_ttl(60)
     async def autocomplete(
         self,
         keyword: Annotated[str, Query],
@@ -54,6 +54,7 @@ class LiveStatus(ChzzkModel):
     chat_available_group: str
     chat_available_condition: str
     min_follower_minute: int
+    chat_slow_mode_sec: int = 0
 
 
 class BaseLive(ChzzkModel):
@@ -0,0 +1,163 @@
+"""MIT License
+
+Copyright (c) 2024-2025 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, Callable, Hashable, Optional
+
+
+class _Waiter:
+    __slots__ = ("future", "check", "key")
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        check: Optional[Callable[..., bool]],
+        key: Optional[Hashable],
+    ):
+        self.future = future
+        self.check = check
+        self.key = key
+
+
+class WaiterRegistry:
+    """Represents the registry of futures waiting for an event. (used by `wait_for` method)
+
+    A waiter is removed as soon as its future is resolved, cancelled or timed out.
+    A waiter can be indexed by a key. When the key function of the event is registered
+    with :meth:`set_key`, only waiters with the key of the dispatched event are checked.
+    """
+
+    def __init__(self):
+        # event name -> key (None for non-indexed waiters) -> waiters
+        self._waiters: dict[str, dict[Any, dict[int, _Waiter]]] = dict()
+        self._key_functions: dict[str, Callable[..., Hashable]] = dict()
+        self._count = 0
+
+    def set_key(self, event: str, key_function: Callable[..., Hashable]) -> None:
+        """Registers a function to get the key of waiters from the event arguments.
+
+        Parameters
+        ----------
+        event : str
+            The event name.
+        key_function : Callable[..., Hashable]
+            A function that receives the arguments of the event and returns the key.
+        """
+        self._key_functions[event.lower()] = key_function
+
+    def add(
+        self,
+        event: str,
+        future: asyncio.Future,
+        check: Optional[Callable[..., bool]] = None,
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """Adds a future waiting for the event.
+
+        Parameters
+        ----------
+        event : str
+            The event name.
+        future : asyncio.Future
+            A future to resolve with the event arguments.
+        check : Optional[Callable[..., bool]]
+            A predicate to check what to wait for.
+        key : Optional[Hashable]
+            A key to wait for. The event must have a key function registered with :meth:`set_key`.
+        """
+        event_name = event.lower()
+        if key is not None and event_name not in self._key_functions:
+            raise ValueError(f"{event_name} event doesn't support key-indexed waits.")
+
+        waiter = _Waiter(future, check, key)
+        waiters = self._waiters.setdefault(event_name, dict()).setdefault(key, dict())
+        waiters[id(waiter)] = waiter
+        self._count += 1
+        future.add_done_callback(lambda _: self._remove(event_name, waiter))
+
+    def _remove(self, event: str, waiter: _Waiter) -> None:
+        event_waiters = self._waiters.get(event)
+        if event_waiters is None:
+            return
+        waiters = event_waiters.get(waiter.key)
+        if waiters is None or waiters.pop(id(waiter), None) is None:
+            return
+        self._count -= 1
+
+        if len(waiters) == 0:
+            del event_waiters[waiter.key]
+        if len(event_waiters) == 0:
+            del self._waiters[event]
+
+    def count(self, event: Optional[str] = None) -> int:
+        """Returns the number of pending waiters.
+
+        Parameters
+        ----------
+        event : Optional[str]
+            The event name. If the value is None, returns the number of waiters of all events.
+        """
+        if event is None:
+            return self._count
+        return sum(len(waiters) for waiters in self._waiters.get(event, {}).values())
+
+    def resolve(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """Resolves the waiters of the event with the event arguments."""
+        event_waiters = self._waiters.get(event)
+        if event_waiters is None:
+            return
+
+        candidates = list(event_waiters.get(None, {}).values())
+        has_keyed_waiter = len(event_waiters) > (1 if None in event_waiters else 0)
+        if has_keyed_waiter:
+            try:
+                key = self._key_functions[event](*args, **kwargs)
+            except Exception:
+                key = None
+            if key is not None:
+                candidates.extend(event_waiters.get(key, {}).values())
+
+        for waiter in candidates:
+            future = waiter.future
+            if future.done():
+                continue
+
+            if waiter.check is not None:
+                try:
+                    result = waiter.check(*args, **kwargs)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                if not result:
+                    continue
+
+            match len(args):
+                case 0:
+                    future.set_result(None)
+                case 1:
+                    future.set_result(args[0])
+                case _:
+                    future.set_result(args)
@@ -16,12 +16,13 @@ extras_require = {
     "test": ["pytest", "pytest-cov"],
     "lint": ["pycodestyle", "black"],
     "docs": ["Sphinx", "sphinxawesome-theme", "sphinx-intl"],
+    "speed": ["orjson"],
 }
 
 setup(
     name="chzzkpy",
     version=version,
-    packages=["chzzkpy", "chzzkpy.unofficial", "chzzkpy.unofficial.chat", "chzzkpy.unofficial.manage"],
+    packages=["chzzkpy", "chzzkpy.testing", "chzzkpy.unofficial", "chzzkpy.unofficial.chat", "chzzkpy.unofficial.manage"],
     url="https://github.com/gunyu1019/chzzkpy",
     project_urls={
         "Documentation (한국어)": "https://gunyu1019.github.io/chzzkpy/ko/",
@@ -0,0 +1,62 @@
+import asyncio
+
+from chzzkpy.cache import ResponseCache
+
+import pytest
+
+
+def test_cancelled_initiator_does_not_cancel_coalesced_callers():
+    async def main():
+        cache = ResponseCache()
+        release = asyncio.Event()
+        fetch_count = 0
+
+        async def fetch():
+            nonlocal fetch_count
+            fetch_count += 1
+            await release.wait()
+            return "response"
+
+        initiator = asyncio.create_task(cache.get_or_fetch("key", 60, fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_fetch("key", 60, fetch))
+        await asyncio.sleep(0)
+
+        initiator.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == "response"
+        assert initiator.cancelled()
+        assert fetch_count == 1
+        assert await cache.get_or_fetch("key", 60, fetch) == "response"
+        assert cache.stats().coalesced == 1
+
+    asyncio.run(main())
+
+
+def test_fetch_exception_is_raised_to_coalesced_callers():
+    async def main():
+        cache = ResponseCache()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise RuntimeError("failed")
+
+        callers = [
+            asyncio.create_task(cache.get_or_fetch("key", 60, fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        for caller in callers:
+            with pytest.raises(RuntimeError):
+                await caller
+
+        # A failed response isn't cached.
+        async def fetch_again():
+            return "response"
+
+        assert await cache.get_or_fetch("key", 60, fetch_again) == "response"
+
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+import random
+from urllib.parse import quote
+
+from chzzkpy.enums import EnginePacketType, SocketPacketType
+from chzzkpy.packet import Packet
+from chzzkpy.payload import Payload
+from chzzkpy.serializer import JSONBackend, OrjsonBackend, orjson
+
+import pytest
+
+JSON_BACKENDS = [JSONBackend()] + ([OrjsonBackend()] if orjson is not None else [])
+
+
+def assert_packet_equal(decoded: Packet, expected: Packet):
+    assert decoded.engine_packet_type == expected.engine_packet_type
+    assert decoded.socket_packet_type == expected.socket_packet_type
+    assert decoded.namespace == expected.namespace
+    assert decoded.id == expected.id
+    assert decoded.data == expected.data
+
+
+@pytest.mark.parametrize("json_backend", JSON_BACKENDS, ids=lambda x: x.name)
+def test_payload_non_ascii_round_trip(json_backend: JSONBackend):
+    packets = [
+        Packet(
+            EnginePacketType.MESSAGE,
+            SocketPacketType.EVENT,
+            ["CHAT", '{"content": "안녕하세요 😀"}'],
+        ),
+        Packet(EnginePacketType.PING, data="probe"),
+    ]
+    encoded = Payload(packets).encode(json_serialize=json_backend.dumps)
+    decoded = Payload.decode(encoded, json_serialize=json_backend.loads)
+
+    assert len(decoded.packets) == len(packets)
+    for decoded_packet, packet in zip(decoded.packets, packets):
+        assert_packet_equal(decoded_packet, packet)
+
+
+TEXT_CHARACTERS = "abcxyz ABC 019 가나다라 한국어 😀 \"'\\/,:[]{}"
+SOCKET_PACKET_TYPES = [
+    SocketPacketType.CONNECT,
+    SocketPacketType.DISCONNECT,
+    SocketPacketType.EVENT,
+    SocketPacketType.ACK,
+    SocketPacketType.CONNECT_ERROR,
+]
+ENGINE_PACKET_TYPES = [
+    EnginePacketType.OPEN,
+    EnginePacketType.CLOSE,
+    EnginePacketType.PING,
+    EnginePacketType.PONG,
+    EnginePacketType.UPGRADE,
+    EnginePacketType.NOOP,
+]
+
+
+def random_text(rng: random.Random, max_length: int = 16) -> str:
+    return "".join(
+        rng.choice(TEXT_CHARACTERS) for _ in range(rng.randint(0, max_length))
+    )
+
+
+def random_json(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 3 else 4)
+    if kind == 0:
+        return random_text(rng)
+    elif kind == 1:
+        return rng.randint(-(10**9), 10**9)
+    elif kind == 2:
+        return rng.choice([True, False, None])
+    elif kind == 3:
+        return rng.random()
+    elif kind == 4:
+        return [random_json(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {random_text(rng): random_json(rng, depth + 1) for _ in range(4)}
+
+
+def random_packet(rng: random.Random) -> Packet:
+    if rng.random() < 0.7:
+        data = None
+        if rng.random() < 0.8:
+            # The socket.io data is an array or object. (ex. event name + arguments)
+            data = [random_text(rng)] + [
+                random_json(rng) for _ in range(rng.randint(0, 3))
+            ]
+            if rng.random() < 0.2:
+                data = {random_text(rng): random_json(rng)}
+        return Packet(
+            EnginePacketType.MESSAGE,
+            rng.choice(SOCKET_PACKET_TYPES),
+            data,
+            packet_id=rng.choice([None, 0, rng.randint(1, 9), rng.randint(10, 10**9)]),
+            namespace=rng.choice([None, "/", "/chat", "/" + "n" * rng.randint(1, 8)]),
+        )
+
+    # The text data of engine.io packet starts with a letter to not be decoded as JSON.
+    data = rng.choice(
+        ["probe", "x" + random_text(rng), {random_text(rng): random_json(rng)}]
+    )
+    return Packet(rng.choice(ENGINE_PACKET_TYPES), None, data)
+
+
+def random_packets(rng: random.Random) -> list[Packet]:
+    return [random_packet(rng) for _ in range(rng.randint(1, 16))]
+
+
+def assert_packets_equal(decoded: list[Packet], expected: list[Packet]):
+    assert len(decoded) == len(expected)
+    for decoded_packet, packet in zip(decoded, expected):
+        assert_packet_equal(decoded_packet, packet)
+
+
+def text_payload(packets: list[Packet], json_backend: JSONBackend) -> str:
+    # The content length of text payload is counted in characters.
+    encoded_packets = [x.encode(json_serialize=json_backend.dumps) for x in packets]
+    return "".join(f"{len(x)}:{x}" for x in encoded_packets)
+
+
+@pytest.mark.parametrize("seed", range(200))
+@pytest.mark.parametrize("json_backend", JSON_BACKENDS, ids=lambda x: x.name)
+def test_packet_round_trip(seed: int, json_backend: JSONBackend):
+    rng = random.Random(seed)
+    for _ in range(8):
+        packet = random_packet(rng)
+        encoded = packet.encode(json_serialize=json_backend.dumps)
+        assert_packet_equal(
+            Packet.decode(encoded, json_serialize=json_backend.loads), packet
+        )
+
+
+@pytest.mark.parametrize("seed", range(200))
+@pytest.mark.parametrize("json_backend", JSON_BACKENDS, ids=lambda x: x.name)
+def test_binary_payload_round_trip(seed: int, json_backend: JSONBackend):
+    packets = random_packets(random.Random(seed))
+    encoded = Payload(packets).encode(json_serialize=json_backend.dumps)
+    decoded = Payload.decode(encoded, json_serialize=json_backend.loads)
+    assert_packets_equal(decoded.packets, packets)
+
+
+@pytest.mark.parametrize("seed", range(200))
+@pytest.mark.parametrize("json_backend", JSON_BACKENDS, ids=lambda x: x.name)
+def test_text_payload_round_trip(seed: int, json_backend: JSONBackend):
+    packets = random_packets(random.Random(seed))
+    encoded = text_payload(packets, json_backend).encode("utf-8")
+    decoded = Payload.decode(encoded, json_serialize=json_backend.loads)
+    assert_packets_equal(decoded.packets, packets)
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_jsonp_payload_round_trip(seed: int):
+    json_backend = JSONBackend()
+    packets = random_packets(random.Random(seed))
+
+    # The JSONP POST payload is the url-encoded text payload in `d` form field.
+    encoded = b"d=" + quote(text_payload(packets, json_backend)).encode()
+    decoded = Payload.decode(encoded, json_serialize=json_backend.loads)
+    assert_packets_equal(decoded.packets, packets)
+
+    jsonp = Payload(packets).encode(jsonp_index="3", json_serialize=json_backend.dumps)
+    assert jsonp.startswith(b"___eio[3](") and jsonp.endswith(b");")
+    binary = Payload(packets).encode(json_serialize=json_backend.dumps)
+    assert jsonp[len(b"___eio[3](") : -len(b");")] == binary.replace(b'"', b'\\"')
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_binary_attachment_is_skipped(seed: int):
+    rng = random.Random(seed)
+    packets = random_packets(rng)
+    encoded = bytearray(Payload(packets).encode())
+
+    # A binary packet (key 1) is not supported and is skipped by decoder.
+    attachment = bytes(rng.randrange(256) for _ in range(rng.randint(1, 300)))
+    encoded[0:0] = (
+        bytes([1] + [int(x) for x in str(len(attachment))] + [0xFF]) + attachment
+    )
+    decoded = Payload.decode(bytes(encoded))
+    assert_packets_equal(decoded.packets, packets)
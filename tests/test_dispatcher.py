@@ -0,0 +1,233 @@
+import asyncio
+import logging
+
+from chzzkpy.client import Client
+from chzzkpy.dispatcher import EventBuffer, EventDispatcher, QueueDispatcher
+from chzzkpy.gateway import ChzzkGateway
+from chzzkpy.testing.chat_server import FakeChatServer
+from chzzkpy.testing.session_server import FakeSessionServer
+from chzzkpy.unofficial.chat import ChatClient
+from chzzkpy.unofficial.chat.access_token import AccessToken
+from chzzkpy.unofficial.chat.gateway import ChzzkWebSocket
+from chzzkpy.unofficial.chat.multi_client import MultiChatClient, _ChannelChatClient
+
+import pytest
+
+
+def test_event_buffer_holds_events_until_writable(caplog: pytest.LogCaptureFixture):
+    async def main():
+        writable = asyncio.Event()
+        handled = []
+
+        event_buffer = EventBuffer(
+            asyncio.get_running_loop(), writable.wait, max_size=3
+        )
+        event_buffer.start()
+        for index in range(5):
+            event_buffer.put(handled.append, index)
+
+        await asyncio.sleep(0.01)
+        assert handled == []
+        assert event_buffer.dropped == 2
+        assert len([x for x in caplog.records if x.levelno == logging.WARNING]) == 2
+
+        writable.set()
+        await event_buffer.join()
+        assert handled == [0, 1, 2]
+        await event_buffer.close()
+
+    asyncio.run(main())
+
+
+def test_event_buffer_awaits_coroutine_handler():
+    async def main():
+        handled = []
+
+        async def handler(value):
+            await asyncio.sleep(0)
+            handled.append(value)
+
+        async def writable():
+            return
+
+        event_buffer = EventBuffer(asyncio.get_running_loop(), writable)
+        event_buffer.start()
+        event_buffer.put(handler, "chat")
+        await event_buffer.join()
+        assert handled == ["chat"]
+        await event_buffer.close()
+
+    asyncio.run(main())
+
+
+def test_event_buffer_rejects_invalid_size():
+    async def main():
+        async def writable():
+            return
+
+        with pytest.raises(ValueError):
+            EventBuffer(asyncio.get_running_loop(), writable, max_size=0)
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("websocket", [True, False], ids=["websocket", "polling"])
+def test_gateway_keeps_heartbeat_while_saturated(websocket: bool):
+    async def main():
+        release = asyncio.Event()
+        client = Client(
+            "test", "test", dispatcher=QueueDispatcher(max_queue_size=4, concurrency=1)
+        )
+
+        @client.event
+        async def on_chat(_):
+            await release.wait()
+
+        async with FakeSessionServer(
+            rate=50, websocket=websocket, ping_interval=50, ping_timeout=200
+        ) as server:
+            await client._async_setup_hook()
+            gateway = await ChzzkGateway.connect(
+                url=server.url,
+                state=client._connection,
+                loop=client.loop,
+                session=client.connection_pool.session,
+            )
+            gateway.read_in_background(client.wait_until_dispatchable)
+            try:
+                await asyncio.sleep(0.3)
+                assert not client.dispatcher.is_writable
+
+                # The heartbeat is answered while the dispatcher is saturated.
+                await asyncio.sleep(0.5)
+                assert gateway.is_connected
+
+                # The events are dispatched for a pending `wait_for`.
+                await asyncio.wait_for(client.wait_for("chat"), timeout=2.0)
+                assert gateway.is_connected
+            finally:
+                release.set()
+                await gateway.disconnect()
+                await client.close()
+
+    asyncio.run(main())
+
+
+def test_chat_client_answers_ping_while_saturated(monkeypatch: pytest.MonkeyPatch):
+    pong_count = 0
+    send_pong = ChzzkWebSocket.send_pong
+
+    async def counting_send_pong(self):
+        nonlocal pong_count
+        pong_count += 1
+        await send_pong(self)
+
+    monkeypatch.setattr(ChzzkWebSocket, "send_pong", counting_send_pong)
+
+    async def main():
+        release = asyncio.Event()
+        async with FakeChatServer(rate=200, ping_interval=0.05) as server:
+            client = ChatClient(
+                "test",
+                chat_channel_id="test",
+                chat_url=server.url,
+                dispatcher=QueueDispatcher(max_queue_size=4, concurrency=1),
+            )
+
+            @client.event
+            async def on_chat(_):
+                await release.wait()
+
+            client.access_token = AccessToken.model_validate(
+                {
+                    "accessToken": "test",
+                    "temporaryRestrict": {"temporaryRestrict": False, "times": 0},
+                    "realNameAuth": False,
+                    "extraToken": "test",
+                }
+            )
+            await client._async_setup_hook()
+            polling = client.loop.create_task(client.polling())
+            try:
+                await asyncio.sleep(0.3)
+                assert not client.dispatcher.is_writable
+
+                answered = pong_count
+                await asyncio.sleep(0.3)
+                assert pong_count > answered
+
+                await asyncio.wait_for(client.wait_for("chat"), timeout=2.0)
+            finally:
+                release.set()
+                polling.cancel()
+                await client.close()
+
+    asyncio.run(main())
+
+
+def test_multi_chat_client_shares_dispatcher():
+    async def main():
+        dispatcher = QueueDispatcher(max_queue_size=4)
+        parent = MultiChatClient(dispatcher=dispatcher)
+        channel = _ChannelChatClient(parent, "test", chat_channel_id="test")
+        assert channel.dispatcher is dispatcher
+
+        # The dispatcher owned by the parent client is not closed by the channel.
+        dispatcher.schedule(asyncio.get_running_loop(), "on_chat", asyncio.sleep, 10)
+        await channel.close()
+        assert dispatcher.stats() != []
+        await parent.close()
+        assert dispatcher.stats() == []
+
+    asyncio.run(main())
+
+
+def test_default_dispatcher_dispatches_directly():
+    async def main():
+        assert Client("test", "test")._backpressure is None
+        assert (
+            Client("test", "test", dispatcher=QueueDispatcher())._backpressure
+            is not None
+        )
+        assert not EventDispatcher().has_backpressure
+        assert ChatClient("test", chat_channel_id="test")._backpressure is None
+
+        received = []
+        client = Client("test", "test")
+
+        @client.event
+        async def on_chat(message):
+            received.append(message)
+
+        async with FakeSessionServer(rate=0) as server:
+            await client._async_setup_hook()
+            gateway = await ChzzkGateway.connect(
+                url=server.url,
+                state=client._connection,
+                loop=client.loop,
+                session=client.connection_pool.session,
+            )
+            gateway.read_in_background(client._backpressure)
+            try:
+                await asyncio.sleep(0.1)
+                assert gateway._event_buffer is None
+
+                events = [server.generate_event() for _ in range(100)]
+                chats = [data for event, data in events if event == "CHAT"][:10]
+                assert len(chats) > 0
+                for data in chats:
+                    server.send_event("CHAT", data)
+                for _ in range(20):
+                    if len(received) == len(chats):
+                        break
+                    await asyncio.sleep(0.05)
+
+                # The events are dispatched in the received order.
+                assert [x.content for x in received] == [
+                    data["content"] for data in chats
+                ]
+            finally:
+                await gateway.disconnect()
+                await client.close()
+
+    asyncio.run(main())
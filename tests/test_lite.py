@@ -0,0 +1,22 @@
+import datetime
+
+from chzzkpy.lite import LiteMessage
+from chzzkpy.unofficial.chat.enums import ChatType
+from chzzkpy.unofficial.chat.lite import LiteChatMessage
+
+
+def test_lite_message_type():
+    assert LiteChatMessage({"msgTypeCode": 1}).type == ChatType.TEXT
+    assert LiteChatMessage({"messageTypeCode": 10}).type == ChatType.DONATION
+
+
+def test_lite_message_unknown_type():
+    # An unknown message type code is returned as it is, instead of raising ValueError.
+    assert LiteChatMessage({"msgTypeCode": 999}).type == 999
+
+
+def test_lite_message_time_with_z_suffix():
+    expected = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    message = LiteMessage({"messageTime": "2024-01-02T03:04:05Z"})
+    assert message.created_time == expected
+    assert LiteChatMessage({"msgTime": "2024-01-02T03:04:05Z"}).time == expected
@@ -0,0 +1,58 @@
+import asyncio
+
+from chzzkpy.unofficial.chat.error import ChatConnectFailed
+from chzzkpy.unofficial.chat.multi_client import MultiChatClient, _ChannelChatClient
+from chzzkpy.unofficial.chat.profile import ProfileCache
+
+import pytest
+
+
+def test_start_keeps_joined_channels_when_a_channel_fails(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def connect(self):
+        if self.channel_id == "failed":
+            raise ChatConnectFailed.chat_channel_is_null()
+        self._ready.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(_ChannelChatClient, "connect", connect)
+
+    async def main():
+        errors = []
+        client = MultiChatClient()
+
+        @client.event
+        async def on_client_error(channel, exception):
+            errors.append((channel.channel_id, exception))
+
+        task = asyncio.create_task(client.start("joined", "failed"))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        assert client.channels == ["joined"]
+        assert [channel_id for channel_id, _ in errors] == ["failed"]
+        assert isinstance(errors[0][1], ChatConnectFailed)
+
+        await client.close()
+        await task
+
+    asyncio.run(main())
+
+
+def test_channels_share_profile_cache():
+    async def main():
+        profile_cache = ProfileCache()
+        client = MultiChatClient(profile_cache=profile_cache)
+        first = _ChannelChatClient(client, "first", chat_channel_id="first")
+        second = _ChannelChatClient(client, "second", chat_channel_id="second")
+        assert first.profile_cache is profile_cache
+        assert second.profile_cache is profile_cache
+        await client.close()
+
+        # The default profile cache is created by the client and shared by the channels.
+        client = MultiChatClient()
+        channel = _ChannelChatClient(client, "test", chat_channel_id="test")
+        assert channel.profile_cache is client.profile_cache
+        await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+import asyncio
+import functools
+from types import SimpleNamespace
+
+from chzzkpy.base_model import ChannelSearchResult, SearchResult
+from chzzkpy.client import UserClient
+
+import pytest
+
+PAGE_SIZE = 3
+
+
+def page_data(index: int) -> list[int]:
+    return [index * PAGE_SIZE + x for x in range(PAGE_SIZE)]
+
+
+def cursor_result(total_pages: int, fetched: list[int], fail_at=None) -> SearchResult:
+    # A cursor-based search result. (ex. followers)
+    def next_cursor(index: int):
+        return {"next": str(index + 1) if index + 1 < total_pages else None}
+
+    async def fetch(next: str):
+        index = int(next)
+        fetched.append(index)
+        await asyncio.sleep(0)
+        if index == fail_at:
+            raise RuntimeError("failed to fetch")
+        return SimpleNamespace(
+            content=SearchResult(data=page_data(index), page=next_cursor(index))
+        )
+
+    result = SearchResult(data=page_data(0), page=next_cursor(0))
+    result._next_method = fetch
+    return result
+
+
+def numbered_result(
+    total_pages: int, fetched: list[int], fail_at=None
+) -> ChannelSearchResult:
+    # A page number based search result. (ex. channel search)
+    def build(index: int) -> ChannelSearchResult:
+        return ChannelSearchResult(
+            data=page_data(index),
+            totalCount=total_pages * PAGE_SIZE,
+            totalPages=total_pages,
+            page=index,
+        )
+
+    async def fetch(page: int):
+        fetched.append(page)
+        await asyncio.sleep(0)
+        if page == fail_at:
+            raise RuntimeError("failed to fetch")
+        return SimpleNamespace(content=build(page))
+
+    result = build(0)
+    result._next_method = fetch
+    return result
+
+
+RESULTS = [cursor_result, numbered_result]
+
+
+async def collect(iterator) -> list:
+    return [x async for x in iterator]
+
+
+@pytest.mark.parametrize("result", RESULTS)
+@pytest.mark.parametrize("prefetch", [1, 3])
+def test_pages_are_ordered(result, prefetch: int):
+    async def main():
+        pages = await collect(result(5, []).pages(prefetch=prefetch))
+        assert [page.data for page in pages] == [page_data(x) for x in range(5)]
+
+        items = await collect(result(5, []).items(prefetch=prefetch))
+        assert items == list(range(5 * PAGE_SIZE))
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("result", RESULTS)
+def test_max_pages_and_limit(result):
+    async def main():
+        fetched = []
+        pages = await collect(result(5, fetched).pages(max_pages=2))
+        assert [page.data for page in pages] == [page_data(0), page_data(1)]
+        assert fetched == [1]
+
+        items = await collect(result(5, []).items(limit=4))
+        assert items == list(range(4))
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("result", RESULTS)
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_prefetch_is_bounded(result, prefetch: int):
+    async def main():
+        fetched = []
+        pages = result(10, fetched).pages(prefetch=prefetch)
+        assert (await pages.__anext__()).data == page_data(0)
+
+        # The consumer holds the first page, so only `prefetch` pages are fetched ahead.
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert len(fetched) == prefetch
+
+        assert (await pages.__anext__()).data == page_data(1)
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert len(fetched) == prefetch + 1
+        await pages.aclose()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("result", RESULTS)
+@pytest.mark.parametrize("prefetch", [0, -1])
+def test_invalid_prefetch(result, prefetch: int):
+    async def main():
+        with pytest.raises(ValueError):
+            await collect(result(5, []).pages(prefetch=prefetch))
+        with pytest.raises(ValueError):
+            await collect(result(5, []).items(prefetch=prefetch))
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("result", RESULTS)
+def test_fetch_exception_is_raised_to_consumer(result):
+    async def main():
+        received = []
+        with pytest.raises(RuntimeError):
+            async for page in result(5, [], fail_at=2).pages(prefetch=2):
+                received.append(page.data)
+        assert received == [page_data(0), page_data(1)]
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "method, endpoint",
+    [
+        ("get_followers", "get_channel_followers"),
+        ("get_subscribers", "get_channel_subscribers"),
+    ],
+)
+def test_next_pages_use_refreshed_access_token(method: str, endpoint: str):
+    tokens = []
+
+    async def fetch(token, page=0, **_):
+        tokens.append(token)
+        return SimpleNamespace(
+            content=ChannelSearchResult(
+                data=page_data(page), totalCount=9, totalPages=3, page=page
+            )
+        )
+
+    user_client = SimpleNamespace(
+        access_token="first-token",
+        is_expired=False,
+        http=SimpleNamespace(**{endpoint: fetch}),
+    )
+    user_client._with_access_token = functools.partial(
+        UserClient._with_access_token, user_client
+    )
+
+    async def main():
+        result = await getattr(UserClient, method)(user_client)
+        pages = result.pages()
+        await pages.__anext__()
+
+        # The access token is refreshed in background while iterating pages.
+        user_client.access_token = "refreshed-token"
+        await collect(pages)
+
+    asyncio.run(main())
+    assert tokens == ["first-token", "refreshed-token", "refreshed-token"]
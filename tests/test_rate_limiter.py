@@ -0,0 +1,66 @@
+import asyncio
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from chzzkpy.http import RateLimiter
+
+
+def too_many_requests(**headers: str) -> SimpleNamespace:
+    return SimpleNamespace(status=429, headers=headers)
+
+
+def test_retry_after_seconds():
+    async def main():
+        rate_limiter = RateLimiter()
+        bucket = rate_limiter.get_bucket("GET", "/open/v1/channels", "token")
+        assert (
+            rate_limiter.update(bucket, too_many_requests(**{"Retry-After": "3"})) == 3
+        )
+
+    asyncio.run(main())
+
+
+def test_retry_after_http_date():
+    async def main():
+        rate_limiter = RateLimiter()
+        bucket = rate_limiter.get_bucket("GET", "/open/v1/channels", "token")
+        retry_after = formatdate(time.time() + 30, usegmt=True)
+        delay = rate_limiter.update(
+            bucket, too_many_requests(**{"Retry-After": retry_after})
+        )
+        assert 28 <= delay <= 30
+
+    asyncio.run(main())
+
+
+def test_invalid_retry_after_falls_back_to_backoff():
+    async def main():
+        rate_limiter = RateLimiter(backoff=2.0)
+        bucket = rate_limiter.get_bucket("GET", "/open/v1/channels", "token")
+        delay = rate_limiter.update(
+            bucket, too_many_requests(**{"Retry-After": "invalid"})
+        )
+        assert 2.0 <= delay <= 3.0
+
+    asyncio.run(main())
+
+
+def test_idle_buckets_are_evicted():
+    async def main():
+        loop = asyncio.get_running_loop()
+        rate_limiter = RateLimiter(idle_timeout=10.0)
+        for index in range(5):
+            rate_limiter.get_bucket("GET", "/open/v1/channels", f"token-{index}")
+        limited = rate_limiter.get_bucket("GET", "/open/v1/channels", "limited")
+        rate_limiter.update(limited, too_many_requests(**{"Retry-After": "60"}))
+
+        in_use = rate_limiter.get_bucket("GET", "/open/v1/channels", "in-use")
+        async with rate_limiter.acquire(in_use):
+            assert rate_limiter.evict_idle_buckets(loop.time() + 20.0) == 5
+        assert rate_limiter.bucket_count == 2
+
+        assert rate_limiter.evict_idle_buckets(loop.time() + 70.0) == 2
+        assert rate_limiter.bucket_count == 0
+
+    asyncio.run(main())
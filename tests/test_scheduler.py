@@ -0,0 +1,165 @@
+import asyncio
+from types import SimpleNamespace
+
+from chzzkpy.scheduler import DelayScheduler
+from chzzkpy.unofficial.chat.live_poller import LiveStatusPoller
+
+
+def test_scheduler_calls_keys_in_due_order():
+    async def main():
+        called = []
+
+        async def callback(key, _):
+            called.append(key)
+
+        scheduler = DelayScheduler(callback)
+        scheduler.schedule("late", 0.05)
+        scheduler.schedule("early", 0.01)
+        scheduler.start()
+        await asyncio.sleep(0.1)
+        await scheduler.close()
+        assert called == ["early", "late"]
+
+    asyncio.run(main())
+
+
+def test_scheduler_ignores_removed_and_replaced_entries():
+    async def main():
+        called = []
+
+        async def callback(key, generation):
+            called.append((key, generation))
+
+        scheduler = DelayScheduler(callback)
+        scheduler.schedule("removed", 0.01)
+        scheduler.remove("removed")
+        scheduler.schedule("replaced", 0.01)
+        generation = scheduler.schedule("replaced", 0.02)
+        scheduler.start()
+        await asyncio.sleep(0.1)
+        await scheduler.close()
+        assert called == [("replaced", generation)]
+        assert "removed" not in scheduler
+
+    asyncio.run(main())
+
+
+def test_scheduler_reschedules_current_generation_only():
+    async def main():
+        called = []
+
+        async def callback(key, generation):
+            called.append(key)
+            if len(called) < 3:
+                assert scheduler.reschedule(key, generation, 0.01)
+
+        scheduler = DelayScheduler(callback)
+        generation = scheduler.schedule("key", 0)
+        scheduler.start()
+        await asyncio.sleep(0.1)
+        assert called == ["key"] * 3
+
+        scheduler.schedule("key", 1.0)
+        assert not scheduler.reschedule("key", generation, 0)
+        await scheduler.close()
+
+    asyncio.run(main())
+
+
+def test_scheduler_limits_concurrency():
+    async def main():
+        running = 0
+        max_running = 0
+
+        async def callback(*_):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = DelayScheduler(callback, max_concurrency=2)
+        for index in range(6):
+            scheduler.schedule(index, 0)
+        scheduler.start()
+        await asyncio.sleep(0.1)
+        await scheduler.close()
+        assert max_running == 2
+
+    asyncio.run(main())
+
+
+def test_live_status_poller_dispatches_status_change():
+    async def main():
+        dispatched = []
+        statuses = iter(["OPEN", "OPEN", "CLOSE"])
+
+        async def live_status(channel_id):
+            return SimpleNamespace(
+                status=next(statuses, "CLOSE"),
+                chat_channel_id="chat_channel_id",
+                chat_slow_mode_sec=0,
+                live_polling_status=SimpleNamespace(call_period_millisecond=10),
+            )
+
+        poller = LiveStatusPoller(
+            SimpleNamespace(live_status=live_status),
+            dispatch=lambda *args: dispatched.append(args),
+            min_interval=0.01,
+            jitter=0,
+        )
+        poller.add_channel("channel_id", chat_channel_id="chat_channel_id", slow_mode=0)
+        poller.start()
+        await asyncio.sleep(0.1)
+        await poller.close()
+        assert dispatched == [
+            ("broadcast_open", "channel_id"),
+            ("broadcast_close", "channel_id"),
+        ]
+
+    asyncio.run(main())
+
+
+def test_scheduler_skips_key_removed_while_waiting_for_slot():
+    async def main():
+        called = []
+        release = asyncio.Event()
+
+        async def callback(key, _):
+            called.append(key)
+            if key == "blocking":
+                await release.wait()
+
+        scheduler = DelayScheduler(callback, max_concurrency=1)
+        scheduler.schedule("blocking", 0)
+        scheduler.schedule("removed", 0.01)
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        scheduler.remove("removed")
+        release.set()
+        await asyncio.sleep(0.05)
+        await scheduler.close()
+        assert called == ["blocking"]
+
+    asyncio.run(main())
+
+
+def test_live_status_poller_ignores_removed_channel():
+    async def main():
+        called = []
+
+        async def live_status(channel_id):
+            called.append(channel_id)
+
+        poller = LiveStatusPoller(
+            SimpleNamespace(live_status=live_status),
+            dispatch=lambda *_: None,
+            min_interval=0.01,
+            jitter=0,
+        )
+        poller.add_channel("channel_id", status="OPEN")
+        poller.remove_channel("channel_id")
+        await poller._poll("channel_id", 0)
+        assert called == []
+
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+import asyncio
+
+from chzzkpy.error import TooManyRequestsException
+from chzzkpy.send_queue import SendQueue
+
+import pytest
+
+
+def test_cancelled_send_while_rate_limited():
+    async def main():
+        sent = []
+        futures = {}
+
+        async def send(content):
+            sent.append(content)
+            if content != "limited":
+                return content
+            if sent.count("limited") > 1:
+                # The caller gives up (ex. `asyncio.wait_for` timed out) during the last retry.
+                futures["limited"].cancel()
+            raise TooManyRequestsException()
+
+        send_queue = SendQueue(send, min_interval=0.01, max_retries=1)
+        futures["limited"] = send_queue.send("limited")
+        futures["next"] = send_queue.send("next")
+
+        assert await asyncio.wait_for(futures["next"], timeout=1.0) == "next"
+        assert futures["limited"].cancelled()
+        assert sent == ["limited", "limited", "next"]
+        await send_queue.close()
+
+    asyncio.run(main())
+
+
+def test_rate_limited_send_raises_after_retries():
+    async def main():
+        async def send(_):
+            raise TooManyRequestsException()
+
+        send_queue = SendQueue(send, min_interval=0.01, max_retries=1)
+        with pytest.raises(TooManyRequestsException):
+            await asyncio.wait_for(send_queue.send("limited"), timeout=1.0)
+        await send_queue.close()
+
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+import asyncio
+import queue
+
+from chzzkpy.authorization import AccessToken
+from chzzkpy.flags import UserPermission
+from chzzkpy.sharding import ShardManager, _Shard
+
+
+class FakeProcess:
+    def __init__(self, alive: bool = True):
+        self.alive = alive
+        self.pid = None
+        self.exitcode = None if alive else 1
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+
+def access_token(index: int) -> AccessToken:
+    return AccessToken.model_validate(
+        {
+            "accessToken": f"access-{index}",
+            "refreshToken": f"refresh-{index}",
+            "expiresIn": 86400,
+        }
+    )
+
+
+def add_shard(manager: ShardManager, shard_id: int, alive: bool = True) -> FakeProcess:
+    process = manager._processes[shard_id] = FakeProcess(alive)
+    manager._commands[shard_id] = queue.Queue()
+    manager._assignment[shard_id] = set()
+    return process
+
+
+def test_user_clients_are_pending_without_alive_shard():
+    manager = ShardManager("client_id", "client_secret", shard_count=2)
+    add_shard(manager, 0, alive=False)
+    manager._closed = False
+    for index in range(3):
+        manager.add_user(access_token(index))
+    assert manager.pending_user_clients == 3
+
+    add_shard(manager, 1)
+    manager._assign([])
+    assert manager.pending_user_clients == 0
+    assert manager._assignment[1] == {1, 2, 3}
+    assert len(manager._commands[1].get_nowait()) == 3
+
+
+def test_monitor_assigns_keys_of_dead_shard_when_shard_becomes_alive():
+    async def main():
+        manager = ShardManager(
+            "client_id", "client_secret", respawn=False, monitor_interval=0.01
+        )
+        manager.loop = asyncio.get_running_loop()
+        process = add_shard(manager, 0)
+        manager._closed = False
+        for index in range(2):
+            manager.add_user(access_token(index))
+
+        died = []
+
+        @manager.event
+        async def on_shard_died(shard_id):
+            died.append(shard_id)
+
+        monitor = asyncio.create_task(manager._monitor())
+        process.alive = False
+        await asyncio.sleep(0.05)
+        assert died == [0]
+        assert manager.pending_user_clients == 2
+
+        add_shard(manager, 1)
+        await asyncio.sleep(0.05)
+        monitor.cancel()
+        assert manager.pending_user_clients == 0
+        assert manager._assignment[1] == {1, 2}
+
+    asyncio.run(main())
+
+
+def test_shard_awaits_coroutine_setup():
+    called = []
+
+    async def setup(client):
+        await asyncio.sleep(0)
+        called.append(client)
+
+    shard = _Shard(
+        0,
+        "client_id",
+        "client_secret",
+        UserPermission.all(),
+        queue.Queue(),
+        queue.Queue(),
+        setup,
+        (),
+    )
+    shard.client = object()
+    asyncio.run(shard._setup())
+    assert called == [shard.client]
@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+
+from chzzkpy.client import UserClient
+from chzzkpy.error import ForbiddenException
+from chzzkpy.send_queue import SendQueue
+from chzzkpy.unofficial.chat import ChatClient
+from chzzkpy.unofficial.chat.live_poller import LiveStatusPoller
+
+
+def test_live_status_poller_dispatches_slow_mode_update():
+    async def main():
+        dispatched = []
+        slow_modes = iter([0, 5, 5, 30])
+
+        async def live_status(channel_id):
+            return SimpleNamespace(
+                status="OPEN",
+                chat_channel_id="chat_channel_id",
+                chat_slow_mode_sec=next(slow_modes, 30),
+                live_polling_status=SimpleNamespace(call_period_millisecond=10),
+            )
+
+        poller = LiveStatusPoller(
+            SimpleNamespace(live_status=live_status),
+            dispatch=lambda *args: dispatched.append(args),
+            default_interval=0.01,
+            min_interval=0.01,
+            jitter=0,
+        )
+        poller.add_channel(
+            "channel_id", status="OPEN", chat_channel_id="chat_channel_id"
+        )
+        poller.start()
+        await asyncio.sleep(0.1)
+        await poller.close()
+        assert dispatched == [
+            ("chat_slow_mode_update", "channel_id", None, 0),
+            ("chat_slow_mode_update", "channel_id", 0, 5),
+            ("chat_slow_mode_update", "channel_id", 5, 30),
+        ]
+
+    asyncio.run(main())
+
+
+def test_chat_client_follows_slow_mode_update():
+    async def main():
+        client = ChatClient("channel_id", chat_channel_id="chat_channel_id")
+        client.loop = asyncio.get_running_loop()
+        dispatched = []
+
+        @client.event
+        async def on_chat_slow_mode_update(before, after):
+            dispatched.append((before, after))
+
+        client._dispatch_live_status("chat_slow_mode_update", "channel_id", None, 10)
+        assert client.send_queue.slow_mode == 10
+        assert client.send_queue.interval == 10
+        await asyncio.sleep(0)
+        assert dispatched == [(None, 10)]
+
+    asyncio.run(main())
+
+
+def user_client(get_chat_setting) -> SimpleNamespace:
+    async def send(_):
+        return
+
+    client = SimpleNamespace(channel_id="channel_id", send_queue=SendQueue(send))
+    client.get_chat_setting = get_chat_setting
+    return client
+
+
+def test_user_client_loads_slow_mode():
+    client = None
+
+    async def get_chat_setting():
+        client.send_queue.slow_mode = 30
+
+    client = user_client(get_chat_setting)
+    asyncio.run(UserClient._load_slow_mode(client))
+    assert client.send_queue.slow_mode == 30
+
+
+def test_user_client_keeps_slow_mode_without_permission():
+    async def get_chat_setting():
+        raise ForbiddenException("The scope is not granted.")
+
+    client = user_client(get_chat_setting)
+    asyncio.run(UserClient._load_slow_mode(client))
+    assert client.send_queue.slow_mode == 0
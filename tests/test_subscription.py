@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import aiohttp
+
+from chzzkpy.client import Client, UserClient
+from chzzkpy.error import (
+    BadRequestException,
+    HTTPException,
+    TooManyRequestsException,
+    UnauthorizedException,
+)
+from chzzkpy.http import RateLimiter
+
+import pytest
+
+
+def subscription_request(*exceptions: BaseException) -> int:
+    calls = 0
+
+    async def method(**_):
+        nonlocal calls
+        calls += 1
+        if calls <= len(exceptions):
+            raise exceptions[calls - 1]
+
+    client = SimpleNamespace(
+        parent_client=SimpleNamespace(
+            rate_limiter=RateLimiter(max_retries=3, backoff=0.0)
+        ),
+        access_token=None,
+    )
+    asyncio.run(UserClient._subscription_request(client, method, "chat", "session"))
+    return calls
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        TooManyRequestsException(),
+        HTTPException(code=500, message="Internal Server Error", status=500),
+        HTTPException(code=503),
+        aiohttp.ClientConnectionError(),
+        asyncio.TimeoutError(),
+    ],
+    ids=lambda x: type(x).__name__,
+)
+def test_subscription_retries_transient_error(exception: BaseException):
+    assert subscription_request(exception, exception) == 3
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        HTTPException(code=409, message="Conflict", status=409),
+        HTTPException(code=500, message="Invalid session key", status=404),
+        BadRequestException("Invalid session key"),
+        UnauthorizedException("Invalid token"),
+    ],
+    ids=lambda x: type(x).__name__,
+)
+def test_subscription_does_not_retry_client_error(exception: BaseException):
+    with pytest.raises(type(exception)):
+        subscription_request(exception)
+
+
+def test_subscription_gives_up_after_max_retries():
+    exception = HTTPException(code=502)
+    with pytest.raises(HTTPException):
+        subscription_request(*[exception] * 4)
+
+
+def test_disconnect_resumed_session_with_original_session_id():
+    disconnected = []
+
+    def gateway(session_id: str) -> SimpleNamespace:
+        async def disconnect():
+            disconnected.append(session_id)
+
+        return SimpleNamespace(
+            session_id=session_id, session_key="session_key", disconnect=disconnect
+        )
+
+    async def main():
+        client = Client("client_id", "client_secret")
+        previous = client._gateway["previous"] = gateway("previous")
+        await client._resume_gateway(previous, gateway("resumed"), 1.0)
+        assert list(client._gateway) == ["previous"]
+
+        await client.disconnect("previous")
+        assert disconnected == ["resumed"]
+        assert client._gateway == {}
+
+    asyncio.run(main())